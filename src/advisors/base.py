@@ -1,10 +1,11 @@
 """Base advisor class - uses dynamic profiles for personality."""
 
 from __future__ import annotations
+from itertools import groupby
 from typing import Any, TYPE_CHECKING
 
 if TYPE_CHECKING:
-    from src.llm.openrouter import OpenRouterClient
+    from src.llm.openrouter import OpenRouterClient, ToolCall
     from src.tools.registry import ToolRegistry
     from src.tools.handlers import ToolHandlers
     from src.tools.state_tools import StateToolHandlers
@@ -226,44 +227,38 @@ Note: If the player mentions a location similar to but not exactly matching a kn
         tool_results = []
         follow_up_needed = False
         
-        if response.has_tool_calls:
-            for tool_call in response.tool_calls:
-                result = self._execute_tool(tool_call.name, tool_call.arguments)
-                tool_results.append({
-                    "tool": tool_call.name,
-                    "arguments": tool_call.arguments,
-                    "result": result,
-                })
-                
+        try:
+            if response.has_tool_calls:
+                self._run_tool_calls(response.tool_calls, tool_results)
+            
                 # Check if survey failed - advisor should propose a claim
-                if tool_call.name == "survey_area" and not result.get("found", True):
-                    follow_up_needed = True
+                follow_up_needed = any(
+                    r["tool"] == "survey_area" and not r["result"].get("found", True)
+                    for r in tool_results
+                )
         
-        # If survey failed, prompt for follow-up with claim proposal
-        if follow_up_needed and response.content:
-            follow_up_messages = messages + [
-                {"role": "assistant", "content": response.content},
-                {"role": "user", "content": "The survey found areas not in our records. As you would in character, propose what you believe exists there based on common knowledge, rumors, or reasonable assumption."}
-            ]
+            # If survey failed, prompt for follow-up with claim proposal
+            if follow_up_needed and response.content:
+                follow_up_messages = messages + [
+                    {"role": "assistant", "content": response.content},
+                    {"role": "user", "content": "The survey found areas not in our records. As you would in character, propose what you believe exists there based on common knowledge, rumors, or reasonable assumption."}
+                ]
             
-            follow_up_response = self.llm.chat(
-                messages=follow_up_messages,
-                tier=ModelTier.ADVISOR,
-                tools=tools if tools else None,
-                temperature=0.7,
-            )
+                follow_up_response = self.llm.chat(
+                    messages=follow_up_messages,
+                    tier=ModelTier.ADVISOR,
+                    tools=tools if tools else None,
+                    temperature=0.7,
+                )
             
-            if follow_up_response.has_tool_calls:
-                for tool_call in follow_up_response.tool_calls:
-                    result = self._execute_tool(tool_call.name, tool_call.arguments)
-                    tool_results.append({
-                        "tool": tool_call.name,
-                        "arguments": tool_call.arguments,
-                        "result": result,
-                    })
+                if follow_up_response.has_tool_calls:
+                    self._run_tool_calls(follow_up_response.tool_calls, tool_results)
             
-            if follow_up_response.content:
-                response.content = (response.content or "") + "\n\n" + follow_up_response.content
+                if follow_up_response.content:
+                    response.content = (response.content or "") + "\n\n" + follow_up_response.content
+        finally:
+            # Events logged by this turn's tool calls are written even if it fails
+            self.handlers.flush_events()
         
         # Build response
         result = {
@@ -282,6 +277,34 @@ Note: If the player mentions a location similar to but not exactly matching a kn
         
         return result
     
+    def _run_tool_calls(self, tool_calls: list["ToolCall"], tool_results: list[dict[str, Any]]) -> None:
+        """Execute tool calls in order, appending their results to tool_results.
+        
+        A run of consecutive extend_state calls goes through
+        StateToolHandlers.extend_state_many so their validations overlap.
+        """
+        for is_extend, group in groupby(tool_calls, key=lambda tc: tc.name == "extend_state"):
+            group = list(group)
+            if is_extend and self.state_tools and len(group) > 1:
+                results = self._extend_state_batch([tc.arguments for tc in group])
+            else:
+                results = [self._execute_tool(tc.name, tc.arguments) for tc in group]
+            tool_results.extend(
+                {"tool": tc.name, "arguments": tc.arguments, "result": result}
+                for tc, result in zip(group, results)
+            )
+    
+    def _extend_state_batch(self, arguments: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Run several extend_state calls as one batch."""
+        for args in arguments:
+            args["proposed_by"] = self.role
+        try:
+            return self.state_tools.extend_state_many(arguments, proposed_by=self.role)
+        except Exception as e:
+            # Item failures come back in their own slots; this only catches
+            # the batch validation itself failing, before anything is applied
+            return [{"error": str(e)} for _ in arguments]
+    
     def _execute_tool(self, tool_name: str, arguments: dict[str, Any]) -> dict[str, Any]:
         """Execute a tool call."""
         arguments["proposed_by"] = self.role
@@ -2,13 +2,13 @@
 
 from __future__ import annotations
 import os
-import json
 from enum import Enum
-from typing import Any, Optional, AsyncIterator
+from typing import Any, Iterable, Iterator, Optional
 from dataclasses import dataclass
 
 import httpx
 from dotenv import load_dotenv
+from pydantic_core import from_json
 
 load_dotenv()
 
@@ -41,6 +41,85 @@ class LLMResponse:
         return len(self.tool_calls) > 0
 
 
+def extract_json_object(content: Optional[str]) -> Optional[Any]:
+    """Parse JSON from model output, or None if there is none.
+    
+    Tries the whole content first (the usual case with JSON mode) and only
+    falls back to the span from the first '{' to the last '}' when the
+    model wrapped its answer in prose or code fences.
+    """
+    if not content:
+        return None
+    try:
+        return from_json(content)
+    except ValueError:
+        pass
+    start = content.find("{")
+    end = content.rfind("}")
+    if start != -1 and end > start:
+        try:
+            return from_json(content[start:end + 1])
+        except ValueError:
+            pass
+    return None
+
+
+def stream_json_object(chunks: Iterable[str]) -> Optional[Any]:
+    """Parse the first JSON object from a token stream, stopping once it closes.
+    
+    Tracks brace depth (ignoring braces inside strings) so the stream is
+    abandoned as soon as the outermost object is complete instead of
+    waiting for trailing tokens.
+    """
+    parts: list[str] = []
+    depth = 0
+    started = False
+    in_string = False
+    escaped = False
+    try:
+        for chunk in chunks:
+            parts.append(chunk)
+            for ch in chunk:
+                if in_string:
+                    if escaped:
+                        escaped = False
+                    elif ch == "\\":
+                        escaped = True
+                    elif ch == '"':
+                        in_string = False
+                elif ch == '"':
+                    in_string = started
+                elif ch == "{":
+                    depth += 1
+                    started = True
+                elif ch == "}" and started:
+                    depth -= 1
+                    if depth == 0:
+                        return extract_json_object("".join(parts))
+    finally:
+        close = getattr(chunks, "close", None)
+        if close is not None:
+            close()
+    return extract_json_object("".join(parts))
+
+
+def cached_prompt(stable: str, dynamic: str, context: Optional[str] = None) -> list[dict[str, Any]]:
+    """Build messages with a cacheable system prefix and a per-call user suffix.
+    
+    The stable text (and optional context, e.g. a world snapshot that only
+    changes between turns) is sent as content blocks marked with
+    cache_control so providers that support prompt caching (Anthropic via
+    OpenRouter) can reuse them across calls; others ignore the marker.
+    """
+    blocks = [{"type": "text", "text": stable, "cache_control": {"type": "ephemeral"}}]
+    if context:
+        blocks.append({"type": "text", "text": context, "cache_control": {"type": "ephemeral"}})
+    return [
+        {"role": "system", "content": blocks},
+        {"role": "user", "content": dynamic},
+    ]
+
+
 class OpenRouterClient:
     """Client for OpenRouter API with function calling support."""
     
@@ -102,8 +181,8 @@ class OpenRouterClient:
         if "tool_calls" in message and message["tool_calls"]:
             for tc in message["tool_calls"]:
                 try:
-                    args = json.loads(tc["function"]["arguments"])
-                except json.JSONDecodeError:
+                    args = from_json(tc["function"]["arguments"])
+                except ValueError:
                     args = {}
                 tool_calls.append(ToolCall(
                     id=tc.get("id", ""),
@@ -127,8 +206,13 @@ class OpenRouterClient:
         tool_choice: Optional[str] = None,
         temperature: float = 0.7,
         max_tokens: int = 2048,
+        response_format: Optional[dict[str, Any]] = None,
     ) -> LLMResponse:
-        """Send a chat completion request."""
+        """Send a chat completion request.
+        
+        Pass response_format={"type": "json_object"} to request JSON mode
+        from models that support it.
+        """
         model = self._get_model(tier)
         
         payload: dict[str, Any] = {
@@ -143,6 +227,9 @@ class OpenRouterClient:
             if tool_choice:
                 payload["tool_choice"] = tool_choice
         
+        if response_format:
+            payload["response_format"] = response_format
+        
         response = self._client.post("/chat/completions", json=payload)
         response.raise_for_status()
         
@@ -156,6 +243,7 @@ class OpenRouterClient:
         tool_choice: Optional[str] = None,
         temperature: float = 0.7,
         max_tokens: int = 2048,
+        response_format: Optional[dict[str, Any]] = None,
     ) -> LLMResponse:
         """Send an async chat completion request."""
         client = self._get_async_client()
@@ -173,6 +261,9 @@ class OpenRouterClient:
             if tool_choice:
                 payload["tool_choice"] = tool_choice
         
+        if response_format:
+            payload["response_format"] = response_format
+        
         response = await client.post("/chat/completions", json=payload)
         response.raise_for_status()
         
@@ -210,15 +301,10 @@ class OpenRouterClient:
         data = response.json()
         content = data["choices"][0]["message"]["content"]
         
-        try:
-            return json.loads(content)
-        except json.JSONDecodeError:
-            # Fallback: try to extract JSON from the content
-            import re
-            json_match = re.search(r'\{.*\}', content, re.DOTALL)
-            if json_match:
-                return json.loads(json_match.group())
+        parsed = extract_json_object(content)
+        if parsed is None:
             raise ValueError(f"Failed to parse JSON from response: {content}")
+        return parsed
     
     def chat_stream(
         self,
@@ -226,13 +312,15 @@ class OpenRouterClient:
         tier: ModelTier = ModelTier.ADVISOR,
         temperature: float = 0.7,
         max_tokens: int = 2048,
-    ) -> AsyncIterator[str]:
-        """Stream a chat completion (returns async iterator of content chunks)."""
-        # Note: This is a sync generator that yields chunks
-        # For true async streaming, use chat_stream_async
+        response_format: Optional[dict[str, Any]] = None,
+    ) -> Iterator[str]:
+        """Stream a chat completion, yielding content chunks as they arrive.
+        
+        This is a sync generator; closing it early closes the HTTP stream.
+        """
         model = self._get_model(tier)
         
-        payload = {
+        payload: dict[str, Any] = {
             "model": model,
             "messages": messages,
             "temperature": temperature,
@@ -240,6 +328,9 @@ class OpenRouterClient:
             "stream": True,
         }
         
+        if response_format:
+            payload["response_format"] = response_format
+        
         with self._client.stream("POST", "/chat/completions", json=payload) as response:
             response.raise_for_status()
             for line in response.iter_lines():
@@ -248,11 +339,11 @@ class OpenRouterClient:
                     if data == "[DONE]":
                         break
                     try:
-                        chunk = json.loads(data)
+                        chunk = from_json(data)
                         delta = chunk["choices"][0].get("delta", {})
                         if "content" in delta and delta["content"]:
                             yield delta["content"]
-                    except json.JSONDecodeError:
+                    except ValueError:
                         continue
     
     def close(self) -> None:
@@ -40,8 +40,8 @@ class ClaimType(str, Enum):
 
 class ClaimEvidence(BaseModel):
     """Evidence supporting a claim."""
-    type: str  # "observation", "report", "survey", "historical", "logical"
-    description: str
+    type: str = "observation"  # "observation", "report", "survey", "historical", "logical"
+    description: str = ""
     confidence: int = Field(default=50, ge=0, le=100)
     source: Optional[str] = None  # Who/what provided this evidence
 
@@ -49,6 +49,7 @@ class ClaimEvidence(BaseModel):
 class Claim(BaseModel):
     """A proposed fact about the world that needs validation."""
     id: str = Field(default_factory=lambda: str(uuid.uuid4())[:8])
+    simple_id: Optional[str] = None  # Sequential ID ("1", "2", ...) assigned by ClaimSystem
     
     # What is being claimed
     claim_type: ClaimType
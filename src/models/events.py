@@ -43,6 +43,7 @@ class EventType(str, Enum):
     POPULATION_CHANGE = "population_change"
     FACTION_CHANGE = "faction_change"
     INFRASTRUCTURE_CHANGE = "infrastructure_change"
+    WORLD_STATE_CHANGE = "world_state_change"
     
     # Narrative events
     INCIDENT = "incident"
@@ -129,7 +130,9 @@ class EventLog(BaseModel):
     
     def get_recent(self, count: int = 10) -> list[Event]:
         """Get most recent events."""
-        return self.events[-count:] if self.events else []
+        if count <= 0:
+            return []
+        return self.events[-count:]
     
     def get_by_tick(self, tick: int) -> list[Event]:
         """Get all events from a specific tick."""
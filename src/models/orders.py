@@ -3,11 +3,23 @@
 from __future__ import annotations
 from datetime import datetime
 from enum import Enum
+from functools import lru_cache
 from typing import Optional, Any
 from pydantic import BaseModel, Field
 import uuid
 
 
+# Display widths for the truncated forms shown in the order panel
+_SHORT_DESCRIPTION_LEN = 25
+_SHORT_OUTCOME_LEN = 30
+
+
+@lru_cache(maxsize=512)
+def _shorten(text: str, limit: int) -> str:
+    """Truncate text to limit characters, marking the cut with '...'."""
+    return text[:limit] + "..." if len(text) > limit else text
+
+
 class OrderStatus(str, Enum):
     """Status of an order."""
     IN_PROGRESS = "in_progress"
@@ -71,6 +83,16 @@ class Order(BaseModel):
         """Whether the order has finished (success or failure)."""
         return self.status in (OrderStatus.COMPLETED, OrderStatus.FAILED, OrderStatus.CANCELLED)
     
+    @property
+    def short_description(self) -> str:
+        """Description truncated for compact display."""
+        return _shorten(self.description, _SHORT_DESCRIPTION_LEN)
+    
+    @property
+    def short_outcome(self) -> Optional[str]:
+        """Outcome truncated for compact display, or None if not set."""
+        return _shorten(self.outcome, _SHORT_OUTCOME_LEN) if self.outcome else self.outcome
+    
     def advance(self, days: int = 1) -> bool:
         """Advance progress by days. Returns True if order just completed."""
         if self.is_complete:
@@ -1,13 +1,19 @@
 """State change schemas - for proposing and validating world state mutations."""
 
 from __future__ import annotations
+from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
 from typing import Any, Optional
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
+import json
 import uuid
 
 
+# Encoder for prompt-facing JSON of change values
+_VALUE_ENC = json.JSONEncoder(default=str).encode
+
+
 class ChangeType(str, Enum):
     """Types of state changes."""
     SET_EXTENSION = "set_extension"      # Set/update an extension path
@@ -54,6 +60,24 @@ class SemanticValidation(BaseModel):
     reasoning: str = Field(default="", description="Explanation of validation decision")
 
 
+@dataclass(slots=True)
+class ChangeMetadata:
+    """Provenance attached to an extension value when a change is applied."""
+    change_id: str
+    proposed_by: str
+    reason: str
+    applied_at: str  # ISO timestamp
+    
+    def as_dict(self) -> dict[str, str]:
+        """Plain dict form, as stored under the value's "_meta" key."""
+        return {
+            "change_id": self.change_id,
+            "proposed_by": self.proposed_by,
+            "reason": self.reason,
+            "applied_at": self.applied_at,
+        }
+
+
 class StateChange(BaseModel):
     """A proposed mutation to the world state."""
     id: str = Field(default_factory=lambda: str(uuid.uuid4())[:8])
@@ -84,6 +108,27 @@ class StateChange(BaseModel):
     
     model_config = {"extra": "allow"}
     
+    # field name -> (value object, its JSON), reused while the field still
+    # holds the same object
+    _json_cache: dict[str, tuple[Any, str]] = PrivateAttr(default_factory=dict)
+    
+    def _value_json(self, field: str) -> str:
+        value = getattr(self, field)
+        cached = self._json_cache.get(field)
+        if cached is None or cached[0] is not value:
+            cached = self._json_cache[field] = (value, _VALUE_ENC(value))
+        return cached[1]
+    
+    @property
+    def new_value_json(self) -> str:
+        """new_value as JSON; recomputed when new_value is reassigned (not mutated in place)."""
+        return self._value_json("new_value")
+    
+    @property
+    def old_value_json(self) -> str:
+        """old_value as JSON; recomputed when old_value is reassigned (not mutated in place)."""
+        return self._value_json("old_value")
+    
     def add_issue(self, stage: str, severity: str, code: str, message: str, 
                   path: Optional[str] = None, suggestion: Optional[str] = None):
         """Add a validation issue."""
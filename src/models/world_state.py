@@ -3,10 +3,52 @@
 from __future__ import annotations
 from datetime import datetime
 from enum import Enum
-from typing import Optional, Any
-from pydantic import BaseModel, Field
+from functools import lru_cache
+from typing import TYPE_CHECKING, Iterator, Optional, Any
+from pydantic import BaseModel, Field, PrivateAttr
 import uuid
 
+if TYPE_CHECKING:
+    from src.models.state_change import ChangeMetadata
+
+
+@lru_cache(maxsize=1024)
+def _split_path(path: str) -> tuple[str, ...]:
+    """Split a dot-notation extension path into its segments (cached)."""
+    return tuple(path.split("."))
+
+
+def _walk_extensions(obj: dict, stack: list[str]) -> Iterator[tuple[tuple[str, ...], Any]]:
+    """Yield (key tuple, value) for every leaf in an extensions tree.
+    
+    A leaf is a non-dict value, a "_"-prefixed key, or a dict carrying
+    "_value"/"_meta". Keys are pushed onto a shared stack so no path
+    strings are built while walking.
+    """
+    for key, value in obj.items():
+        stack.append(key)
+        if (
+            isinstance(value, dict)
+            and not key.startswith("_")
+            and "_value" not in value
+            and "_meta" not in value
+        ):
+            yield from _walk_extensions(value, stack)
+        else:
+            yield tuple(stack), value
+        stack.pop()
+
+
+def _matches_prefix(parts: tuple[str, ...], prefix_parts: tuple[str, ...]) -> bool:
+    """Segment-wise equivalent of ".".join(parts).startswith(".".join(prefix_parts))."""
+    last = len(prefix_parts) - 1
+    if len(parts) <= last:
+        return False
+    for i in range(last):
+        if parts[i] != prefix_parts[i]:
+            return False
+    return parts[last].startswith(prefix_parts[last])
+
 
 class SettlementType(str, Enum):
     """Types of settlements in the world."""
@@ -90,6 +132,22 @@ class Resources(BaseModel):
             return False
         setattr(self, resource, new_value)
         return True
+    
+    def shortfalls(self, deltas: dict[str, int]) -> list[str]:
+        """Names of resources that the given deltas would take below zero."""
+        return [
+            resource for resource, amount in deltas.items()
+            if getattr(self, resource, None) is None or getattr(self, resource) + amount < 0
+        ]
+    
+    def can_afford(self, deltas: dict[str, int]) -> bool:
+        """Check whether every delta can be applied without going negative."""
+        return not self.shortfalls(deltas)
+    
+    def apply_deltas(self, deltas: dict[str, int]) -> None:
+        """Apply several adjustments at once; check can_afford() first."""
+        for resource, amount in deltas.items():
+            setattr(self, resource, getattr(self, resource) + amount)
 
 
 class Population(BaseModel):
@@ -205,26 +263,91 @@ class WorldState(BaseModel):
     # Allow scenario-specific extensions
     model_config = {"extra": "allow"}
     
+    # In-memory change counter for derived caches (not persisted)
+    _state_version: int = PrivateAttr(default=0)
+    # Per entity list: ((version, list id, length), id -> index, lowercased name -> index)
+    _entity_index: dict[str, tuple[tuple[int, int, int], dict[str, int], dict[str, int]]] = PrivateAttr(
+        default_factory=dict
+    )
+    
+    @property
+    def state_version(self) -> int:
+        """Counter bumped by touch() whenever the state is mutated."""
+        return self._state_version
+    
+    def touch(self) -> int:
+        """Mark the state as changed so cached views of it are rebuilt."""
+        self._state_version += 1
+        return self._state_version
+    
+    # ===== Core Entity Lookups =====
+    
+    def _lookup(self, field: str, id_or_name: str) -> Optional[Any]:
+        """Find the first entity in a list field matching by ID or (case-insensitive) name.
+        
+        The ID and name indexes are rebuilt when the state is touched or the
+        list is replaced or resized; add entities through add_settlement()
+        and friends (or call touch() after renaming one).
+        """
+        items = getattr(self, field)
+        key = (self._state_version, id(items), len(items))
+        entry = self._entity_index.get(field)
+        if entry is None or entry[0] != key:
+            by_id: dict[str, int] = {}
+            by_name: dict[str, int] = {}
+            for i, x in enumerate(items):
+                by_id.setdefault(x.id, i)
+                by_name.setdefault(x.name.lower(), i)
+            entry = (key, by_id, by_name)
+            self._entity_index[field] = entry
+        
+        # Earliest entity matching either way, as a linear scan would find
+        by_id_pos = entry[1].get(id_or_name)
+        by_name_pos = entry[2].get(id_or_name.lower())
+        if by_id_pos is None:
+            pos = by_name_pos
+        elif by_name_pos is None:
+            pos = by_id_pos
+        else:
+            pos = min(by_id_pos, by_name_pos)
+        return None if pos is None else items[pos]
+    
+    def add_settlement(self, settlement: Settlement) -> Settlement:
+        """Add a settlement to the world."""
+        self.settlements.append(settlement)
+        self.touch()
+        return settlement
+    
+    def add_terrain(self, terrain: Terrain) -> Terrain:
+        """Add a terrain feature to the world."""
+        self.terrain.append(terrain)
+        self.touch()
+        return terrain
+    
+    def add_faction(self, faction: Faction) -> Faction:
+        """Add a faction to the world."""
+        self.factions.append(faction)
+        self.touch()
+        return faction
+    
     def get_settlement(self, id_or_name: str) -> Optional[Settlement]:
         """Find a settlement by ID or name."""
-        for s in self.settlements:
-            if s.id == id_or_name or s.name.lower() == id_or_name.lower():
-                return s
-        return None
+        return self._lookup("settlements", id_or_name)
     
     def get_terrain(self, id_or_name: str) -> Optional[Terrain]:
         """Find terrain by ID or name."""
-        for t in self.terrain:
-            if t.id == id_or_name or t.name.lower() == id_or_name.lower():
-                return t
-        return None
+        return self._lookup("terrain", id_or_name)
     
     def get_faction(self, id_or_name: str) -> Optional[Faction]:
         """Find a faction by ID or name."""
-        for f in self.factions:
-            if f.id == id_or_name or f.name.lower() == id_or_name.lower():
-                return f
-        return None
+        return self._lookup("factions", id_or_name)
+    
+    # ===== Populations =====
+    
+    @property
+    def total_population(self) -> int:
+        """Total headcount across all population classes."""
+        return sum(p.count for p in self.populations)
     
     # ===== Extension Path Methods =====
     
@@ -233,7 +356,7 @@ class WorldState(BaseModel):
         
         Example: get_extension("advisors.marshal.resentment.clockmaker_incident")
         """
-        keys = path.split(".")
+        keys = _split_path(path)
         current = self.extensions
         
         for key in keys:
@@ -244,14 +367,19 @@ class WorldState(BaseModel):
         
         return current
     
-    def set_extension(self, path: str, value: Any, metadata: Optional[dict] = None) -> bool:
+    def set_extension(
+        self, path: str, value: Any, metadata: Optional[dict | ChangeMetadata] = None
+    ) -> bool:
         """Set a value in extensions using dot-notation path.
         
         Example: set_extension("advisors.marshal.resentment.incident", {"severity": "high"})
         
         If metadata is provided, it's merged with the value if value is a dict.
+        ChangeMetadata is stored in its plain dict form so extensions stay JSON.
         """
-        keys = path.split(".")
+        if metadata is not None and not isinstance(metadata, dict):
+            metadata = metadata.as_dict()
+        keys = _split_path(path)
         current = self.extensions
         
         # Navigate/create path to parent
@@ -272,11 +400,12 @@ class WorldState(BaseModel):
             value = {"_value": value, "_meta": metadata}
         
         current[final_key] = value
+        self.touch()
         return True
     
     def delete_extension(self, path: str) -> bool:
         """Delete a value from extensions using dot-notation path."""
-        keys = path.split(".")
+        keys = _split_path(path)
         current = self.extensions
         
         # Navigate to parent
@@ -290,35 +419,34 @@ class WorldState(BaseModel):
         final_key = keys[-1]
         if isinstance(current, dict) and final_key in current:
             del current[final_key]
+            self.touch()
             return True
         return False
     
-    def list_extensions(self, prefix: str = "") -> list[str]:
-        """List all extension paths, optionally filtered by prefix."""
-        paths = []
-        
-        def _collect_paths(obj: dict, current_path: str):
-            for key, value in obj.items():
-                full_path = f"{current_path}.{key}" if current_path else key
-                if isinstance(value, dict) and not key.startswith("_"):
-                    # Check if this is a leaf node with metadata or a branch
-                    if "_value" in value or "_meta" in value:
-                        paths.append(full_path)
-                    else:
-                        _collect_paths(value, full_path)
-                else:
-                    paths.append(full_path)
-        
-        _collect_paths(self.extensions, "")
-        
+    def list_extensions_with_values(self, prefix: str = "") -> list[tuple[str, Any]]:
+        """List (path, value) pairs for all extension leaves, sorted by path."""
+        walk = _walk_extensions(self.extensions, [])
         if prefix:
-            paths = [p for p in paths if p.startswith(prefix)]
+            prefix_parts = _split_path(prefix)
+            pairs = [(".".join(t), v) for t, v in walk if _matches_prefix(t, prefix_parts)]
+        else:
+            pairs = [(".".join(t), v) for t, v in walk]
         
-        return sorted(paths)
+        pairs.sort(key=lambda pair: pair[0])
+        return pairs
+    
+    def list_extensions(self, prefix: str = "") -> list[str]:
+        """List all extension paths, optionally filtered by prefix."""
+        return [path for path, _ in self.list_extensions_with_values(prefix)]
     
     def has_extension(self, path: str) -> bool:
-        """Check if an extension path exists."""
-        return self.get_extension(path) is not None
+        """Check if an extension path exists (even if its value is None)."""
+        current = self.extensions
+        for key in _split_path(path):
+            if not isinstance(current, dict) or key not in current:
+                return False
+            current = current[key]
+        return True
     
     # ===== Dynamic Rules =====
     
@@ -331,35 +459,13 @@ class WorldState(BaseModel):
             created_by=created_by,
         )
         self.dynamic_rules.append(rule)
+        self.touch()
         return rule
     
     def get_active_rules(self) -> list[DynamicRule]:
         """Get all active dynamic rules."""
         return [r for r in self.dynamic_rules if r.active]
     
-    # ===== Core Entity Lookups =====
-    
-    def get_settlement(self, id_or_name: str) -> Optional[Settlement]:
-        """Find a settlement by ID or name."""
-        for s in self.settlements:
-            if s.id == id_or_name or s.name.lower() == id_or_name.lower():
-                return s
-        return None
-    
-    def get_terrain(self, id_or_name: str) -> Optional[Terrain]:
-        """Find terrain by ID or name."""
-        for t in self.terrain:
-            if t.id == id_or_name or t.name.lower() == id_or_name.lower():
-                return t
-        return None
-    
-    def get_faction(self, id_or_name: str) -> Optional[Faction]:
-        """Find a faction by ID or name."""
-        for f in self.factions:
-            if f.id == id_or_name or f.name.lower() == id_or_name.lower():
-                return f
-        return None
-    
     def summary(self) -> str:
         """Generate a text summary of the world state."""
         lines = [
@@ -393,19 +499,18 @@ class WorldState(BaseModel):
                 lines.append(f"  {p.social_class.value}: {p.count} (approval: {p.approval}%)")
         
         # Show extensions summary if any exist
-        ext_paths = self.list_extensions()
-        if ext_paths:
+        ext_items = self.list_extensions_with_values()
+        if ext_items:
             lines.append("")
             lines.append("--- Dynamic State ---")
-            for path in ext_paths[:10]:  # Limit to 10
-                value = self.get_extension(path)
+            for path, value in ext_items[:10]:  # Limit to 10
                 if isinstance(value, dict):
                     summary = value.get("summary", value.get("reason", str(value)[:40]))
                 else:
                     summary = str(value)[:40]
                 lines.append(f"  {path}: {summary}")
-            if len(ext_paths) > 10:
-                lines.append(f"  ... and {len(ext_paths) - 10} more")
+            if len(ext_items) > 10:
+                lines.append(f"  ... and {len(ext_items) - 10} more")
         
         # Show active rules if any
         active_rules = self.get_active_rules()
@@ -1,9 +1,11 @@
 """Autonomous narrator - unified flow with LLM-based intent classification."""
 
 from __future__ import annotations
-from typing import TYPE_CHECKING, Optional, Any
+from collections import OrderedDict
+from concurrent.futures import Executor
+from typing import TYPE_CHECKING, Callable, Literal, Optional, Any
 from enum import Enum
-import json
+import asyncio
 import re
 
 if TYPE_CHECKING:
@@ -33,10 +35,163 @@ IRREVERSIBLE_KEYWORDS = [
 ]
 
 
+# Domain keywords for routing orders to an advisor, checked in priority order
+DOMAIN_KEYWORDS: dict[str, list[str]] = {
+    # Economic -> steward
+    "steward": [
+        "gold", "treasury", "money", "food", "resource", "trade", "tax",
+        "economy", "production", "harvest", "supplies", "craft", "build",
+        "labor", "worker", "solar", "power", "water", "infrastructure",
+    ],
+    # Military -> marshal
+    "marshal": [
+        "army", "soldier", "warrior", "attack", "defend", "patrol",
+        "scout", "raid", "siege", "battle", "war", "military",
+        "guard", "protect", "secure", "weapon", "fort", "troops",
+        "sheriff", "police", "arrest", "suppress", "kill",
+    ],
+    # Diplomatic -> chancellor
+    "chancellor": [
+        "treaty", "alliance", "diplomat", "negotiate", "faction",
+        "law", "decree", "ethics", "tradition", "marriage",
+        "court", "noble", "title", "claim", "dispute",
+    ],
+}
+
+
+def _keyword_re(keywords: list[str]) -> re.Pattern[str]:
+    """Compile keywords into one alternation so a text is scanned once in C."""
+    return re.compile("|".join(map(re.escape, keywords)))
+
+
+_NICK_RE = re.compile(r"['\"](\w+)['\"]")
+_IRREVERSIBLE_RE = _keyword_re(IRREVERSIBLE_KEYWORDS)
+_DOMAIN_RES = tuple((role, _keyword_re(words)) for role, words in DOMAIN_KEYWORDS.items())
+
+
 def is_irreversible(text: str) -> bool:
     """Check if an action is irreversible."""
-    text_lower = text.lower()
-    return any(keyword in text_lower for keyword in IRREVERSIBLE_KEYWORDS)
+    return _IRREVERSIBLE_RE.search(text.lower()) is not None
+
+
+# Classification results kept per narrator (normalized input -> intent fields)
+_INTENT_CACHE_SIZE = 512
+_INTENT_CACHE_FIELDS = ("intent", "advisor", "is_multi_order", "sub_orders", "summary")
+
+# Fixed inputs handled without classification
+_LEAVE_CMDS = frozenset({"leave", "back", "exit", "bye", "goodbye", "done"})
+_QUICK_ACKS = frozenset({
+    "yes", "y", "no", "n", "do it", "proceed", "confirm", "cancel", "stop",
+    "ok", "okay", "alright", "thanks", "thank you",
+})
+_CONFIRM_CMDS = frozenset({"yes", "y", "do it", "proceed", "confirm"})
+
+# Offline rules for unambiguous inputs; anything else goes to the LLM.
+# Inputs that may hold several clauses are always left to the LLM.
+_RULE_SKIP_RE = re.compile(r"\b(?:and|but|then|also)\b|[;,]", re.IGNORECASE)
+_RULE_SUMMON_RE = re.compile(
+    r"^(?:summon|bring|fetch|get|call(?:\s+for|\s+in)?)\s+(?:me\s+)?(?:the\s+)?(?P<who>.+?)"
+    r"(?:\s+(?:in\s+)?here|\s+to\s+me)?\s*[.!]*$",
+    re.IGNORECASE,
+)
+_RULE_QUESTION_RE = re.compile(
+    r"^(?!why\s+(?:don't|not)\b|how\s+about\b|what\s+if\b)(?:what|how|why|who|where|when)\b.*\?$"
+    r"|^tell\s+me\s+about\b",
+    re.IGNORECASE,
+)
+_RULE_ORDER_RE = re.compile(
+    r"^(?:attack|build|construct|deploy|dispatch|fortify|move|raid|recruit|scout|send|train)\s+(?P<target>[^?]+?)[.!]*$",
+    re.IGNORECASE,
+)
+# Something a rule-classified order can act on; otherwise ("move on",
+# "send my regards") the input goes to the LLM. Settlement and faction
+# names also count (see _classify_by_rules).
+_RULE_ORDER_OBJECT_RE = re.compile(
+    r"\b(?:\d+|troops?|men|soldiers?|guards?|militia|cavalry|riders?|scouts?|spies|archers?"
+    r"|workers?|recruits?|patrols?|army|forces?|walls?|forts?|fortifications?|barracks"
+    r"|granar(?:y|ies)|farms?|mills?|roads?|bridges?|towers?|outposts?|defen[cs]es)\b",
+    re.IGNORECASE,
+)
+
+# Compiled order effect: (world_state, delta) -> applied-effect description
+EffectApplier = Callable[["WorldState", int], str]
+
+# Upper bound on order-detail LLM calls in flight for one multi-order input
+_MAX_CONCURRENT_ORDERS = 4
+
+
+# Static part of the classification prompt; the advisor roster is appended
+# per narrator and the player input goes in the user message.
+_CLASSIFY_INSTRUCTIONS = """Classify the player input for a strategy game.
+
+Respond with JSON only:
+{
+    "intent": "ORDER" | "QUESTION" | "SUMMON" | "GENERAL",
+    "advisor": "<advisor key or null>",
+    "is_multi_order": true/false,
+    "sub_orders": ["<multi-order only: each separate order restated as its own instruction>"],
+    "summary": "<brief description of what they want>",
+    "order_name": "<ORDER only: concise name for this order, max 40 chars>",
+    "duration_days": <ORDER only: 1-14>,
+    "acknowledgment": "<ORDER only: brief in-character acknowledgment from the chosen advisor, 1-2 sentences, include time estimate>",
+    "effects": [
+        {"path": "resources.<field>", "delta": <number>},
+        {"path": "settlements.<name>.population", "delta": <number>},
+        {"path": "factions.<name>.disposition", "delta": <number>}
+    ],
+    "entrance": "<SUMMON only: 2-3 atmospheric sentences describing the advisor entering the room>"
+}
+
+INTENT TYPES:
+- ORDER: They want something DONE. Action, command, directive. "do X", "get X done", "handle X", "I want X", imperatives.
+- QUESTION: They want INFORMATION. "what do you think", "tell me about", "how is", "ask X about".
+- SUMMON: They want to TALK to someone. "get X in here", "bring X", "I need to speak with X".
+- GENERAL: Acknowledgments, thanks, chit-chat, or unclear.
+
+Be aggressive about classifying as ORDER - if they're giving ANY kind of directive or command, it's an ORDER.
+"is_multi_order" is true if they're giving multiple separate orders in one message; then list each one in "sub_orders".
+
+For ORDER only, also fill in "order_name", "duration_days", "acknowledgment" and "effects"; for SUMMON only, fill in "entrance". Omit them otherwise.
+Available resources: treasury, food, timber, iron, labor
+- "acknowledgment" should be BRIEF. Just acknowledge and give time. Do NOT describe completion.
+- "order_name" should be a proper name like "Deploy solar panels" not the raw player input
+- Include realistic effects. Moving 100 workers = population change. Building = resource costs.
+
+JSON only, no explanation."""
+
+_ORDER_INSTRUCTIONS = """The ruler has given an order and the named advisor must respond.
+
+Generate JSON:
+{
+    "order_name": "<concise name for this order, max 40 chars>",
+    "duration_days": <1-14>,
+    "acknowledgment": "<brief in-character acknowledgment from the advisor, 1-2 sentences, include time estimate>",
+    "effects": [
+        {"path": "resources.<field>", "delta": <number>},
+        {"path": "settlements.<name>.population", "delta": <number>},
+        {"path": "factions.<name>.disposition", "delta": <number>}
+    ]
+}
+
+Available resources: treasury, food, timber, iron, labor
+
+IMPORTANT:
+- "acknowledgment" should be BRIEF. Just acknowledge and give time. Do NOT describe completion.
+- "order_name" should be a proper name like "Deploy solar panels" not the raw player input
+- Include realistic effects. Moving 100 workers = population change. Building = resource costs.
+
+JSON only."""
+
+_SUMMON_INSTRUCTIONS = "You are a narrator. Briefly describe the summoned advisor entering the room. 2-3 sentences max. Be atmospheric."
+
+_ESCALATE_INSTRUCTIONS = "You are a narrator. The player is about to do something irreversible. Describe the consequences briefly (2-3 sentences) and ask for confirmation."
+
+_GENERAL_INSTRUCTIONS = """You are the narrator for a strategy game.
+
+Be brief and atmospheric. If they're just acknowledging something, respond briefly. 
+If they seem confused, offer guidance on what they can do (give orders, ask questions, summon advisors)."""
+
+_COMPLETION_INSTRUCTIONS = "You are a narrator. An order has completed. Describe the outcome in 2-3 sentences. Be specific about results."
 
 
 class AutonomousNarrator:
@@ -52,17 +207,45 @@ class AutonomousNarrator:
         advisor_council: "AdvisorCouncil",
         advisors: dict[str, "DynamicAdvisor"],
         order_tracker: "OrderTracker",
+        stream_callback: Optional[Callable[[str], None]] = None,
     ):
         self.llm = llm
         self.world_state = world_state
         self.advisor_council = advisor_council
         self.advisors = advisors
         self.order_tracker = order_tracker
+        # Receives narrative text chunks as they stream in (called from
+        # whichever thread runs process()); None means no streaming
+        self.stream_callback = stream_callback
         
         # Session state
-        self._session_events: list[dict] = []
+        # Session log, stored column-wise (see session_events)
+        self._events_type: list[str] = []
+        self._events_summary: list[str] = []
+        self._events_advisor: list[Optional[str]] = []
+        self._events_effects: list[Optional[list[str]]] = []
+        # "escalation" takes priority over everything; "conversation" means
+        # _conversation_mode names the advisor being spoken to
+        self._state: Literal["idle", "conversation", "escalation"] = "idle"
         self._pending_escalation: Optional[dict] = None
         self._conversation_mode: Optional[str] = None
+        self._intent_cache: OrderedDict[tuple, dict] = OrderedDict()
+        self._effect_appliers: dict[str, EffectApplier] = {}
+        self._world_prefix_cached: tuple[tuple[int, int], str] = ((0, -1), "")
+        
+        # Intent -> handler(player_input, advisor_key, summary, classification)
+        self._intent_dispatch: dict[str, Callable[[str, Optional[str], str, dict], dict[str, Any]]] = {
+            "SUMMON": self._dispatch_summon,
+            "QUESTION": self._dispatch_question,
+            "ORDER": self._dispatch_order,
+            "GENERAL": self._dispatch_general,
+        }
+        
+        # Fallback when an order can't be routed to a specific advisor
+        self._default_advisor_key: Optional[str] = next(iter(advisors), None)
+        self._default_advisor: Optional["DynamicAdvisor"] = (
+            advisors[self._default_advisor_key] if self._default_advisor_key else None
+        )
         
         # Build advisor lookup (name -> key, nickname -> key, etc.)
         self._advisor_lookup: dict[str, str] = {}
@@ -75,104 +258,296 @@ class AutonomousNarrator:
             # Check for nickname in quotes
             if "'" in adv.name or '"' in adv.name:
                 # Extract nickname like 'Mack' from "Sheriff Miller 'Mack' Mackenzie"
-                nick_match = re.search(r"['\"](\w+)['\"]", adv.name)
+                nick_match = _NICK_RE.search(adv.name)
                 if nick_match:
                     self._advisor_lookup[nick_match.group(1).lower()] = key
+        
+        # One alternation over every lookup name, longest first so the most
+        # specific name wins when one is a substring of another. Names must
+        # stand alone as words ("ada" should not match "canada").
+        self._advisor_names: tuple[str, ...] = tuple(
+            sorted(self._advisor_lookup, key=len, reverse=True)
+        )
+        self._advisor_re: Optional[re.Pattern[str]] = (
+            re.compile(r"(?<!\w)(?:" + "|".join(map(re.escape, self._advisor_names)) + r")(?!\w)")
+            if self._advisor_names else None
+        )
+        
+        # Stable prompt prefixes, built once so they stay byte-identical
+        # across calls and can be served from the provider's prompt cache
+        self._advisor_list_block = "\n".join(
+            f"- {key}: {adv.name} ({adv.title})" for key, adv in advisors.items()
+        )
+        self._classify_prefix = f"{_CLASSIFY_INSTRUCTIONS}\n\nAVAILABLE ADVISORS:\n{self._advisor_list_block}"
     
     @property
     def in_conversation(self) -> bool:
         return self._conversation_mode is not None
     
+    @property
+    def session_events(self) -> list[dict[str, Any]]:
+        """Orders issued and completed this session, as dicts."""
+        events = []
+        for event_type, summary, advisor, effects in zip(
+            self._events_type, self._events_summary, self._events_advisor, self._events_effects
+        ):
+            event: dict[str, Any] = {"type": event_type, "summary": summary}
+            if advisor is not None:
+                event["advisor"] = advisor
+            if effects is not None:
+                event["effects"] = effects
+            events.append(event)
+        return events
+    
+    def _log_event(
+        self,
+        event_type: str,
+        summary: str,
+        advisor: Optional[str] = None,
+        effects: Optional[list[str]] = None,
+    ) -> None:
+        self._events_type.append(event_type)
+        self._events_summary.append(summary)
+        self._events_advisor.append(advisor)
+        self._events_effects.append(effects)
+    
     @property
     def current_advisor(self) -> Optional["DynamicAdvisor"]:
         if self._conversation_mode:
             return self.advisors.get(self._conversation_mode)
         return None
     
+    def _world_prefix(self) -> str:
+        """World snapshot shared by every prompt, rebuilt only when the state changes."""
+        ws = self.world_state
+        key = (id(ws), ws.state_version)
+        if self._world_prefix_cached[0] != key:
+            ctx = ws.advisor_context
+            text = (
+                f"Setting: {ctx.historical_period}\n"
+                f"Current situation: {ws.scenario_description}\n"
+                f"Settlements: {[s.name for s in ws.settlements]}\n"
+                f"Factions: {[f.name for f in ws.factions]}"
+            )
+            self._world_prefix_cached = (key, text)
+        return self._world_prefix_cached[1]
+    
+    def _narrate(self, messages: list[dict[str, Any]], temperature: float, max_tokens: int) -> Optional[str]:
+        """Generate free-form narrative, streaming chunks to stream_callback if set."""
+        from src.llm.openrouter import ModelTier
+        
+        if self.stream_callback is None:
+            response = self.llm.chat(
+                messages=messages,
+                tier=ModelTier.ADVISOR,
+                temperature=temperature,
+                max_tokens=max_tokens,
+            )
+            return response.content
+        
+        chunks = []
+        for chunk in self.llm.chat_stream(
+            messages=messages,
+            tier=ModelTier.ADVISOR,
+            temperature=temperature,
+            max_tokens=max_tokens,
+        ):
+            chunks.append(chunk)
+            self.stream_callback(chunk)
+        return "".join(chunks)
+    
     def _find_advisor_in_text(self, text: str) -> Optional[str]:
         """Find any advisor reference in the text."""
-        text_lower = text.lower()
-        for name, key in self._advisor_lookup.items():
-            if name in text_lower:
-                return key
-        return None
+        if self._advisor_re is None:
+            return None
+        match = self._advisor_re.search(text.lower())
+        return self._advisor_lookup[match.group()] if match else None
+    
+    def _classify(self, text: str) -> dict:
+        """Classify input by offline rules when unambiguous, else via the LLM."""
+        return self._classify_by_rules(text) or self._classify_intent_via_llm(text)
+    
+    def _classify_by_rules(self, text: str) -> Optional[dict]:
+        """Classify short, unambiguous inputs without an LLM call; None if unsure."""
+        text = text.strip()
+        if _RULE_SKIP_RE.search(text):
+            return None
+        
+        intent = None
+        advisor_key = None
+        
+        match = _RULE_SUMMON_RE.match(text)
+        if match:
+            # Only when the rest of the input is exactly an advisor reference
+            advisor_key = self._advisor_lookup.get(match.group("who").lower())
+            if advisor_key:
+                intent = "SUMMON"
+        
+        if intent is None:
+            if _RULE_QUESTION_RE.match(text):
+                intent = "QUESTION"
+            elif self._is_rule_order(text):
+                intent = "ORDER"
+            else:
+                return None
+            advisor_key = self._find_advisor_in_text(text)
+        
+        return {
+            "intent": intent,
+            "advisor": advisor_key,
+            "is_multi_order": False,
+            "summary": text[:50],
+        }
+    
+    def _is_rule_order(self, text: str) -> bool:
+        """Whether text is an order verb applied to troops, works or a known place or faction."""
+        match = _RULE_ORDER_RE.match(text)
+        if not match:
+            return False
+        target = match.group("target")
+        if _RULE_ORDER_OBJECT_RE.search(target):
+            return True
+        target = target.lower()
+        ws = self.world_state
+        return any(
+            entity.name.lower() in target
+            for entities in (ws.settlements, ws.factions)
+            for entity in entities
+        )
     
     def _classify_intent_via_llm(self, text: str) -> dict:
-        """Use LLM to classify intent - more reliable than regex."""
-        from src.llm.openrouter import ModelTier
+        """Use LLM to classify intent - more reliable than regex.
         
-        advisor_list = []
-        for key, adv in self.advisors.items():
-            advisor_list.append(f"- {key}: {adv.name} ({adv.title})")
+        Repeated inputs (after case/whitespace normalization) with the same
+        advisor roster reuse the earlier classification. Only the intent
+        fields are cached; order details depend on the current world and
+        are regenerated by _handle_order on a hit.
+        """
+        from src.llm.openrouter import ModelTier, cached_prompt, extract_json_object
+        
+        cache_key = (" ".join(text.lower().split()), frozenset(self.advisors))
+        cached = self._intent_cache.get(cache_key)
+        if cached is not None:
+            self._intent_cache.move_to_end(cache_key)
+            return dict(cached)
         
-        prompt = f"""Classify this player input for a strategy game.
-
-PLAYER INPUT: "{text}"
-
-AVAILABLE ADVISORS:
-{chr(10).join(advisor_list)}
-
-Respond with JSON only:
-{{
-    "intent": "ORDER" | "QUESTION" | "SUMMON" | "GENERAL",
-    "advisor": "<advisor key or null>",
-    "is_multi_order": true/false,
-    "summary": "<brief description of what they want>"
-}}
-
-INTENT TYPES:
-- ORDER: They want something DONE. Action, command, directive. "do X", "get X done", "handle X", "I want X", imperatives.
-- QUESTION: They want INFORMATION. "what do you think", "tell me about", "how is", "ask X about".
-- SUMMON: They want to TALK to someone. "get X in here", "bring X", "I need to speak with X".
-- GENERAL: Acknowledgments, thanks, chit-chat, or unclear.
-
-Be aggressive about classifying as ORDER - if they're giving ANY kind of directive or command, it's an ORDER.
-"is_multi_order" is true if they're giving multiple separate orders in one message.
-
-JSON only, no explanation:"""
-
         response = self.llm.chat(
-            messages=[{"role": "user", "content": prompt}],
+            messages=cached_prompt(self._classify_prefix, f'PLAYER INPUT: "{text}"', self._world_prefix()),
             tier=ModelTier.ADVISOR,
             temperature=0.1,
-            max_tokens=150,
+            max_tokens=400,
+            response_format={"type": "json_object"},
         )
         
-        try:
-            content = response.content or "{}"
-            json_match = re.search(r'\{[\s\S]*\}', content)
-            if json_match:
-                return json.loads(json_match.group())
-        except:
-            pass
+        classification = extract_json_object(response.content)
+        if isinstance(classification, dict):
+            self._cache_intent(cache_key, classification)
+            return classification
         
         return {"intent": "GENERAL", "advisor": None, "summary": text[:50]}
     
+    def _cache_intent(self, key: tuple, classification: dict) -> None:
+        """Store the intent fields of a classification, evicting the oldest entry."""
+        self._intent_cache[key] = {
+            k: classification[k] for k in _INTENT_CACHE_FIELDS if k in classification
+        }
+        if len(self._intent_cache) > _INTENT_CACHE_SIZE:
+            self._intent_cache.popitem(last=False)
+    
     def process(self, player_input: str) -> dict[str, Any]:
         """Process player input through unified flow."""
-        from src.llm.openrouter import ModelTier
+        result = self._process_quick(player_input)
+        if result is not None:
+            return result
+        
+        # Use LLM to classify intent
+        classification = self._classify(player_input)
+        return self._dispatch(player_input, classification)
+    
+    async def process_async(
+        self,
+        player_input: str,
+        executor: Optional[Executor] = None,
+    ) -> dict[str, Any]:
+        """Async variant of process() that fans multi-orders out concurrently.
+        
+        Blocking LLM calls run on executor (the loop's default if None).
+        When the classifier splits the input into sub-orders, each one is
+        built on executor, at most _MAX_CONCURRENT_ORDERS at a time, and the
+        results are recorded in input order.
+        """
+        loop = asyncio.get_running_loop()
+        
+        def _classify() -> tuple[Optional[dict], Optional[dict]]:
+            result = self._process_quick(player_input)
+            if result is not None:
+                return result, None
+            return None, self._classify(player_input)
+        
+        result, classification = await loop.run_in_executor(executor, _classify)
+        if result is not None:
+            return result
+        
+        sub_orders = self._parallel_sub_orders(player_input, classification)
+        if not sub_orders:
+            return await loop.run_in_executor(executor, self._dispatch, player_input, classification)
+        
+        semaphore = asyncio.Semaphore(_MAX_CONCURRENT_ORDERS)
+        # Same bias toward the current advisor that _dispatch applies
+        advisor_key = self._conversation_mode if self.in_conversation else None
+        
+        async def _order(text: str) -> tuple["Order", "DynamicAdvisor", str]:
+            async with semaphore:
+                return await loop.run_in_executor(executor, self._build_order, text, advisor_key, text[:40])
+        
+        # Workers only build the orders; tracking and logging happen here, on
+        # the loop thread, in sub-order order
+        built = await asyncio.gather(*(_order(text) for text in sub_orders))
+        results = [self._record_order(*parts) for parts in built]
+        return self._response(
+            "\n\n".join(f"{r['advisor_name']}: {r['response']}" for r in results),
+            orders_created=[order for r in results for order in r["orders_created"]],
+        )
+    
+    def _parallel_sub_orders(self, player_input: str, classification: dict) -> Optional[list[str]]:
+        """Return the sub-orders to run concurrently, or None to go through _dispatch."""
+        if classification.get("intent", "").upper() != "ORDER" or not classification.get("is_multi_order"):
+            return None
+        # Irreversible orders go through the single-order escalation path
+        if is_irreversible(player_input):
+            return None
+        sub_orders = classification.get("sub_orders")
+        if not isinstance(sub_orders, list):
+            return None
+        sub_orders = [s.strip() for s in sub_orders if isinstance(s, str) and s.strip()]
+        return sub_orders if len(sub_orders) > 1 else None
+    
+    def _process_quick(self, player_input: str) -> Optional[dict[str, Any]]:
+        """Handle escalation replies and fixed commands; None if the input needs classifying."""
+        state = self._state
         
         # Handle pending escalation
-        if self._pending_escalation:
+        if state == "escalation":
             return self._handle_escalation_response(player_input)
         
         text_lower = player_input.lower().strip()
         
         # Quick check for leave command
-        if self.in_conversation and text_lower in ("leave", "back", "exit", "bye", "goodbye", "done"):
+        if state == "conversation" and text_lower in _LEAVE_CMDS:
             advisor_name = self.current_advisor.name if self.current_advisor else "advisor"
             self._conversation_mode = None
+            self._state = "idle"
             return self._response(f"Left conversation with {advisor_name}.", left_conversation=True)
         
         # Quick check for simple confirmations
-        if text_lower in ("yes", "y", "no", "n", "do it", "proceed", "confirm", "cancel", "stop", "ok", "okay", "alright", "thanks", "thank you"):
-            if self._pending_escalation:
-                return self._handle_escalation_response(player_input)
-            # Just acknowledgment
+        if text_lower in _QUICK_ACKS:
+            # Just acknowledgment (pending escalations were handled above)
             return self._handle_general(player_input)
         
-        # Use LLM to classify intent
-        classification = self._classify_intent_via_llm(player_input)
+        return None
+    
+    def _dispatch(self, player_input: str, classification: dict) -> dict[str, Any]:
+        """Route classified input to its intent handler."""
         intent = classification.get("intent", "GENERAL").upper()
         advisor_key = classification.get("advisor")
         summary = classification.get("summary", player_input[:50])
@@ -181,20 +556,24 @@ JSON only, no explanation:"""
         if self.in_conversation and not advisor_key:
             advisor_key = self._conversation_mode
         
-        # Handle by intent
-        if intent == "SUMMON":
-            return self._handle_summon(advisor_key, player_input)
-        
-        elif intent == "QUESTION":
-            return self._handle_question(player_input, advisor_key)
-        
-        elif intent == "ORDER":
-            if is_irreversible(player_input):
-                return self._escalate(player_input, advisor_key)
-            return self._handle_order(player_input, advisor_key, summary)
-        
-        else:
-            return self._handle_general(player_input)
+        handler = self._intent_dispatch.get(intent, self._dispatch_general)
+        return handler(player_input, advisor_key, summary, classification)
+    
+    def _dispatch_summon(self, player_input: str, advisor_key: Optional[str], summary: str, classification: dict) -> dict[str, Any]:
+        return self._handle_summon(advisor_key, player_input, classification.get("entrance"))
+    
+    def _dispatch_question(self, player_input: str, advisor_key: Optional[str], summary: str, classification: dict) -> dict[str, Any]:
+        return self._handle_question(player_input, advisor_key)
+    
+    def _dispatch_order(self, player_input: str, advisor_key: Optional[str], summary: str, classification: dict) -> dict[str, Any]:
+        # Order details arrive with the classification when the model filled them in
+        order_data = classification if "order_name" in classification else None
+        if is_irreversible(player_input):
+            return self._escalate(player_input, advisor_key, order_data)
+        return self._handle_order(player_input, advisor_key, summary, order_data=order_data)
+    
+    def _dispatch_general(self, player_input: str, advisor_key: Optional[str], summary: str, classification: dict) -> dict[str, Any]:
+        return self._handle_general(player_input)
     
     def _response(
         self,
@@ -217,9 +596,17 @@ JSON only, no explanation:"""
             "left_conversation": left_conversation,
         }
     
-    def _handle_summon(self, advisor_key: Optional[str], original_text: str) -> dict[str, Any]:
-        """Handle summoning an advisor."""
-        from src.llm.openrouter import ModelTier
+    def _handle_summon(
+        self,
+        advisor_key: Optional[str],
+        original_text: str,
+        entrance: Optional[str] = None,
+    ) -> dict[str, Any]:
+        """Handle summoning an advisor.
+        
+        An entrance already written by the classification call is used as-is.
+        """
+        from src.llm.openrouter import cached_prompt
         
         # Try to find advisor if not specified
         if not advisor_key:
@@ -230,21 +617,18 @@ JSON only, no explanation:"""
         
         advisor = self.advisors[advisor_key]
         self._conversation_mode = advisor_key
-        
-        # Generate atmospheric entrance
-        messages = [
-            {"role": "system", "content": f"You are a narrator. Briefly describe {advisor.name} ({advisor.title}) entering the room. 2-3 sentences max. Be atmospheric."},
-            {"role": "user", "content": f"The ruler has summoned {advisor.name}. Describe them entering."},
-        ]
-        
-        response = self.llm.chat(
-            messages=messages,
-            tier=ModelTier.ADVISOR,
-            temperature=0.8,
-            max_tokens=150,
-        )
-        
-        entrance = response.content or f"{advisor.name} enters."
+        self._state = "conversation"
+        
+        if not entrance:
+            # Generate atmospheric entrance
+            entrance = self._narrate(
+                cached_prompt(
+                    _SUMMON_INSTRUCTIONS,
+                    f"The ruler has summoned {advisor.name} ({advisor.title}). Describe them entering.",
+                ),
+                temperature=0.8,
+                max_tokens=150,
+            ) or f"{advisor.name} enters."
         
         return self._response(
             f"{entrance}\n\n[Now speaking with {advisor.name}]",
@@ -256,6 +640,8 @@ JSON only, no explanation:"""
         """Handle a question - get advisor's opinion/info."""
         if not advisor_key:
             advisor_key = self._find_advisor_in_text(query)
+        if not advisor_key:
+            advisor_key = self._get_advisor_for_domain(query)
         if not advisor_key:
             # Default to chancellor for questions
             advisor_key = "chancellor"
@@ -274,9 +660,32 @@ JSON only, no explanation:"""
             advisor_name=advisor.name,
         )
     
-    def _handle_order(self, order_text: str, advisor_key: Optional[str], summary: str) -> dict[str, Any]:
-        """Handle an order - create order with proper details."""
-        from src.llm.openrouter import ModelTier
+    def _handle_order(
+        self,
+        order_text: str,
+        advisor_key: Optional[str],
+        summary: str,
+        order_data: Optional[dict] = None,
+    ) -> dict[str, Any]:
+        """Handle an order - create order with proper details.
+        
+        If order_data was already produced by the classification call, the
+        separate order-details LLM call is skipped.
+        """
+        return self._record_order(*self._build_order(order_text, advisor_key, summary, order_data))
+    
+    def _build_order(
+        self,
+        order_text: str,
+        advisor_key: Optional[str],
+        summary: str,
+        order_data: Optional[dict] = None,
+    ) -> tuple["Order", "DynamicAdvisor", str]:
+        """Work out an order, its advisor and the acknowledgment without recording anything.
+        
+        Safe to run on worker threads: it only reads narrator state.
+        """
+        from src.llm.openrouter import ModelTier, cached_prompt, stream_json_object
         from src.models.orders import Order, OrderEffect
         
         # Find advisor
@@ -286,61 +695,29 @@ JSON only, no explanation:"""
             # Determine by domain
             advisor_key = self._get_advisor_for_domain(order_text)
         if not advisor_key:
-            advisor_key = list(self.advisors.keys())[0]
+            advisor_key = self._default_advisor_key
         
         advisor = self.advisors.get(advisor_key)
         if not advisor:
-            advisor = list(self.advisors.values())[0]
-            advisor_key = list(self.advisors.keys())[0]
-        
-        # Generate order details via LLM
-        settlements = [s.name for s in self.world_state.settlements]
-        factions = [f.name for f in self.world_state.factions]
+            advisor = self._default_advisor
+            advisor_key = self._default_advisor_key
         
-        order_prompt = f"""The ruler orders: "{order_text}"
-
-{advisor.name} ({advisor.title}) must respond.
-
-Generate JSON:
-{{
-    "order_name": "<concise name for this order, max 40 chars>",
-    "duration_days": <1-14>,
-    "acknowledgment": "<brief in-character acknowledgment from {advisor.name}, 1-2 sentences, include time estimate>",
-    "effects": [
-        {{"path": "resources.<field>", "delta": <number>}},
-        {{"path": "settlements.<name>.population", "delta": <number>}},
-        {{"path": "factions.<name>.disposition", "delta": <number>}}
-    ]
-}}
+        if order_data is None:
+            # Generate order details via LLM
+            dynamic = f"""The ruler orders: "{order_text}"
 
-Available resources: treasury, food, timber, iron, labor
-Settlements: {settlements}
-Factions: {factions}
-
-IMPORTANT:
-- "acknowledgment" should be BRIEF. Just acknowledge and give time. Do NOT describe completion.
-- "order_name" should be a proper name like "Deploy solar panels" not the raw player input
-- Include realistic effects. Moving 100 workers = population change. Building = resource costs.
-
-JSON only:"""
+{advisor.name} ({advisor.title}) must respond."""
 
-        response = self.llm.chat(
-            messages=[{"role": "user", "content": order_prompt}],
-            tier=ModelTier.ADVISOR,
-            temperature=0.5,
-            max_tokens=300,
-        )
-        
-        # Parse response
-        try:
-            content = response.content or "{}"
-            json_match = re.search(r'\{[\s\S]*\}', content)
-            if json_match:
-                order_data = json.loads(json_match.group())
-            else:
+            # Stream so parsing can start as soon as the JSON object closes
+            order_data = stream_json_object(self.llm.chat_stream(
+                messages=cached_prompt(_ORDER_INSTRUCTIONS, dynamic, self._world_prefix()),
+                tier=ModelTier.ADVISOR,
+                temperature=0.5,
+                max_tokens=300,
+                response_format={"type": "json_object"},
+            ))
+            if not isinstance(order_data, dict):
                 order_data = {}
-        except:
-            order_data = {}
         
         # Extract with fallbacks
         order_name = order_data.get("order_name", summary[:40])
@@ -367,15 +744,14 @@ JSON only:"""
             duration_days=max(1, min(30, duration)),
             effects=effects,
         )
-        
+        return order, advisor, acknowledgment
+    
+    def _record_order(self, order: "Order", advisor: "DynamicAdvisor", acknowledgment: str) -> dict[str, Any]:
+        """Track and log a built order and return the advisor's response."""
         self.order_tracker.add(order)
         
         # Log
-        self._session_events.append({
-            "type": "order",
-            "summary": order_name,
-            "advisor": advisor.name,
-        })
+        self._log_event("order", order.description, advisor=advisor.name)
         
         return self._response(
             acknowledgment,
@@ -386,79 +762,45 @@ JSON only:"""
     
     def _handle_general(self, query: str) -> dict[str, Any]:
         """Handle general queries through the narrator."""
-        from src.llm.openrouter import ModelTier
-        
-        ctx = self.world_state.advisor_context
-        
-        messages = [
-            {"role": "system", "content": f"""You are the narrator for a strategy game set in {ctx.historical_period}.
-
-Current situation: {self.world_state.scenario_description}
-
-Be brief and atmospheric. If they're just acknowledging something, respond briefly. 
-If they seem confused, offer guidance on what they can do (give orders, ask questions, summon advisors)."""},
-            {"role": "user", "content": query},
-        ]
+        from src.llm.openrouter import cached_prompt
         
-        response = self.llm.chat(
-            messages=messages,
-            tier=ModelTier.ADVISOR,
+        content = self._narrate(
+            cached_prompt(_GENERAL_INSTRUCTIONS, query, self._world_prefix()),
             temperature=0.7,
             max_tokens=200,
         )
         
-        return self._response(response.content or "...")
+        return self._response(content or "...")
     
     def _get_advisor_for_domain(self, text: str) -> Optional[str]:
         """Determine advisor by domain keywords."""
         text_lower = text.lower()
-        
-        # Economic -> steward
-        if any(word in text_lower for word in [
-            "gold", "treasury", "money", "food", "resource", "trade", "tax",
-            "economy", "production", "harvest", "supplies", "craft", "build",
-            "labor", "worker", "solar", "power", "water", "infrastructure",
-        ]):
-            return "steward"
-        
-        # Military -> marshal
-        if any(word in text_lower for word in [
-            "army", "soldier", "warrior", "attack", "defend", "patrol",
-            "scout", "raid", "siege", "battle", "war", "military",
-            "guard", "protect", "secure", "weapon", "fort", "troops",
-            "sheriff", "police", "arrest", "suppress", "kill",
-        ]):
-            return "marshal"
-        
-        # Diplomatic -> chancellor
-        if any(word in text_lower for word in [
-            "treaty", "alliance", "diplomat", "negotiate", "faction",
-            "law", "decree", "ethics", "tradition", "marriage",
-            "court", "noble", "title", "claim", "dispute",
-        ]):
-            return "chancellor"
-        
+        for role, pattern in _DOMAIN_RES:
+            if pattern.search(text_lower):
+                return role
         return None
     
-    def _escalate(self, action: str, advisor_key: Optional[str]) -> dict[str, Any]:
+    def _escalate(
+        self,
+        action: str,
+        advisor_key: Optional[str],
+        order_data: Optional[dict] = None,
+    ) -> dict[str, Any]:
         """Escalate an irreversible action for confirmation."""
-        from src.llm.openrouter import ModelTier
-        
-        messages = [
-            {"role": "system", "content": "You are a narrator. The player is about to do something irreversible. Describe the consequences briefly (2-3 sentences) and ask for confirmation."},
-            {"role": "user", "content": f"The ruler wants to: {action}"},
-        ]
+        from src.llm.openrouter import ModelTier, cached_prompt
         
         response = self.llm.chat(
-            messages=messages,
+            messages=cached_prompt(_ESCALATE_INSTRUCTIONS, f"The ruler wants to: {action}", self._world_prefix()),
             tier=ModelTier.ADVISOR,
             temperature=0.5,
             max_tokens=150,
         )
         
+        self._state = "escalation"
         self._pending_escalation = {
             "action": action,
             "advisor_key": advisor_key,
+            "order_data": order_data,
         }
         
         return self._response(
@@ -470,74 +812,103 @@ If they seem confused, offer guidance on what they can do (give orders, ask ques
         """Handle response to escalation."""
         pending = self._pending_escalation
         self._pending_escalation = None
-        
-        if response.lower().strip() in ("yes", "y", "do it", "proceed", "confirm"):
-            return self._handle_order(pending["action"], pending.get("advisor_key"), pending["action"][:40])
+        self._state = "conversation" if self._conversation_mode else "idle"
+        
+        if response.lower().strip() in _CONFIRM_CMDS:
+            return self._handle_order(
+                pending["action"],
+                pending.get("advisor_key"),
+                pending["action"][:40],
+                order_data=pending.get("order_data"),
+            )
         else:
             return self._response("The order is stayed.")
     
     def apply_order_effects(self, order: "Order") -> list[str]:
         """Apply order effects to world state."""
         applied = []
+        world_state = self.world_state
         
         for effect in order.effects:
-            path_parts = effect.path.split(".")
-            if len(path_parts) < 2:
+            if effect.delta is None:
                 continue
-            
             try:
-                category = path_parts[0]
-                
-                if category == "resources" and len(path_parts) >= 2:
-                    field = path_parts[1]
-                    if hasattr(self.world_state.resources, field):
-                        if effect.delta is not None:
-                            current = getattr(self.world_state.resources, field)
-                            new_val = max(0, current + effect.delta)
-                            setattr(self.world_state.resources, field, new_val)
-                            applied.append(f"{field}: {'+' if effect.delta >= 0 else ''}{effect.delta} (now {new_val})")
-                
-                elif category == "settlements" and len(path_parts) >= 3:
-                    name = path_parts[1]
-                    field = path_parts[2]
-                    settlement = self.world_state.get_settlement(name)
-                    if settlement and hasattr(settlement, field):
-                        if effect.delta is not None:
-                            current = getattr(settlement, field, 0)
-                            new_val = max(0, current + effect.delta)
-                            setattr(settlement, field, new_val)
-                            applied.append(f"{name}.{field}: {'+' if effect.delta >= 0 else ''}{effect.delta} (now {new_val})")
+                applier = self._effect_appliers.get(effect.path)
+                if applier is None:
+                    applier = self._compile_effect(effect.path)
+                    if applier is None:
+                        continue
+                    self._effect_appliers[effect.path] = applier
                 
-                elif category == "factions" and len(path_parts) >= 3:
-                    name = path_parts[1]
-                    field = path_parts[2]
-                    faction = self.world_state.get_faction(name)
-                    if faction and hasattr(faction, field):
-                        if effect.delta is not None:
-                            current = getattr(faction, field, 0)
-                            new_val = current + effect.delta
-                            if field == "disposition":
-                                new_val = max(0, min(100, new_val))
-                            setattr(faction, field, new_val)
-                            applied.append(f"{name}.{field}: {'+' if effect.delta >= 0 else ''}{effect.delta} (now {new_val})")
+                result = applier(world_state, effect.delta)
+                if result:
+                    applied.append(result)
             
             except Exception as e:
                 applied.append(f"(failed: {effect.path})")
         
+        if applied:
+            world_state.touch()
         return applied
     
+    def _compile_effect(self, path: str) -> Optional[EffectApplier]:
+        """Build an applier for an effect path, or None if the path is not supported.
+        
+        Entities are looked up by name when the applier runs, so an applier
+        stays valid as settlements and factions come and go.
+        """
+        path_parts = path.split(".", 2)
+        if len(path_parts) < 2:
+            return None
+        builder = _EFFECT_BUILDERS.get(path_parts[0])
+        return builder(self.world_state, path_parts) if builder else None
+    
     def complete_order(self, order: "Order") -> str:
         """Complete an order: apply effects FIRST, then generate narrative."""
-        from src.llm.openrouter import ModelTier
-        
-        # Apply effects
         effects_applied = self.apply_order_effects(order)
+        outcome = self._completion_outcome(order, effects_applied)
+        order.complete(outcome)
+        
+        self._log_event("order_complete", order.description, effects=effects_applied)
+        
+        return outcome
+    
+    async def complete_orders_async(
+        self,
+        orders: list["Order"],
+        executor: Optional[Executor] = None,
+    ) -> list[str]:
+        """Complete several orders with their narratives generated concurrently.
+        
+        Effects are applied up front, in order, on the calling thread, so the
+        world state ends up as it would after sequential complete_order calls;
+        only the LLM calls run on executor, at most _MAX_CONCURRENT_ORDERS at
+        a time.
+        """
+        loop = asyncio.get_running_loop()
+        semaphore = asyncio.Semaphore(_MAX_CONCURRENT_ORDERS)
+        effects = [self.apply_order_effects(order) for order in orders]
+        
+        async def _narrate(order: "Order", effects_applied: list[str]) -> str:
+            async with semaphore:
+                return await loop.run_in_executor(executor, self._completion_outcome, order, effects_applied)
+        
+        outcomes = await asyncio.gather(*(_narrate(o, e) for o, e in zip(orders, effects)))
+        for order, effects_applied, outcome in zip(orders, effects, outcomes):
+            order.complete(outcome)
+            self._log_event("order_complete", order.description, effects=effects_applied)
+        return outcomes
+    
+    def _completion_outcome(self, order: "Order", effects_applied: list[str]) -> str:
+        """Generate the completion narrative for an order whose effects are applied."""
+        from src.llm.openrouter import ModelTier, cached_prompt
+        
         effects_summary = "\n".join(f"- {e}" for e in effects_applied) if effects_applied else "No mechanical effects."
         
         # Generate completion narrative
-        messages = [
-            {"role": "system", "content": "You are a narrator. An order has completed. Describe the outcome in 2-3 sentences. Be specific about results."},
-            {"role": "user", "content": f"""Order completed: {order.description}
+        messages = cached_prompt(
+            _COMPLETION_INSTRUCTIONS,
+            f"""Order completed: {order.description}
 Original request: {order.original_request or order.description}
 Advisor: {order.advisor_name}
 Duration: {order.duration_days} days
@@ -545,8 +916,8 @@ Duration: {order.duration_days} days
 Effects applied:
 {effects_summary}
 
-Describe what happened."""},
-        ]
+Describe what happened.""",
+        )
         
         response = self.llm.chat(
             messages=messages,
@@ -555,13 +926,64 @@ Describe what happened."""},
             max_tokens=150,
         )
         
-        outcome = response.content or "The task was completed."
-        order.complete(outcome)
-        
-        self._session_events.append({
-            "type": "order_complete",
-            "summary": order.description,
-            "effects": effects_applied,
-        })
-        
-        return outcome
+        return response.content or "The task was completed."
+
+
+# ===== Order effect appliers =====
+
+def _build_resource_applier(ws: "WorldState", path_parts: list[str]) -> Optional[EffectApplier]:
+    """resources.<field>: clamp at zero."""
+    field = path_parts[1]
+    if not hasattr(ws.resources, field):
+        return None
+    
+    def apply_resource(ws: "WorldState", delta: int) -> str:
+        new_val = max(0, getattr(ws.resources, field) + delta)
+        setattr(ws.resources, field, new_val)
+        return f"{field}: {'+' if delta >= 0 else ''}{delta} (now {new_val})"
+    
+    return apply_resource
+
+
+def _build_settlement_applier(ws: "WorldState", path_parts: list[str]) -> Optional[EffectApplier]:
+    """settlements.<name>.<field>: clamp at zero."""
+    if len(path_parts) < 3:
+        return None
+    _, name, field = path_parts
+    
+    def apply_settlement(ws: "WorldState", delta: int) -> str:
+        settlement = ws.get_settlement(name)
+        if not (settlement and hasattr(settlement, field)):
+            return ""
+        new_val = max(0, getattr(settlement, field, 0) + delta)
+        setattr(settlement, field, new_val)
+        return f"{name}.{field}: {'+' if delta >= 0 else ''}{delta} (now {new_val})"
+    
+    return apply_settlement
+
+
+def _build_faction_applier(ws: "WorldState", path_parts: list[str]) -> Optional[EffectApplier]:
+    """factions.<name>.<field>: disposition is clamped to 0-100."""
+    if len(path_parts) < 3:
+        return None
+    _, name, field = path_parts
+    clamp = field == "disposition"
+    
+    def apply_faction(ws: "WorldState", delta: int) -> str:
+        faction = ws.get_faction(name)
+        if not (faction and hasattr(faction, field)):
+            return ""
+        new_val = getattr(faction, field, 0) + delta
+        if clamp:
+            new_val = max(0, min(100, new_val))
+        setattr(faction, field, new_val)
+        return f"{name}.{field}: {'+' if delta >= 0 else ''}{delta} (now {new_val})"
+    
+    return apply_faction
+
+
+_EFFECT_BUILDERS: dict[str, Callable[["WorldState", list[str]], Optional[EffectApplier]]] = {
+    "resources": _build_resource_applier,
+    "settlements": _build_settlement_applier,
+    "factions": _build_faction_applier,
+}
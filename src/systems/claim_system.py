@@ -1,6 +1,7 @@
 """Claim system - manages the lifecycle of claims about the world."""
 
 from __future__ import annotations
+from collections import defaultdict
 from typing import Optional, TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -9,14 +10,39 @@ if TYPE_CHECKING:
 from src.models.claims import Claim, ClaimStatus
 
 
+# Claim methods that record a resolution for each terminal status
+_RESOLVERS = {
+    ClaimStatus.CONFIRMED: Claim.confirm,
+    ClaimStatus.DENIED: Claim.deny,
+    ClaimStatus.CONTESTED: Claim.contest,
+}
+
+
 class ClaimSystem:
-    """Manages claims about the world - validation pipeline for new facts."""
+    """Manages claims about the world - validation pipeline for new facts.
+    
+    Claims are stored by their simple ID and indexed by status and proposer.
+    Status changes must go through set_status() to keep the index in sync.
+    """
     
     def __init__(self, world_state: "WorldState"):
         self.world_state = world_state
-        self._claims: dict[str, Claim] = {}
+        self._claims: dict[str, Claim] = {}  # simple ID -> claim
         self._next_id: int = 1  # Sequential ID counter
-        self._id_map: dict[str, str] = {}  # Maps simple IDs ("1") to full IDs
+        # Insertion-ordered sets (dict keys) of simple IDs
+        self._by_status: dict[ClaimStatus, dict[str, None]] = {s: {} for s in ClaimStatus}
+        self._by_proposer: defaultdict[str, dict[str, None]] = defaultdict(dict)
+        # Per-claim change counters and the model_dump() taken at that version
+        self._versions: dict[str, int] = {}
+        self._dump_cache: dict[str, tuple[int, dict]] = {}
+    
+    def _index(self, claim: Claim) -> None:
+        """Store a claim that already has its simple ID and index it."""
+        simple_id = claim.simple_id
+        self._claims[simple_id] = claim
+        self._by_status[claim.status][simple_id] = None
+        self._by_proposer[claim.proposed_by][simple_id] = None
+        self._versions[simple_id] = 0
     
     def add_claim(self, claim: Claim) -> str:
         """Add a new claim to the system. Returns the assigned simple ID."""
@@ -24,24 +50,47 @@ class ClaimSystem:
         simple_id = str(self._next_id)
         self._next_id += 1
         
-        # Store with the original UUID but create a mapping
-        self._claims[claim.id] = claim
-        self._id_map[simple_id] = claim.id
-        
-        # Also allow looking up by simple ID
-        claim.__dict__['simple_id'] = simple_id
+        claim.simple_id = simple_id
+        self._index(claim)
         
         return simple_id
     
     def get_claim(self, claim_id: str) -> Optional[Claim]:
         """Get a claim by ID (accepts both simple ID like '1' or full UUID)."""
-        # Try simple ID first
-        if claim_id in self._id_map:
-            full_id = self._id_map[claim_id]
-            return self._claims.get(full_id)
+        claim = self._claims.get(claim_id)
+        if claim is not None:
+            return claim
+        
+        # Full IDs are rare; fall back to a scan
+        return next((c for c in self._claims.values() if c.id == claim_id), None)
+    
+    def set_status(
+        self,
+        claim: Claim,
+        status: ClaimStatus,
+        resolver: str = "system",
+        reason: Optional[str] = None,
+    ) -> None:
+        """Move a claim to a new status, recording the resolution."""
+        simple_id = claim.simple_id
+        self._by_status[claim.status].pop(simple_id, None)
+        
+        resolve = _RESOLVERS.get(status)
+        if resolve is not None:
+            resolve(claim, resolver, reason)
+        else:
+            claim.status = status
         
-        # Try full ID
-        return self._claims.get(claim_id)
+        self._by_status[status][simple_id] = None
+        self.mark_changed(claim)
+    
+    def mark_changed(self, claim: Claim) -> None:
+        """Invalidate the cached export of a claim after modifying it directly."""
+        self._versions[claim.simple_id] = self._versions.get(claim.simple_id, 0) + 1
+    
+    def _claims_with_status(self, status: ClaimStatus) -> list[Claim]:
+        claims = self._claims
+        return [claims[i] for i in self._by_status[status]]
     
     def list_claims(self) -> list[Claim]:
         """Get all claims."""
@@ -49,49 +98,48 @@ class ClaimSystem:
     
     def get_pending_claims(self) -> list[Claim]:
         """Get all pending claims."""
-        return [c for c in self._claims.values() if c.status == ClaimStatus.PENDING]
+        return self._claims_with_status(ClaimStatus.PENDING)
     
     def get_contested_claims(self) -> list[Claim]:
         """Get all contested claims."""
-        return [c for c in self._claims.values() if c.status == ClaimStatus.CONTESTED]
+        return self._claims_with_status(ClaimStatus.CONTESTED)
     
     def get_confirmed_claims(self) -> list[Claim]:
         """Get all confirmed claims."""
-        return [c for c in self._claims.values() if c.status == ClaimStatus.CONFIRMED]
+        return self._claims_with_status(ClaimStatus.CONFIRMED)
     
     def get_denied_claims(self) -> list[Claim]:
         """Get all denied claims."""
-        return [c for c in self._claims.values() if c.status == ClaimStatus.DENIED]
+        return self._claims_with_status(ClaimStatus.DENIED)
     
     def get_claims_by_proposer(self, proposer: str) -> list[Claim]:
         """Get all claims by a specific proposer."""
-        return [c for c in self._claims.values() if c.proposed_by == proposer]
+        claims = self._claims
+        return [claims[i] for i in self._by_proposer.get(proposer, ())]
     
     def has_pending_claims(self) -> bool:
         """Check if there are any pending claims."""
-        return any(c.status == ClaimStatus.PENDING for c in self._claims.values())
+        return bool(self._by_status[ClaimStatus.PENDING])
     
     def pending_count(self) -> int:
         """Count of pending claims."""
-        return sum(1 for c in self._claims.values() if c.status == ClaimStatus.PENDING)
+        return len(self._by_status[ClaimStatus.PENDING])
     
     def get_simple_id(self, claim: Claim) -> str:
         """Get the simple ID for a claim."""
-        return getattr(claim, 'simple_id', claim.id[:8])
+        return claim.simple_id or claim.id[:8]
     
     def summary(self) -> str:
         """Generate a summary of claims."""
         pending = self.get_pending_claims()
         contested = self.get_contested_claims()
-        confirmed = self.get_confirmed_claims()
-        denied = self.get_denied_claims()
         
         lines = [
             f"Claims Summary:",
             f"  Pending: {len(pending)}",
             f"  Contested: {len(contested)}",
-            f"  Confirmed: {len(confirmed)}",
-            f"  Denied: {len(denied)}",
+            f"  Confirmed: {len(self._by_status[ClaimStatus.CONFIRMED])}",
+            f"  Denied: {len(self._by_status[ClaimStatus.DENIED])}",
         ]
         
         if pending:
@@ -110,32 +158,53 @@ class ClaimSystem:
         
         return "\n".join(lines)
     
+    def dump_claim(self, claim: Claim) -> dict:
+        """Get a claim's model_dump(), cached until the claim next changes.
+        
+        Treat the returned dict as read-only.
+        """
+        simple_id = claim.simple_id
+        version = self._versions.get(simple_id, 0)
+        cached = self._dump_cache.get(simple_id)
+        if cached is None or cached[0] != version:
+            cached = (version, claim.model_dump())
+            self._dump_cache[simple_id] = cached
+        return cached[1]
+    
     def export_claims(self) -> list[dict]:
-        """Export all claims for serialization."""
-        claims_data = []
-        for claim in self._claims.values():
-            data = claim.model_dump()
-            data['simple_id'] = self.get_simple_id(claim)
-            claims_data.append(data)
-        return claims_data
+        """Export all claims for serialization.
+        
+        Dumps are cached per claim version, so unchanged claims are not
+        re-serialized; treat the returned dicts as read-only.
+        """
+        dump_claim = self.dump_claim
+        return [dump_claim(claim) for claim in self._claims.values()]
     
     def import_claims(self, claims_data: list[dict]) -> None:
-        """Import claims from serialized data."""
+        """Import claims from serialized data (the input dicts are not modified)."""
         self._claims.clear()
-        self._id_map.clear()
+        for bucket in self._by_status.values():
+            bucket.clear()
+        self._by_proposer.clear()
+        self._versions.clear()
+        self._dump_cache.clear()
+        
         max_simple_id = 0
+        pending_ids: list[Claim] = []
         
         for data in claims_data:
-            simple_id = data.pop('simple_id', None)
             claim = Claim(**data)
-            self._claims[claim.id] = claim
-            
-            if simple_id:
-                claim.__dict__['simple_id'] = simple_id
-                self._id_map[simple_id] = claim.id
-                try:
-                    max_simple_id = max(max_simple_id, int(simple_id))
-                except ValueError:
-                    pass
+            if not claim.simple_id:
+                pending_ids.append(claim)
+                continue
+            self._index(claim)
+            try:
+                max_simple_id = max(max_simple_id, int(claim.simple_id))
+            except ValueError:
+                pass
         
         self._next_id = max_simple_id + 1
+        
+        # Claims saved without a simple ID get fresh ones
+        for claim in pending_ids:
+            self.add_claim(claim)
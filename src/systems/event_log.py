@@ -1,9 +1,21 @@
 """Event log system - maintains chronological record of all events."""
 
 from __future__ import annotations
-from typing import Optional
+from bisect import bisect_left, bisect_right
+from collections import defaultdict
+from datetime import datetime
+from typing import Any, Iterable, Optional
 
-from src.models.events import Event, EventType, EventLog as EventLogModel
+from pydantic import TypeAdapter
+
+from src.models.events import Event, EventEffect, EventType, EventLog as EventLogModel
+
+
+# Serializes a whole event list in one call into pydantic-core
+_EVENT_LIST_ADAPTER = TypeAdapter(list[Event])
+
+# Max memoized query results kept between log changes
+_QCACHE_SIZE = 128
 
 
 class EventLog:
@@ -11,17 +23,93 @@ class EventLog:
     
     def __init__(self) -> None:
         self._log = EventLogModel()
+        # game_tick of each event, parallel to self._log.events. Events are
+        # normally logged in tick order; if one arrives out of order the
+        # tick queries fall back to linear scans.
+        self._ticks: list[int] = []
+        self._ticks_sorted = True
+        # Secondary indexes, each list in log order
+        self._by_type: defaultdict[EventType, list[Event]] = defaultdict(list)
+        self._by_actor: defaultdict[str, list[Event]] = defaultdict(list)
+        self._visible: list[Event] = []
+        # Lower-cased descriptions, parallel to self._log.events, for search()
+        self._desc_lower: list[str] = []
+        # Bumped on every change; memoized scan results are dropped with it
+        self._version = 0
+        self._qcache: dict[tuple, list[Event]] = {}
+        # Bound appends for the hot add() path; these lists are only ever
+        # cleared in place, never replaced, so the bindings stay valid
+        self._append_event = self._log.events.append
+        self._append_tick = self._ticks.append
+        self._append_visible = self._visible.append
+        self._append_desc = self._desc_lower.append
+    
+    @property
+    def version(self) -> int:
+        """Change counter, bumped whenever events are added, imported or cleared."""
+        return self._version
+    
+    def _bump(self) -> None:
+        self._version += 1
+        if self._qcache:
+            self._qcache.clear()
+    
+    def _cached_scan(self, key: tuple, scan) -> list[Event]:
+        """Return a copy of a memoized scan result, computing it on a miss."""
+        result = self._qcache.get(key)
+        if result is None:
+            if len(self._qcache) >= _QCACHE_SIZE:
+                self._qcache.clear()
+            result = self._qcache[key] = scan()
+        return list(result)
     
     def add(self, event: Event) -> None:
         """Add an event to the log."""
-        self._log.add(event)
+        self._append_event(event)
+        self._index(event)
+        self._bump()
+    
+    def add_batch(self, events: Iterable[Event]) -> None:
+        """Add several events at once, invalidating cached queries only once."""
+        append_event = self._append_event
+        index = self._index
+        for event in events:
+            append_event(event)
+            index(event)
+        self._bump()
+    
+    def _index(self, event: Event) -> None:
+        """Record an already-appended event in the secondary indexes."""
+        tick = event.game_tick
+        ticks = self._ticks
+        if ticks and tick < ticks[-1]:
+            self._ticks_sorted = False
+        self._append_tick(tick)
+        self._by_type[event.event_type].append(event)
+        self._by_actor[event.actor].append(event)
+        if event.visible_to_player:
+            self._append_visible(event)
+        self._append_desc(event.description.lower())
+    
+    def _tick_range(self, start_tick: Optional[int], end_tick: Optional[int]) -> list[Event]:
+        """Events with start_tick <= game_tick <= end_tick (either bound optional)."""
+        events = self._log.events
+        if not self._ticks_sorted:
+            return [
+                e for e in events
+                if (start_tick is None or e.game_tick >= start_tick)
+                and (end_tick is None or e.game_tick <= end_tick)
+            ]
+        lo = 0 if start_tick is None else bisect_left(self._ticks, start_tick)
+        hi = len(events) if end_tick is None else bisect_right(self._ticks, end_tick)
+        return events[lo:hi]
     
     def get_recent(self, count: int = 10) -> list[Event]:
         """Get most recent events."""
         return self._log.get_recent(count)
     
     def get_all(self) -> list[Event]:
-        """Get all events."""
+        """Get all events (the live list; treat it as read-only)."""
         return self._log.events
     
     def get_by_tick(self, tick: int) -> list[Event]:
@@ -30,24 +118,27 @@ class EventLog:
     
     def get_by_type(self, event_type: EventType) -> list[Event]:
         """Get events of a specific type."""
-        return self._log.get_by_type(event_type)
+        return list(self._by_type.get(event_type, ()))
     
     def get_by_actor(self, actor: str) -> list[Event]:
         """Get events by a specific actor."""
-        return self._log.get_by_actor(actor)
+        return list(self._by_actor.get(actor, ()))
     
     def get_visible(self) -> list[Event]:
         """Get all player-visible events."""
-        return self._log.get_visible()
+        return list(self._visible)
     
     def get_since_tick(self, tick: int) -> list[Event]:
         """Get all events since a specific tick."""
-        return [e for e in self._log.events if e.game_tick >= tick]
+        return self._tick_range(tick, None)
     
     def search(self, query: str) -> list[Event]:
         """Search events by description."""
         query_lower = query.lower()
-        return [e for e in self._log.events if query_lower in e.description.lower()]
+        return self._cached_scan(("search", query_lower), lambda: [
+            e for e, desc in zip(self._log.events, self._desc_lower)
+            if query_lower in desc
+        ])
     
     def count(self) -> int:
         """Total number of events."""
@@ -72,19 +163,36 @@ class EventLog:
     
     def export(self) -> list[dict]:
         """Export all events for serialization."""
-        return [e.model_dump() for e in self._log.events]
+        return _EVENT_LIST_ADAPTER.dump_python(self._log.events)
     
     def import_events(self, events_data: list[dict]) -> None:
-        """Import events from serialized data."""
-        self._log.events.clear()
-        for data in events_data:
-            # Handle datetime serialization
-            event = Event(**data)
-            self._log.events.append(event)
+        """Import events from serialized data (as produced by export()).
+        
+        Saved events are trusted, so they are built with model_construct
+        instead of full validation; only the enum, timestamp and nested
+        effects are converted back from their JSON forms.
+        """
+        events = self._log.events
+        events.clear()
+        events.extend(_construct_event(data) for data in events_data)
+        self._rebuild_indexes()
     
     def clear(self) -> None:
         """Clear all events (use with caution)."""
         self._log.events.clear()
+        self._rebuild_indexes()
+    
+    def _rebuild_indexes(self) -> None:
+        """Rebuild every secondary index from the event list in one pass."""
+        self._ticks.clear()
+        self._ticks_sorted = True
+        self._by_type.clear()
+        self._by_actor.clear()
+        self._visible.clear()
+        self._desc_lower.clear()
+        for event in self._log.events:
+            self._index(event)
+        self._bump()
     
     def generate_report(
         self,
@@ -93,16 +201,15 @@ class EventLog:
         actor_filter: Optional[str] = None,
     ) -> str:
         """Generate a filtered report of events."""
-        events = self._log.events
-        
-        if start_tick is not None:
-            events = [e for e in events if e.game_tick >= start_tick]
-        
-        if end_tick is not None:
-            events = [e for e in events if e.game_tick <= end_tick]
-        
         if actor_filter:
-            events = [e for e in events if e.actor == actor_filter]
+            # Start from the actor's events, usually far fewer than the whole log
+            events = [
+                e for e in self._by_actor.get(actor_filter, ())
+                if (start_tick is None or e.game_tick >= start_tick)
+                and (end_tick is None or e.game_tick <= end_tick)
+            ]
+        else:
+            events = self._tick_range(start_tick, end_tick)
         
         if not events:
             return "No events match the filter criteria."
@@ -123,3 +230,19 @@ class EventLog:
             lines.append(f"  [{event.actor}] {event.description}")
         
         return "\n".join(lines)
+
+
+def _construct_event(data: dict[str, Any]) -> Event:
+    """Build an Event from exported data without running validation."""
+    values = dict(data)
+    values["event_type"] = EventType(values["event_type"])
+    timestamp = values.get("timestamp")
+    if isinstance(timestamp, str):
+        values["timestamp"] = datetime.fromisoformat(timestamp)
+    effects = values.get("effects")
+    if effects:
+        values["effects"] = [
+            e if isinstance(e, EventEffect) else EventEffect.model_construct(**e)
+            for e in effects
+        ]
+    return Event.model_construct(**values)
@@ -1,7 +1,8 @@
 """Time system - manages game time and time-based effects."""
 
 from __future__ import annotations
-from typing import Any, Callable, TYPE_CHECKING
+from collections.abc import Sequence
+from typing import Any, Callable, Optional, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from src.models.world_state import WorldState
@@ -9,23 +10,93 @@ if TYPE_CHECKING:
 from src.models.events import Event, EventType, EventEffect
 
 
+TickHandler = Callable[[int], list[Event]]
+
+# Tuning for the default handlers
+_SHORTAGE_APPROVAL_PENALTY = 5   # Approval lost per shortage day
+_UNREST_APPROVAL = 25            # Weekly unrest below this approval
+_DECAY_PER_MONTH = 5             # Condition lost every 30 days
+_DECAY_WARNING_CONDITION = 50    # Warn when condition drops below this
+# Old conditions that cross the warning line in a single decay step
+_DECAY_WARNING_BAND = range(_DECAY_WARNING_CONDITION, _DECAY_WARNING_CONDITION + _DECAY_PER_MONTH)
+
+# Handler events are built from trusted internal values, so they skip
+# pydantic validation
+_mk_event = Event.model_construct
+_mk_eff = EventEffect.model_construct
+
+_SHORTAGE_MSG = "{} approval dropped due to food shortage".format
+_UNREST_MSG = "Unrest among the {}! Approval critically low.".format
+
+
+class _LazySummaries(Sequence[str]):
+    """Read-only list of event summaries, formatted on first access.
+    
+    Most callers of advance() only look at events_generated, so the
+    summary strings are not built unless something reads them.
+    """
+    
+    __slots__ = ("_events", "_summaries")
+    
+    def __init__(self, events: list[Event]):
+        self._events = events
+        self._summaries: Optional[list[str]] = None
+    
+    def _materialize(self) -> list[str]:
+        if self._summaries is None:
+            self._summaries = [e.summary() for e in self._events]
+        return self._summaries
+    
+    def __len__(self) -> int:
+        return len(self._events)
+    
+    def __getitem__(self, index):
+        return self._materialize()[index]
+    
+    def __iter__(self):
+        return iter(self._materialize())
+    
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, Sequence) and not isinstance(other, str):
+            return self._materialize() == list(other)
+        return NotImplemented
+    
+    def __repr__(self) -> str:
+        return repr(self._materialize())
+
+
 class TimeSystem:
     """Manages game time and triggers time-based effects."""
     
     def __init__(self, world_state: "WorldState"):
         self.world_state = world_state
-        self._tick_handlers: list[Callable[[int], list[Event]]] = []
+        # (period, offset, handler): handler runs on ticks where
+        # tick % period == offset
+        self._tick_handlers: list[tuple[int, int, TickHandler]] = []
         self._register_default_handlers()
+        # Set once a custom handler is registered; see advance()
+        self._has_custom_handlers = False
     
     def _register_default_handlers(self) -> None:
-        """Register default time-based effect handlers."""
-        self._tick_handlers.append(self._handle_resource_consumption)
-        self._tick_handlers.append(self._handle_population_effects)
-        self._tick_handlers.append(self._handle_infrastructure_decay)
+        """Register default time-based effect handlers.
+        
+        Resource consumption is not registered here: advance() runs it
+        first on every tick where food can run short and settles the
+        remaining days in bulk.
+        """
+        self._tick_handlers.append((7, 0, self._handle_population_effects))
+        self._tick_handlers.append((30, 0, self._handle_infrastructure_decay))
     
-    def register_handler(self, handler: Callable[[int], list[Event]]) -> None:
-        """Register a custom tick handler."""
-        self._tick_handlers.append(handler)
+    def register_handler(self, handler: TickHandler, period: int = 1, offset: int = 0) -> None:
+        """Register a custom tick handler, run every `period` ticks.
+        
+        Custom handlers may read or change food and population, so once one
+        is registered advance() deducts food tick by tick instead of in bulk.
+        """
+        if period < 1:
+            raise ValueError("period must be at least 1")
+        self._tick_handlers.append((period, offset % period, handler))
+        self._has_custom_handlers = True
     
     def advance(self, days: int) -> dict[str, Any]:
         """Advance time by the specified number of days."""
@@ -35,39 +106,63 @@ class TimeSystem:
             return {"success": False, "error": "Cannot advance more than 30 days at once"}
         
         events: list[Event] = []
-        old_tick = self.world_state.current_tick
+        ws = self.world_state
+        old_tick = ws.current_tick
         
-        for _ in range(days):
-            self.world_state.current_tick += 1
-            
-            # Run all tick handlers
-            for handler in self._tick_handlers:
-                handler_events = handler(self.world_state.current_tick)
-                events.extend(handler_events)
+        # Days the current food stock fully covers cannot produce shortage
+        # events, so their consumption is deducted in one step and the
+        # per-tick handler only runs once food may run out. The default
+        # handlers never touch food or population; custom ones might, so
+        # with those registered every day is consumed on its own tick
+        if self._has_custom_handlers:
+            quiet_days = 0
+        else:
+            daily_food = self._daily_food_consumption()
+            quiet_days = max(0, min(days, ws.resources.food // daily_food))
+            ws.resources.food -= quiet_days * daily_food
+        new_tick = old_tick + days
+        
+        # Build the schedule of handler calls that are actually due, ordered
+        # by tick and then registration order (consumption always first)
+        due: list[tuple[int, int, TickHandler]] = [
+            (tick, -1, self._handle_resource_consumption)
+            for tick in range(old_tick + quiet_days + 1, new_tick + 1)
+        ]
+        for order, (period, offset, handler) in enumerate(self._tick_handlers):
+            first = old_tick + 1 + (offset - old_tick - 1) % period
+            due.extend((tick, order, handler) for tick in range(first, new_tick + 1, period))
+        due.sort(key=lambda item: item[:2])
+        
+        add_events = events.extend
+        for tick, _, handler in due:
+            ws.current_tick = tick
+            add_events(handler(tick))
+        ws.current_tick = new_tick
         
         # Update display date
-        self.world_state.current_date = f"Day {self.world_state.current_tick + 1}"
+        ws.current_date = f"Day {ws.current_tick + 1}"
+        ws.touch()
         
         return {
             "success": True,
             "days_advanced": days,
             "old_tick": old_tick,
-            "new_tick": self.world_state.current_tick,
-            "current_date": self.world_state.current_date,
+            "new_tick": ws.current_tick,
+            "current_date": ws.current_date,
             "events_generated": len(events),
-            "events": [e.summary() for e in events],
+            "events": _LazySummaries(events),
         }
     
+    def _daily_food_consumption(self) -> int:
+        """Food eaten per day: 1 unit per 100 population, at least 1."""
+        return max(1, self.world_state.total_population // 100)
+    
     def _handle_resource_consumption(self, tick: int) -> list[Event]:
         """Handle daily resource consumption."""
         events: list[Event] = []
         ws = self.world_state
         
-        # Calculate total population
-        total_pop = sum(p.count for p in ws.populations)
-        
-        # Food consumption: 1 unit per 100 population per day
-        food_consumed = max(1, total_pop // 100)
+        food_consumed = self._daily_food_consumption()
         old_food = ws.resources.food
         
         if ws.resources.food >= food_consumed:
@@ -77,13 +172,13 @@ class TimeSystem:
             ws.resources.food = 0
             shortage = food_consumed - old_food
             
-            events.append(Event(
+            events.append(_mk_event(
                 event_type=EventType.RESOURCE_CHANGE,
                 description=f"Food shortage! {shortage} units needed but unavailable.",
                 actor="system",
                 game_tick=tick,
                 game_date=ws.current_date,
-                effects=[EventEffect(
+                effects=[_mk_eff(
                     target_type="resource",
                     field="food",
                     old_value=old_food,
@@ -92,26 +187,27 @@ class TimeSystem:
                 )],
             ))
             
-            # Reduce approval due to shortage
-            for pop in ws.populations:
-                if pop.count > 0:
-                    old_approval = pop.approval
-                    pop.approval = max(0, pop.approval - 5)
-                    if pop.approval != old_approval:
-                        events.append(Event(
-                            event_type=EventType.POPULATION_CHANGE,
-                            description=f"{pop.social_class.value} approval dropped due to food shortage",
-                            actor="system",
-                            game_tick=tick,
-                            game_date=ws.current_date,
-                            effects=[EventEffect(
-                                target_type="population",
-                                target_id=pop.social_class.value,
-                                field="approval",
-                                old_value=old_approval,
-                                new_value=pop.approval,
-                            )],
-                        ))
+            # Reduce approval due to shortage; only inhabited classes with
+            # approval left to lose can change, so skip the rest up front
+            affected = [p for p in ws.populations if p.count > 0 and p.approval > 0]
+            for pop in affected:
+                class_name = pop.social_class.value
+                old_approval = pop.approval
+                pop.approval = max(0, old_approval - _SHORTAGE_APPROVAL_PENALTY)
+                events.append(_mk_event(
+                    event_type=EventType.POPULATION_CHANGE,
+                    description=_SHORTAGE_MSG(class_name),
+                    actor="system",
+                    game_tick=tick,
+                    game_date=ws.current_date,
+                    effects=[_mk_eff(
+                        target_type="population",
+                        target_id=class_name,
+                        field="approval",
+                        old_value=old_approval,
+                        new_value=pop.approval,
+                    )],
+                ))
         
         return events
     
@@ -120,18 +216,18 @@ class TimeSystem:
         events: list[Event] = []
         ws = self.world_state
         
-        # Every 7 days, check approval and potentially trigger events
-        if tick % 7 == 0:
-            for pop in ws.populations:
-                if pop.count > 0 and pop.approval < 25:
-                    events.append(Event(
-                        event_type=EventType.INCIDENT,
-                        description=f"Unrest among the {pop.social_class.value}! Approval critically low.",
-                        actor="system",
-                        game_tick=tick,
-                        game_date=ws.current_date,
-                        metadata={"population_class": pop.social_class.value, "approval": pop.approval},
-                    ))
+        # Runs every 7 days: check approval and potentially trigger events
+        for pop in ws.populations:
+            if pop.count > 0 and pop.approval < _UNREST_APPROVAL:
+                class_name = pop.social_class.value
+                events.append(_mk_event(
+                    event_type=EventType.INCIDENT,
+                    description=_UNREST_MSG(class_name),
+                    actor="system",
+                    game_tick=tick,
+                    game_date=ws.current_date,
+                    metadata={"population_class": class_name, "approval": pop.approval},
+                ))
         
         return events
     
@@ -140,28 +236,27 @@ class TimeSystem:
         events: list[Event] = []
         ws = self.world_state
         
-        # Every 30 days, infrastructure decays slightly
-        if tick % 30 == 0:
-            for infra in ws.infrastructure:
-                if infra.condition > 0:
-                    old_condition = infra.condition
-                    infra.condition = max(0, infra.condition - 5)
-                    
-                    if infra.condition < 50 and old_condition >= 50:
-                        events.append(Event(
-                            event_type=EventType.INFRASTRUCTURE_CHANGE,
-                            description=f"{infra.name} is deteriorating and needs repairs.",
-                            actor="system",
-                            game_tick=tick,
-                            game_date=ws.current_date,
-                            effects=[EventEffect(
-                                target_type="infrastructure",
-                                target_id=infra.id,
-                                field="condition",
-                                old_value=old_condition,
-                                new_value=infra.condition,
-                            )],
-                        ))
+        # Runs every 30 days: infrastructure decays slightly
+        for infra in [i for i in ws.infrastructure if i.condition > 0]:
+            old_condition = infra.condition
+            infra.condition = max(0, old_condition - _DECAY_PER_MONTH)
+            
+            # Only rows that just crossed the warning line produce an event
+            if old_condition in _DECAY_WARNING_BAND:
+                events.append(_mk_event(
+                    event_type=EventType.INFRASTRUCTURE_CHANGE,
+                    description=f"{infra.name} is deteriorating and needs repairs.",
+                    actor="system",
+                    game_tick=tick,
+                    game_date=ws.current_date,
+                    effects=[_mk_eff(
+                        target_type="infrastructure",
+                        target_id=infra.id,
+                        field="condition",
+                        old_value=old_condition,
+                        new_value=infra.condition,
+                    )],
+                ))
         
         return events
     
@@ -1,92 +1,157 @@
 """Validation pipeline for state changes - prevents slop and contradictions."""
 
 from __future__ import annotations
-from typing import TYPE_CHECKING, Any, Optional
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Final, Optional
 import re
 import json
+import threading
 
 if TYPE_CHECKING:
-    from src.models.world_state import WorldState
+    from src.models.world_state import Faction, Settlement, WorldState
     from src.llm.openrouter import OpenRouterClient
 
+from src.llm.openrouter import extract_json_object
 from src.models.state_change import (
     StateChange, 
+    ChangeMetadata,
     ChangeType, 
     ValidationStatus, 
     SemanticValidation,
 )
 
 
+# Valid dot-notation: identifier segments separated by dots
+_PATH_RE = re.compile(r'^[a-z][a-z0-9_]*(\.[a-z][a-z0-9_]*)*$', re.IGNORECASE)
+
+@lru_cache(maxsize=1024)
+def _parse_path(path: str) -> Optional[tuple[str, ...]]:
+    """Split a well-formed dot path into segments, or None if it is malformed.
+    
+    Memoized so batches that touch the same paths run the regex once per
+    distinct path.
+    """
+    if not _PATH_RE.match(path):
+        return None
+    return tuple(path.split("."))
+
+
+# Valid top-level prefixes for extensions
+_VALID_PREFIXES = frozenset({
+    "advisors",    # Advisor-related state
+    "factions",    # Faction-related state
+    "settlements", # Settlement-related state
+    "terrain",     # Terrain-related state
+    "plots",       # Ongoing plots/schemes
+    "relationships", # Relationships between entities
+    "conditions",  # Current conditions/situations
+    "history",     # Historical events/facts
+    "rules",       # Dynamic game rules
+    "secrets",     # Hidden information
+    "rumors",      # Unconfirmed information
+})
+_VALID_ADVISORS = frozenset({"steward", "marshal", "chancellor"})
+
+# Suggestion text for rejected prefixes/references, built once
+_VALID_PREFIXES_SUGGESTION = "Use one of: " + ", ".join(sorted(_VALID_PREFIXES))
+_VALID_ADVISORS_SUGGESTION = "Use one of: steward, marshal, chancellor"
+
+# Observations, rumors and history appends skip semantic validation
+_LOW_RISK_PREFIXES = frozenset({"rumors", "conditions", "history"})
+
+# Shared encoder for prompt context; json.dumps(default=...) would build a
+# new JSONEncoder on every call
+_ENC = json.JSONEncoder(default=str).encode
+# Order-independent encoding of values for cache keys
+_CANONICAL = json.JSONEncoder(default=str, sort_keys=True).encode
+
+# Max semantic verdicts remembered per validator
+_VERDICT_CACHE_SIZE = 1024
+
+# Approved changes scoring below this are rejected anyway
+_MIN_QUALITY_SCORE: Final = 60
+
+# Max concurrent LLM validations in ValidationPipeline.validate_batch
+_SEMANTIC_WORKERS = 8
+
+# Cache marker for "not looked up yet" (None means looked up and not found)
+_MISSING = object()
+
+
 class StructuralValidator:
     """Stage 1: Validates structure, types, and references."""
     
     # Valid top-level prefixes for extensions
-    VALID_PREFIXES = {
-        "advisors",    # Advisor-related state
-        "factions",    # Faction-related state
-        "settlements", # Settlement-related state
-        "terrain",     # Terrain-related state
-        "plots",       # Ongoing plots/schemes
-        "relationships", # Relationships between entities
-        "conditions",  # Current conditions/situations
-        "history",     # Historical events/facts
-        "rules",       # Dynamic game rules
-        "secrets",     # Hidden information
-        "rumors",      # Unconfirmed information
-    }
+    VALID_PREFIXES = _VALID_PREFIXES
     
     def __init__(self, world_state: "WorldState"):
         self.world_state = world_state
+        # Resolved entity refs from paths, e.g. "house_of_x" -> Faction or None
+        self._faction_cache: dict[str, Optional[Faction]] = {}
+        self._settlement_cache: dict[str, Optional[Settlement]] = {}
+        self._entity_cache_key: Optional[tuple] = None
+    
+    def invalidate_cache(self) -> None:
+        """Forget resolved faction/settlement references."""
+        self._faction_cache.clear()
+        self._settlement_cache.clear()
+        self._entity_cache_key = None
+    
+    def _check_entity_cache(self) -> None:
+        """Drop cached references if the world's entity lists may have changed."""
+        ws = self.world_state
+        key = (ws.state_version, id(ws.factions), len(ws.factions), id(ws.settlements), len(ws.settlements))
+        if key != self._entity_cache_key:
+            self.invalidate_cache()
+            self._entity_cache_key = key
+    
+    def _resolve_faction(self, entity_ref: str) -> Optional[Faction]:
+        """Find a faction by path segment, also trying underscores as spaces."""
+        faction = self._faction_cache.get(entity_ref, _MISSING)
+        if faction is _MISSING:
+            ws = self.world_state
+            faction = ws.get_faction(entity_ref) or ws.get_faction(entity_ref.replace("_", " "))
+            self._faction_cache[entity_ref] = faction
+        return faction
+    
+    def _resolve_settlement(self, entity_ref: str) -> Optional[Settlement]:
+        """Find a settlement by path segment, also trying underscores as spaces."""
+        settlement = self._settlement_cache.get(entity_ref, _MISSING)
+        if settlement is _MISSING:
+            ws = self.world_state
+            settlement = ws.get_settlement(entity_ref) or ws.get_settlement(entity_ref.replace("_", " "))
+            self._settlement_cache[entity_ref] = settlement
+        return settlement
     
     def validate(self, change: StateChange) -> bool:
-        """Run structural validation. Returns True if passed."""
-        change.validation_issues = []  # Clear previous issues
-        
-        # 1. Check path format
-        if not self._validate_path_format(change):
-            change.status = ValidationStatus.REJECTED_STRUCTURAL
-            return False
-        
-        # 2. Check path prefix is valid
-        if not self._validate_path_prefix(change):
-            change.status = ValidationStatus.REJECTED_STRUCTURAL
-            return False
-        
-        # 3. Check references exist
-        if not self._validate_references(change):
-            change.status = ValidationStatus.REJECTED_STRUCTURAL
-            return False
-        
-        # 4. Check type consistency
-        if not self._validate_type_consistency(change):
-            change.status = ValidationStatus.REJECTED_STRUCTURAL
-            return False
-        
-        # 5. Check value quality (basic slop detection)
-        if not self._validate_value_quality(change):
-            # This is a warning, not an error
-            pass
+        """Run structural validation. Returns True if passed.
         
-        change.status = ValidationStatus.PASSED_STRUCTURAL
-        return True
-    
-    def _validate_path_format(self, change: StateChange) -> bool:
-        """Check that the path is valid dot-notation."""
+        All stages run inline in one body, with the path, its parts and
+        the issue recorder held in locals.
+        """
+        change.validation_issues = []  # Clear previous issues
+        add_issue = change.add_issue
         path = change.path
+        change_type = change.change_type
         
+        # 1. Check path format
         if not path:
-            change.add_issue(
+            add_issue(
                 stage="structural",
                 severity="error",
                 code="EMPTY_PATH",
                 message="Path cannot be empty",
             )
+            change.status = ValidationStatus.REJECTED_STRUCTURAL
             return False
         
         # Must be valid identifier segments separated by dots
-        pattern = r'^[a-z][a-z0-9_]*(\.[a-z][a-z0-9_]*)*$'
-        if not re.match(pattern, path, re.IGNORECASE):
-            change.add_issue(
+        parts = _parse_path(path)
+        if parts is None:
+            add_issue(
                 stage="structural",
                 severity="error",
                 code="INVALID_PATH_FORMAT",
@@ -94,159 +159,177 @@ class StructuralValidator:
                 path=path,
                 suggestion="Use format like 'advisors.marshal.resentment.incident_name'",
             )
+            change.status = ValidationStatus.REJECTED_STRUCTURAL
             return False
         
-        return True
-    
-    def _validate_path_prefix(self, change: StateChange) -> bool:
-        """Check that the path starts with a valid prefix."""
-        if change.change_type == ChangeType.ADD_RULE:
-            return True  # Rules don't need path validation
-        
-        prefix = change.path.split(".")[0]
+        prefix = parts[0]
         
-        if prefix not in self.VALID_PREFIXES:
-            change.add_issue(
+        # 2. Check path prefix is valid (rules don't need path validation)
+        if change_type != ChangeType.ADD_RULE and prefix not in _VALID_PREFIXES:
+            add_issue(
                 stage="structural",
                 severity="error",
                 code="INVALID_PREFIX",
                 message=f"Path prefix '{prefix}' is not valid",
-                path=change.path,
-                suggestion=f"Use one of: {', '.join(sorted(self.VALID_PREFIXES))}",
+                path=path,
+                suggestion=_VALID_PREFIXES_SUGGESTION,
             )
+            change.status = ValidationStatus.REJECTED_STRUCTURAL
             return False
         
-        return True
-    
-    def _validate_references(self, change: StateChange) -> bool:
-        """Check that referenced entities exist."""
-        path_parts = change.path.split(".")
-        
-        if len(path_parts) < 2:
-            return True
-        
-        prefix = path_parts[0]
-        entity_ref = path_parts[1]
+        # 3. Check references exist
+        if len(parts) >= 2:
+            entity_ref = parts[1]
+            
+            if prefix == "advisors":
+                if entity_ref not in _VALID_ADVISORS:
+                    add_issue(
+                        stage="structural",
+                        severity="error",
+                        code="INVALID_ADVISOR_REF",
+                        message=f"Unknown advisor '{entity_ref}'",
+                        path=path,
+                        suggestion=_VALID_ADVISORS_SUGGESTION,
+                    )
+                    change.status = ValidationStatus.REJECTED_STRUCTURAL
+                    return False
+            
+            elif prefix == "factions":
+                self._check_entity_cache()
+                if not self._resolve_faction(entity_ref):
+                    # This is a warning - we might be creating info about a new faction
+                    add_issue(
+                        stage="structural",
+                        severity="warning",
+                        code="UNKNOWN_FACTION_REF",
+                        message=f"Faction '{entity_ref}' not found in world state",
+                        path=path,
+                        suggestion="This might be intentional if creating info about an external faction",
+                    )
+            
+            elif prefix == "settlements":
+                self._check_entity_cache()
+                if not self._resolve_settlement(entity_ref):
+                    add_issue(
+                        stage="structural",
+                        severity="warning",
+                        code="UNKNOWN_SETTLEMENT_REF",
+                        message=f"Settlement '{entity_ref}' not found in world state",
+                        path=path,
+                    )
         
-        # Check advisor references
-        if prefix == "advisors":
-            valid_advisors = {"steward", "marshal", "chancellor"}
-            if entity_ref not in valid_advisors:
-                change.add_issue(
+        if change_type != ChangeType.DELETE_EXTENSION:
+            value = change.new_value
+            
+            # 4. Check type consistency: don't overwrite a dict with a primitive.
+            # A dict may replace anything, so only non-dict values need the lookup.
+            if not isinstance(value, dict) and isinstance(self.world_state.get_extension(path), dict):
+                add_issue(
                     stage="structural",
                     severity="error",
-                    code="INVALID_ADVISOR_REF",
-                    message=f"Unknown advisor '{entity_ref}'",
-                    path=change.path,
-                    suggestion=f"Use one of: {', '.join(valid_advisors)}",
+                    code="TYPE_MISMATCH",
+                    message=f"Cannot replace dict at '{path}' with non-dict value",
+                    path=path,
+                    suggestion="Use a dict value or delete the existing data first",
                 )
+                change.status = ValidationStatus.REJECTED_STRUCTURAL
                 return False
-        
-        # Check faction references
-        elif prefix == "factions":
-            faction = self.world_state.get_faction(entity_ref)
-            # Also check by converting underscores to spaces
-            if not faction:
-                faction_name = entity_ref.replace("_", " ")
-                faction = self.world_state.get_faction(faction_name)
             
-            if not faction:
-                # This is a warning - we might be creating info about a new faction
-                change.add_issue(
+            # 5. Check value quality (basic slop detection); warnings only
+            if value is None or (isinstance(value, (str, dict, list, tuple)) and not value):
+                add_issue(
                     stage="structural",
                     severity="warning",
-                    code="UNKNOWN_FACTION_REF",
-                    message=f"Faction '{entity_ref}' not found in world state",
-                    path=change.path,
-                    suggestion="This might be intentional if creating info about an external faction",
+                    code="EMPTY_VALUE",
+                    message="Value is empty or meaningless",
+                    suggestion="Provide a meaningful value with context",
                 )
-        
-        # Check settlement references
-        elif prefix == "settlements":
-            settlement = self.world_state.get_settlement(entity_ref)
-            if not settlement:
-                settlement_name = entity_ref.replace("_", " ")
-                settlement = self.world_state.get_settlement(settlement_name)
-            
-            if not settlement:
-                change.add_issue(
+            elif not change.reason or len(change.reason) < 10:
+                add_issue(
                     stage="structural",
                     severity="warning",
-                    code="UNKNOWN_SETTLEMENT_REF",
-                    message=f"Settlement '{entity_ref}' not found in world state",
-                    path=change.path,
+                    code="MISSING_REASON",
+                    message="Reason is missing or too short",
+                    suggestion="Provide a detailed reason for this change",
                 )
         
+        change.status = ValidationStatus.PASSED_STRUCTURAL
         return True
     
-    def _validate_type_consistency(self, change: StateChange) -> bool:
-        """Check that we're not overwriting a dict with a primitive or vice versa."""
-        if change.change_type == ChangeType.DELETE_EXTENSION:
-            return True
-        
-        existing = self.world_state.get_extension(change.path)
-        
-        if existing is not None:
-            # Check type consistency
-            existing_is_dict = isinstance(existing, dict)
-            new_is_dict = isinstance(change.new_value, dict)
-            
-            if existing_is_dict and not new_is_dict:
-                change.add_issue(
-                    stage="structural",
-                    severity="error",
-                    code="TYPE_MISMATCH",
-                    message=f"Cannot replace dict at '{change.path}' with non-dict value",
-                    path=change.path,
-                    suggestion="Use a dict value or delete the existing data first",
-                )
-                return False
-        
-        return True
-    
-    def _validate_value_quality(self, change: StateChange) -> bool:
-        """Basic quality checks on the value being set."""
-        if change.change_type == ChangeType.DELETE_EXTENSION:
-            return True
-        
-        value = change.new_value
-        
-        # Check for empty/meaningless values
-        if value is None or value == "" or value == {}:
-            change.add_issue(
-                stage="structural",
-                severity="warning",
-                code="EMPTY_VALUE",
-                message="Value is empty or meaningless",
-                suggestion="Provide a meaningful value with context",
-            )
-            return False
-        
-        # Check for required reason
-        if not change.reason or len(change.reason) < 10:
-            change.add_issue(
-                stage="structural",
-                severity="warning",
-                code="MISSING_REASON",
-                message="Reason is missing or too short",
-                suggestion="Provide a detailed reason for this change",
-            )
-        
-        return True
+    def validate_batch(self, changes: list[StateChange]) -> list[bool]:
+        """Run structural validation over many changes, in order.
+        
+        Path parsing is memoized per distinct path and entity references
+        are cached per validator, so repeated paths in a batch cost a few
+        dict lookups each.
+        """
+        validate = self.validate
+        return [validate(change) for change in changes]
 
 
 class SemanticValidator:
     """Stage 2: LLM-powered validation for consistency and quality."""
     
     # Quality thresholds
-    MIN_QUALITY_SCORE = 60
+    MIN_QUALITY_SCORE = _MIN_QUALITY_SCORE
     
     def __init__(self, llm: "OpenRouterClient", world_state: "WorldState"):
         self.llm = llm
         self.world_state = world_state
+        # Rendered world context per path prefix, for the current state_version
+        self._ctx_cache: dict[tuple[int, str], str] = {}
+        # Recent verdicts: key -> (validation, approved), least recent first
+        self._verdicts: OrderedDict[tuple, tuple[SemanticValidation, bool]] = OrderedDict()
+        # Guards both caches; validate_batch calls validate from worker threads
+        self._lock = threading.Lock()
     
     def validate(self, change: StateChange) -> bool:
-        """Run semantic validation using LLM. Returns True if passed."""
+        """Run semantic validation using LLM. Returns True if passed.
+        
+        Verdicts are cached per (change, state_version), so re-validating an
+        identical change against an unchanged world skips the LLM call.
+        """
+        cache_key = self._verdict_key(change)
+        with self._lock:
+            cached = self._verdicts.get(cache_key)
+            if cached is not None:
+                self._verdicts.move_to_end(cache_key)
+        if cached is not None:
+            validation, approved = cached
+            return self._apply_verdict(change, validation.model_copy(deep=True), approved)
+        
+        try:
+            validation, approved = self._request_verdict(change)
+        except Exception as e:
+            change.add_issue(
+                stage="semantic",
+                severity="error",
+                code="VALIDATION_ERROR",
+                message=f"Semantic validation failed: {str(e)}",
+            )
+            change.status = ValidationStatus.REJECTED_SEMANTIC
+            return False
+        
+        with self._lock:
+            self._verdicts[cache_key] = (validation.model_copy(deep=True), approved)
+            if len(self._verdicts) > _VERDICT_CACHE_SIZE:
+                self._verdicts.popitem(last=False)
+        return self._apply_verdict(change, validation, approved)
+    
+    def _verdict_key(self, change: StateChange) -> tuple:
+        """Cache key covering everything the validation prompt depends on."""
+        return (
+            self.world_state.state_version,
+            change.change_type,
+            change.path,
+            _CANONICAL(change.new_value),
+            _CANONICAL(change.old_value),
+            change.reason,
+            change.proposed_by,
+        )
+    
+    def _request_verdict(self, change: StateChange) -> tuple[SemanticValidation, bool]:
+        """Ask the LLM to validate a change."""
         from src.llm.openrouter import ModelTier
         
         # Build context for validation
@@ -285,74 +368,100 @@ Respond with a JSON object matching this schema:
 
 Check for contradictions, consistency, and quality. Be strict - reject slop."""
 
-        try:
-            response = self.llm.chat(
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": user_prompt},
-                ],
-                tier=ModelTier.ORCHESTRATOR,
-                temperature=0.2,
-                max_tokens=1500,
-            )
-            
-            # Parse response
-            result = self._parse_validation_response(response.content)
-            
-            # Create SemanticValidation object
-            validation = SemanticValidation(
-                is_consistent=result.get("is_consistent", False),
-                is_specific=result.get("is_specific", False),
-                has_contradictions=result.get("has_contradictions", False),
-                contradictions=result.get("contradictions", []),
-                quality_score=result.get("quality_score", 0),
-                quality_issues=result.get("quality_issues", []),
-                cascading_effects=result.get("cascading_effects", []),
-                reasoning=result.get("reasoning", ""),
+        response = self.llm.chat(
+            messages=[
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": user_prompt},
+            ],
+            tier=ModelTier.ORCHESTRATOR,
+            temperature=0.2,
+            max_tokens=1500,
+        )
+        
+        # Parse response
+        result = self._parse_validation_response(response.content)
+        
+        # Create SemanticValidation object
+        validation = SemanticValidation(
+            is_consistent=result.get("is_consistent", False),
+            is_specific=result.get("is_specific", False),
+            has_contradictions=result.get("has_contradictions", False),
+            contradictions=result.get("contradictions", []),
+            quality_score=result.get("quality_score", 0),
+            quality_issues=result.get("quality_issues", []),
+            cascading_effects=result.get("cascading_effects", []),
+            reasoning=result.get("reasoning", ""),
+        )
+        
+        approved = result.get("approved", False)
+        # Enforce the quality floor when the validator reported a score
+        score = result.get("quality_score")
+        if approved and isinstance(score, (int, float)) and score < _MIN_QUALITY_SCORE:
+            approved = False
+            validation.quality_issues.append(
+                f"Quality score {score} is below the minimum of {_MIN_QUALITY_SCORE}"
             )
-            
-            change.semantic_validation = validation
-            
-            # Determine pass/fail
-            approved = result.get("approved", False)
-            
-            if not approved:
-                # Add issues based on validation result
-                if validation.has_contradictions:
-                    for contradiction in validation.contradictions:
-                        change.add_issue(
-                            stage="semantic",
-                            severity="error",
-                            code="CONTRADICTION",
-                            message=contradiction,
-                        )
-                
-                for issue in validation.quality_issues:
+        
+        return validation, approved
+    
+    def _apply_verdict(self, change: StateChange, validation: SemanticValidation, approved: bool) -> bool:
+        """Record a verdict on the change and set its status."""
+        change.semantic_validation = validation
+        
+        if not approved:
+            # Add issues based on validation result
+            if validation.has_contradictions:
+                for contradiction in validation.contradictions:
                     change.add_issue(
                         stage="semantic",
                         severity="error",
-                        code="QUALITY_ISSUE",
-                        message=issue,
+                        code="CONTRADICTION",
+                        message=contradiction,
                     )
-                
-                change.status = ValidationStatus.REJECTED_SEMANTIC
-                return False
             
-            change.status = ValidationStatus.PASSED_SEMANTIC
-            return True
+            for issue in validation.quality_issues:
+                change.add_issue(
+                    stage="semantic",
+                    severity="error",
+                    code="QUALITY_ISSUE",
+                    message=issue,
+                )
             
-        except Exception as e:
-            change.add_issue(
-                stage="semantic",
-                severity="error",
-                code="VALIDATION_ERROR",
-                message=f"Semantic validation failed: {str(e)}",
-            )
             change.status = ValidationStatus.REJECTED_SEMANTIC
             return False
+        
+        change.status = ValidationStatus.PASSED_SEMANTIC
+        return True
     
     def _build_validation_context(self, change: StateChange) -> str:
         """Build context string for validation prompt."""
+        # The world part only depends on the state and the path prefix, so it
+        # is rendered once per state_version and reused across changes
+        prefix = change.path.split(".")[0]
+        key = (self.world_state.state_version, prefix)
+        with self._lock:
+            world_context = self._ctx_cache.get(key)
+            if world_context is None:
+                if any(cached_version != key[0] for cached_version, _ in self._ctx_cache):
+                    self._ctx_cache.clear()
+                world_context = self._ctx_cache[key] = self._render_world_context(prefix)
+        
+        # The proposed change
+        context = (
+            f"{world_context}\n"
+            f"PROPOSED CHANGE:\n"
+            f"  Type: {change.change_type.value}\n"
+            f"  Path: {change.path}\n"
+            f"  New Value: {change.new_value_json}\n"
+            f"  Reason: {change.reason}\n"
+            f"  Proposed by: {change.proposed_by}"
+        )
+        if change.old_value is not None:
+            context += f"\n  Old Value: {change.old_value_json}"
+        return context
+    
+    def _render_world_context(self, prefix: str) -> str:
+        """Render the world summary, extensions under prefix, and active rules."""
         lines = []
         
         # Current world state summary
@@ -361,13 +470,10 @@ Check for contradictions, consistency, and quality. Be strict - reject slop."""
         lines.append("")
         
         # Relevant existing extensions
-        prefix = change.path.split(".")[0]
-        existing_paths = self.world_state.list_extensions(prefix)
-        if existing_paths:
+        existing = self.world_state.list_extensions_with_values(prefix)
+        if existing:
             lines.append(f"EXISTING {prefix.upper()} EXTENSIONS:")
-            for path in existing_paths[:20]:
-                value = self.world_state.get_extension(path)
-                lines.append(f"  {path}: {json.dumps(value, default=str)[:100]}")
+            lines.extend(f"  {path}: {_ENC(value)[:100]}" for path, value in existing[:20])
             lines.append("")
         
         # Active rules that might be relevant
@@ -378,17 +484,6 @@ Check for contradictions, consistency, and quality. Be strict - reject slop."""
                 lines.append(f"  • {rule.trigger} → {rule.effect}")
             lines.append("")
         
-        # The proposed change
-        lines.append("PROPOSED CHANGE:")
-        lines.append(f"  Type: {change.change_type.value}")
-        lines.append(f"  Path: {change.path}")
-        lines.append(f"  New Value: {json.dumps(change.new_value, default=str)}")
-        lines.append(f"  Reason: {change.reason}")
-        lines.append(f"  Proposed by: {change.proposed_by}")
-        
-        if change.old_value is not None:
-            lines.append(f"  Old Value: {json.dumps(change.old_value, default=str)}")
-        
         return "\n".join(lines)
     
     def _parse_validation_response(self, content: str) -> dict[str, Any]:
@@ -396,14 +491,9 @@ Check for contradictions, consistency, and quality. Be strict - reject slop."""
         if not content:
             return {"approved": False, "reasoning": "No response from validator"}
         
-        try:
-            # Try to find JSON in the response
-            import re
-            json_match = re.search(r'\{[\s\S]*\}', content)
-            if json_match:
-                return json.loads(json_match.group())
-        except json.JSONDecodeError:
-            pass
+        result = extract_json_object(content)
+        if isinstance(result, dict):
+            return result
         
         # Fallback: assume rejection if we can't parse
         return {
@@ -423,43 +513,101 @@ class ValidationPipeline:
         # Configuration
         self.require_semantic_validation = True
         self.auto_approve_low_risk = True
+        
+        # Hashes of changes the semantic stage approved, including the data
+        # they targeted at the time; never evicted
+        self._approved_hashes: set[int] = set()
     
     def validate(self, change: StateChange, skip_semantic: bool = False) -> bool:
         """Run the full validation pipeline."""
+        approval_hash = self._pre_semantic(change, skip_semantic)
+        if approval_hash is None:
+            return change.is_approved()
+        return self._run_semantic(change, approval_hash)
+    
+    def validate_batch(self, changes: list[StateChange], skip_semantic: bool = False) -> list[bool]:
+        """Validate several changes, overlapping their LLM round-trips.
+        
+        Structural checks run inline; changes that still need semantic
+        validation are sent to a thread pool so their LLM calls are in
+        flight together. Results are returned in input order.
+        
+        Every change is checked against the current state, none of the
+        others applied, so callers must not batch changes that depend on
+        each other (e.g. two writes to the same path).
+        """
+        results = [False] * len(changes)
+        pending: list[tuple[int, int]] = []
+        for i, change in enumerate(changes):
+            approval_hash = self._pre_semantic(change, skip_semantic)
+            if approval_hash is None:
+                results[i] = change.is_approved()
+            else:
+                pending.append((i, approval_hash))
+        
+        if len(pending) == 1:
+            i, approval_hash = pending[0]
+            results[i] = self._run_semantic(changes[i], approval_hash)
+        elif pending:
+            workers = min(_SEMANTIC_WORKERS, len(pending))
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="validate") as pool:
+                futures = {
+                    pool.submit(self._run_semantic, changes[i], approval_hash): i
+                    for i, approval_hash in pending
+                }
+                for future in as_completed(futures):
+                    results[futures[future]] = future.result()
+        
+        return results
+    
+    def _pre_semantic(self, change: StateChange, skip_semantic: bool) -> Optional[int]:
+        """Run every check before the LLM stage.
+        
+        Returns the change's approval hash if it still needs semantic
+        validation; otherwise None, with change.status already final.
+        """
         # Stage 1: Structural
         if not self.structural.validate(change):
-            return False
+            return None
         
         # Check if we can skip semantic validation
-        if skip_semantic or not self.require_semantic_validation:
+        if skip_semantic or not self.require_semantic_validation or not self.semantic:
             change.status = ValidationStatus.APPROVED
-            return True
+            return None
         
         # Check for low-risk auto-approval
         if self.auto_approve_low_risk and self._is_low_risk(change):
             change.status = ValidationStatus.APPROVED
-            return True
+            return None
         
-        # Stage 2: Semantic
-        if self.semantic:
-            if not self.semantic.validate(change):
-                return False
-        
-        # All passed
+        # Skip the LLM if this exact change to this exact data was approved before
+        approval_hash = self._approval_hash(change)
+        if approval_hash in self._approved_hashes:
+            change.status = ValidationStatus.APPROVED
+            return None
+        return approval_hash
+    
+    def _run_semantic(self, change: StateChange, approval_hash: int) -> bool:
+        """Stage 2: semantic validation, remembering approvals."""
+        if not self.semantic.validate(change):
+            return False
+        self._approved_hashes.add(approval_hash)
         change.status = ValidationStatus.APPROVED
         return True
     
+    def _approval_hash(self, change: StateChange) -> int:
+        """Hash of a change's body and the current value at its path."""
+        return hash((
+            change.change_type,
+            change.path,
+            _CANONICAL(change.new_value),
+            _CANONICAL(self.world_state.get_extension(change.path)),
+        ))
+    
     def _is_low_risk(self, change: StateChange) -> bool:
         """Check if a change is low-risk and can skip semantic validation."""
-        # Observations and rumors are low-risk
-        if change.path.startswith("rumors.") or change.path.startswith("conditions."):
-            return True
-        
-        # Appending to history is low-risk
-        if change.path.startswith("history."):
-            return True
-        
-        return False
+        head, dot, _ = change.path.partition(".")
+        return bool(dot) and head in _LOW_RISK_PREFIXES
     
     def apply_if_valid(self, change: StateChange) -> bool:
         """Validate and apply a change if it passes."""
@@ -473,19 +621,19 @@ class ValidationPipeline:
         if not change.is_approved():
             return False
         
-        from datetime import datetime
+        now = datetime.now()
         
         if change.change_type == ChangeType.SET_EXTENSION:
             # Store old value for rollback
             change.old_value = self.world_state.get_extension(change.path)
             
             # Apply the change with metadata
-            metadata = {
-                "change_id": change.id,
-                "proposed_by": change.proposed_by,
-                "reason": change.reason,
-                "applied_at": datetime.now().isoformat(),
-            }
+            metadata = ChangeMetadata(
+                change_id=change.id,
+                proposed_by=change.proposed_by,
+                reason=change.reason,
+                applied_at=now.isoformat(),
+            )
             self.world_state.set_extension(change.path, change.new_value, metadata)
             
         elif change.change_type == ChangeType.DELETE_EXTENSION:
@@ -501,22 +649,27 @@ class ValidationPipeline:
                     created_by=change.proposed_by,
                 )
         
-        change.applied_at = datetime.now()
+        change.applied_at = now
         
         # Process cascading effects
         if change.semantic_validation and change.semantic_validation.cascading_effects:
+            validate = self.validate
+            apply = self.apply
+            record = change.cascaded_changes.append
+            parent_id = change.id
+            default_reason = f"Cascaded from {parent_id}"
             for effect in change.semantic_validation.cascading_effects:
+                get = effect.get
                 cascade = StateChange(
                     change_type=ChangeType.SET_EXTENSION,
-                    path=effect.get("path", ""),
-                    new_value=effect.get("value"),
-                    reason=effect.get("reason", f"Cascaded from {change.id}"),
+                    path=get("path", ""),
+                    new_value=get("value"),
+                    reason=get("reason", default_reason),
                     proposed_by="system",
-                    triggered_by=change.id,
+                    triggered_by=parent_id,
                 )
                 # Validate and apply cascading changes (skip semantic to avoid infinite loop)
-                if self.validate(cascade, skip_semantic=True):
-                    self.apply(cascade)
-                    change.cascaded_changes.append(cascade.id)
+                if validate(cascade, skip_semantic=True) and apply(cascade):
+                    record(cascade.id)
         
         return True
@@ -1,7 +1,12 @@
 """Tool handler implementations - actual logic for each tool."""
 
 from __future__ import annotations
-from typing import Any, TYPE_CHECKING
+from collections import deque
+from datetime import datetime
+from typing import Any, Callable, TYPE_CHECKING
+import threading
+
+from pydantic import TypeAdapter
 
 if TYPE_CHECKING:
     from src.models.world_state import WorldState
@@ -10,8 +15,37 @@ if TYPE_CHECKING:
     from src.systems.event_log import EventLog as EventLogSystem
 
 from src.models.claims import Claim, ClaimStatus, ClaimType, ClaimProposal, ClaimEvidence
-from src.models.actions import ActionSpec, ActionType, ActionProposal
-from src.models.events import Event, EventType
+from src.models.actions import ActionSpec, ActionType, ActionProposal, ActionEffect
+from src.models.events import Event, EventType, EventEffect
+from src.models.world_state import Settlement, SettlementType, Terrain, TerrainType, Faction
+
+
+# Buffered events are written to the log once this many are queued; every
+# public handler also flushes before it returns
+_EVENT_BATCH_SIZE = 32
+
+# ActionCost fields paid from Resources (time_days is not a resource)
+_COST_FIELDS: tuple[str, ...] = ("treasury", "food", "timber", "iron", "labor")
+
+# Events built from our own computed values skip pydantic validation;
+# log_event and propose_claim still validate what the model passes in
+_mk_event = Event.model_construct
+
+# Validates a tool call's evidence dicts in one pass
+_EVIDENCE_LIST_ADAPTER = TypeAdapter(list[ClaimEvidence])
+
+# EventType by value; log_event maps unknown types to CUSTOM
+_EVENT_TYPES: dict[str, EventType] = {t.value: t for t in EventType}
+
+# get_world_state scopes other than "full" and "claims"
+_SCOPE_DUMPERS: dict[str, Callable[["WorldState"], dict[str, Any]]] = {
+    "resources": lambda ws: {"resources": ws.resources.model_dump()},
+    "settlements": lambda ws: {"settlements": [s.model_dump() for s in ws.settlements]},
+    "factions": lambda ws: {"factions": [f.model_dump() for f in ws.factions]},
+    "populations": lambda ws: {"populations": [p.model_dump() for p in ws.populations]},
+    "terrain": lambda ws: {"terrain": [t.model_dump() for t in ws.terrain]},
+    "infrastructure": lambda ws: {"infrastructure": [i.model_dump() for i in ws.infrastructure]},
+}
 
 
 class ToolHandlers:
@@ -28,32 +62,65 @@ class ToolHandlers:
         self.claim_system = claim_system  # Can be None
         self.time_system = time_system
         self.event_log = event_log
-        self._pending_actions: list[ActionSpec] = []
+        self._actions: dict[str, ActionSpec] = {}
+        # Insertion-ordered set (dict keys) of action IDs awaiting a decision
+        self._pending_ids: dict[str, None] = {}
+        # Handlers may run on worker threads: deque appends/pops are atomic and
+        # the lock keeps concurrent flushes from interleaving batches
+        self._event_buffer: deque[Event] = deque()
+        self._flush_lock = threading.Lock()
+        # scope -> (world state_version, dump) for get_world_state
+        self._dump_cache: dict[str, tuple[int, dict[str, Any]]] = {}
+    
+    # ===== Event Buffering =====
+    
+    def _enqueue_event(self, event: Event) -> None:
+        """Queue an event for the log, writing the batch when it is full."""
+        if not self.event_log:
+            return
+        buffer = self._event_buffer
+        buffer.append(event)
+        if len(buffer) >= _EVENT_BATCH_SIZE:
+            self.flush_events()
+    
+    def flush_events(self) -> int:
+        """Write any buffered events to the log. Returns how many were written."""
+        buffer = self._event_buffer
+        if not buffer or not self.event_log:
+            return 0
+        with self._flush_lock:
+            pop = buffer.popleft
+            batch = [pop() for _ in range(len(buffer))]
+            if batch:
+                self.event_log.add_batch(batch)
+        return len(batch)
     
     def get_world_state(self, scope: str = "full") -> dict[str, Any]:
-        """Get world state (or a scoped portion)."""
+        """Get world state (or a scoped portion).
+        
+        World dumps are cached per scope until the world state is next
+        touched; treat the returned dict as read-only.
+        """
         ws = self.world_state
         
-        if scope == "full":
-            return ws.model_dump()
-        elif scope == "resources":
-            return {"resources": ws.resources.model_dump()}
-        elif scope == "settlements":
-            return {"settlements": [s.model_dump() for s in ws.settlements]}
-        elif scope == "factions":
-            return {"factions": [f.model_dump() for f in ws.factions]}
-        elif scope == "populations":
-            return {"populations": [p.model_dump() for p in ws.populations]}
-        elif scope == "terrain":
-            return {"terrain": [t.model_dump() for t in ws.terrain]}
-        elif scope == "infrastructure":
-            return {"infrastructure": [i.model_dump() for i in ws.infrastructure]}
-        elif scope == "claims":
+        if scope == "claims":
             if self.claim_system:
                 return {"claims": self.claim_system.list_claims()}
             return {"claims": []}
-        else:
-            return ws.model_dump()
+        
+        # Unknown scopes fall back to the full dump
+        dumper = _SCOPE_DUMPERS.get(scope)
+        if dumper is None:
+            scope = "full"
+        
+        version = ws.state_version
+        cached = self._dump_cache.get(scope)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+        
+        dump = dumper(ws) if dumper is not None else ws.model_dump()
+        self._dump_cache[scope] = (version, dump)
+        return dump
     
     def propose_claim(
         self,
@@ -64,6 +131,19 @@ class ToolHandlers:
         effects_on_confirm: dict[str, Any] | None = None,
     ) -> dict[str, Any]:
         """Propose a new claim about the world. In frictionless mode, applies immediately."""
+        try:
+            return self._propose_claim(claim_type, description, proposed_by, evidence, effects_on_confirm)
+        finally:
+            self.flush_events()
+    
+    def _propose_claim(
+        self,
+        claim_type: str,
+        description: str,
+        proposed_by: str,
+        evidence: list[dict[str, Any]] | None,
+        effects_on_confirm: dict[str, Any] | None,
+    ) -> dict[str, Any]:
         # If no claim system, just apply effects directly (trust the models!)
         if not self.claim_system:
             if effects_on_confirm:
@@ -74,7 +154,7 @@ class ToolHandlers:
             
             # Log if event_log exists
             if self.event_log:
-                self.event_log.add(Event(
+                self._enqueue_event(_mk_event(
                     event_type=EventType.WORLD_STATE_CHANGE,
                     description=f"World updated: {description}",
                     actor=proposed_by,
@@ -90,22 +170,16 @@ class ToolHandlers:
         
         # Legacy claim system path (if claim_system exists)
         claim_type_enum = ClaimType(claim_type)
+        ws = self.world_state
+        tick = ws.current_tick
         
-        evidence_list = []
-        if evidence:
-            for e in evidence:
-                evidence_list.append(ClaimEvidence(
-                    type=e.get("type", "observation"),
-                    description=e.get("description", ""),
-                    confidence=e.get("confidence", 50),
-                    source=e.get("source"),
-                ))
+        evidence_list = _EVIDENCE_LIST_ADAPTER.validate_python(evidence) if evidence else []
         
         claim = Claim(
             claim_type=claim_type_enum,
             description=description,
             proposed_by=proposed_by,
-            proposed_tick=self.world_state.current_tick,
+            proposed_tick=tick,
             evidence=evidence_list,
             effects_on_confirm=effects_on_confirm or {},
         )
@@ -117,12 +191,12 @@ class ToolHandlers:
         
         # Log the event
         if self.event_log:
-            self.event_log.add(Event(
+            self._enqueue_event(_mk_event(
                 event_type=EventType.CLAIM_PROPOSED if not was_auto_approved else EventType.WORLD_STATE_CHANGE,
                 description=f"Claim {'auto-confirmed' if was_auto_approved else 'proposed'}: {description}",
                 actor=proposed_by,
-                game_tick=self.world_state.current_tick,
-                game_date=self.world_state.current_date,
+                game_tick=tick,
+                game_date=ws.current_date,
                 related_claim_id=simple_id,
             ))
         
@@ -160,9 +234,10 @@ class ToolHandlers:
         else:
             claims = self.claim_system.get_pending_claims()
         
+        dump_claim = self.claim_system.dump_claim
         return {
             "count": len(claims),
-            "claims": [c.model_dump() for c in claims],
+            "claims": [dump_claim(c) for c in claims],
         }
     
     def resolve_claim(
@@ -184,23 +259,23 @@ class ToolHandlers:
             return {"success": False, "error": f"Claim '{claim_id}' already resolved"}
         
         if verdict == "confirmed":
-            claim.confirm(resolved_by, reasoning)
+            self.claim_system.set_status(claim, ClaimStatus.CONFIRMED, resolved_by, reasoning)
             # Apply effects
             if claim.effects_on_confirm:
                 self._apply_claim_effects(claim)
             event_type = EventType.CLAIM_CONFIRMED
         elif verdict == "denied":
-            claim.deny(resolved_by, reasoning)
+            self.claim_system.set_status(claim, ClaimStatus.DENIED, resolved_by, reasoning)
             event_type = EventType.CLAIM_DENIED
         elif verdict == "contested":
-            claim.contest(resolved_by, reasoning)
+            self.claim_system.set_status(claim, ClaimStatus.CONTESTED, resolved_by, reasoning)
             event_type = EventType.CLAIM_CONTESTED
         else:
             return {"success": False, "error": f"Invalid verdict: {verdict}"}
         
         # Log the event
         if self.event_log:
-            self.event_log.add(Event(
+            self._enqueue_event(_mk_event(
                 event_type=event_type,
                 description=f"Claim {verdict}: {claim.description} - {reasoning}",
                 actor=resolved_by,
@@ -209,6 +284,8 @@ class ToolHandlers:
                 related_claim_id=claim.id,
             ))
         
+        self.flush_events()
+        
         return {
             "success": True,
             "claim_id": claim_id,
@@ -222,7 +299,6 @@ class ToolHandlers:
         
         # Handle different effect types
         if "add_settlement" in effects:
-            from src.models.world_state import Settlement, SettlementType
             data = effects["add_settlement"]
             settlement = Settlement(
                 name=data.get("name", "Unknown"),
@@ -230,10 +306,9 @@ class ToolHandlers:
                 description=data.get("description"),
                 population=data.get("population", 0),
             )
-            self.world_state.settlements.append(settlement)
+            self.world_state.add_settlement(settlement)
         
         if "add_terrain" in effects:
-            from src.models.world_state import Terrain, TerrainType
             data = effects["add_terrain"]
             terrain = Terrain(
                 name=data.get("name", "Unknown"),
@@ -241,10 +316,9 @@ class ToolHandlers:
                 description=data.get("description"),
                 resources_available=data.get("resources_available", []),
             )
-            self.world_state.terrain.append(terrain)
+            self.world_state.add_terrain(terrain)
         
         if "add_faction" in effects:
-            from src.models.world_state import Faction
             data = effects["add_faction"]
             faction = Faction(
                 name=data.get("name", "Unknown"),
@@ -253,11 +327,13 @@ class ToolHandlers:
                 disposition=data.get("disposition", 50),
                 goals=data.get("goals", []),
             )
-            self.world_state.factions.append(faction)
+            self.world_state.add_faction(faction)
         
         if "modify_resources" in effects:
             for resource, amount in effects["modify_resources"].items():
                 self.world_state.resources.adjust(resource, amount)
+        
+        self.world_state.touch()
     
     def apply_action(
         self,
@@ -282,11 +358,12 @@ class ToolHandlers:
         )
         
         action_spec = proposal.to_action_spec(proposed_by)
-        self._pending_actions.append(action_spec)
+        self._actions[action_spec.id] = action_spec
+        self._pending_ids[action_spec.id] = None
         
         # Log the event
         if self.event_log:
-            self.event_log.add(Event(
+            self._enqueue_event(_mk_event(
                 event_type=EventType.ACTION_PROPOSED,
                 description=f"Action proposed: {description}",
                 actor=proposed_by,
@@ -294,6 +371,7 @@ class ToolHandlers:
                 game_date=self.world_state.current_date,
                 related_action_id=action_spec.id,
             ))
+            self.flush_events()
         
         return {
             "success": True,
@@ -307,66 +385,73 @@ class ToolHandlers:
     
     def get_pending_actions(self) -> list[ActionSpec]:
         """Get all pending actions."""
-        return [a for a in self._pending_actions if a.approved is None]
+        actions = self._actions
+        return [actions[i] for i in self._pending_ids]
     
     def approve_action(self, action_id: str, approved_by: str) -> dict[str, Any]:
         """Approve a pending action."""
-        for action in self._pending_actions:
-            if action.id == action_id:
-                action.approved = True
-                action.approved_by = approved_by
-                return self._execute_action(action)
-        return {"success": False, "error": f"Action '{action_id}' not found"}
+        action = self._actions.get(action_id)
+        if action is None:
+            return {"success": False, "error": f"Action '{action_id}' not found"}
+        
+        action.approved = True
+        action.approved_by = approved_by
+        self._pending_ids.pop(action_id, None)
+        return self._execute_action(action)
     
     def reject_action(self, action_id: str, rejected_by: str) -> dict[str, Any]:
         """Reject a pending action."""
-        for action in self._pending_actions:
-            if action.id == action_id:
-                action.approved = False
-                action.approved_by = rejected_by
-                
-                if self.event_log:
-                    self.event_log.add(Event(
-                        event_type=EventType.ACTION_REJECTED,
-                        description=f"Action rejected: {action.description}",
-                        actor=rejected_by,
-                        game_tick=self.world_state.current_tick,
-                        game_date=self.world_state.current_date,
-                        related_action_id=action.id,
-                    ))
-                
-                return {"success": True, "message": f"Action '{action_id}' rejected"}
-        return {"success": False, "error": f"Action '{action_id}' not found"}
+        action = self._actions.get(action_id)
+        if action is None:
+            return {"success": False, "error": f"Action '{action_id}' not found"}
+        
+        action.approved = False
+        action.approved_by = rejected_by
+        self._pending_ids.pop(action_id, None)
+        
+        if self.event_log:
+            self._enqueue_event(_mk_event(
+                event_type=EventType.ACTION_REJECTED,
+                description=f"Action rejected: {action.description}",
+                actor=rejected_by,
+                game_tick=self.world_state.current_tick,
+                game_date=self.world_state.current_date,
+                related_action_id=action.id,
+            ))
+        self.flush_events()
+        
+        return {"success": True, "message": f"Action '{action_id}' rejected"}
     
     def _execute_action(self, action: ActionSpec) -> dict[str, Any]:
         """Execute an approved action."""
-        from datetime import datetime
-        
-        # Deduct costs
+        # Deduct costs all at once, so nothing is spent if any resource is short
         resources = self.world_state.resources
         costs = action.costs
+        deltas = {
+            field: -amount
+            for field in _COST_FIELDS
+            if (amount := getattr(costs, field))
+        }
         
-        if costs.treasury and not resources.adjust("treasury", -costs.treasury):
-            return {"success": False, "error": "Insufficient treasury"}
-        if costs.food and not resources.adjust("food", -costs.food):
-            return {"success": False, "error": "Insufficient food"}
-        if costs.timber and not resources.adjust("timber", -costs.timber):
-            return {"success": False, "error": "Insufficient timber"}
-        if costs.iron and not resources.adjust("iron", -costs.iron):
-            return {"success": False, "error": "Insufficient iron"}
-        if costs.labor and not resources.adjust("labor", -costs.labor):
-            return {"success": False, "error": "Insufficient labor"}
+        shortfalls = resources.shortfalls(deltas)
+        if shortfalls:
+            return {
+                "success": False,
+                "error": f"Insufficient {', '.join(shortfalls)}",
+                "shortfalls": shortfalls,
+            }
+        resources.apply_deltas(deltas)
         
         # Apply effects
-        for effect in action.effects:
-            self._apply_effect(effect)
+        self._apply_effects(action.effects)
+        self.world_state.touch()
         
         action.executed = True
         action.executed_at = datetime.now()
         
         # Log the event
         if self.event_log:
-            self.event_log.add(Event(
+            self._enqueue_event(_mk_event(
                 event_type=EventType.ACTION_EXECUTED,
                 description=f"Action executed: {action.description}",
                 actor=action.approved_by or "system",
@@ -374,6 +459,7 @@ class ToolHandlers:
                 game_date=self.world_state.current_date,
                 related_action_id=action.id,
             ))
+        self.flush_events()
         
         return {
             "success": True,
@@ -381,61 +467,81 @@ class ToolHandlers:
             "message": f"Action '{action.id}' executed successfully",
         }
     
-    def _apply_effect(self, effect: Any) -> None:
-        """Apply a single action effect."""
-        from src.models.actions import ActionEffect
-        
-        if isinstance(effect, dict):
-            effect = ActionEffect(**effect)
+    def _apply_effects(self, effects: list[Any]) -> None:
+        """Apply an action's effects, writing each affected field once.
         
-        target_type = effect.target_type
+        Effects on the same target field are folded in order into a pending
+        value, so the outcome matches applying them one at a time (resource
+        deltas that would go negative are still skipped).
+        """
+        ws = self.world_state
+        # (target id, field) -> [target, pending value, changed]
+        pending: dict[tuple[int, str], list[Any]] = {}
         
-        if target_type == "resource":
-            if effect.is_delta:
-                self.world_state.resources.adjust(effect.field, effect.change)
+        for effect in effects:
+            if isinstance(effect, dict):
+                effect = ActionEffect(**effect)
+            
+            target_type = effect.target_type
+            if target_type == "resource":
+                target = ws.resources
+            elif target_type == "settlement":
+                target = ws.get_settlement(effect.target_id or "")
+            elif target_type == "faction":
+                target = ws.get_faction(effect.target_id or "")
+            else:
+                continue
+            if not target:
+                continue
+            
+            field = effect.field
+            slot = pending.get((id(target), field))
+            if slot is None:
+                # Resources.adjust() refuses unknown resources; entity deltas start from 0
+                current = getattr(target, field, None if target_type == "resource" else 0)
+                slot = pending[(id(target), field)] = [target, current, False]
+            
+            value = slot[1]
+            if not effect.is_delta:
+                value = effect.change
+            elif target_type != "resource":
+                value = value + effect.change
+            elif value is not None and value + effect.change >= 0:
+                value = value + effect.change
             else:
-                setattr(self.world_state.resources, effect.field, effect.change)
-        
-        elif target_type == "settlement":
-            settlement = self.world_state.get_settlement(effect.target_id or "")
-            if settlement:
-                if effect.is_delta:
-                    current = getattr(settlement, effect.field, 0)
-                    setattr(settlement, effect.field, current + effect.change)
-                else:
-                    setattr(settlement, effect.field, effect.change)
-        
-        elif target_type == "faction":
-            faction = self.world_state.get_faction(effect.target_id or "")
-            if faction:
-                if effect.is_delta:
-                    current = getattr(faction, effect.field, 0)
-                    setattr(faction, effect.field, current + effect.change)
-                else:
-                    setattr(faction, effect.field, effect.change)
+                continue
+            slot[1] = value
+            slot[2] = True
+        
+        for (_, field), (target, value, changed) in pending.items():
+            if changed:
+                setattr(target, field, value)
     
     def advance_time(self, days: int) -> dict[str, Any]:
         """Advance game time."""
+        ws = self.world_state
         if self.time_system:
             result = self.time_system.advance(days)
         else:
             # Manual time advance if no time system
-            self.world_state.current_tick += days
-            self.world_state.current_date = f"Day {self.world_state.current_tick + 1}"
+            ws.current_tick += days
+            ws.current_date = f"Day {ws.current_tick + 1}"
+            ws.touch()
             result = {
                 "success": True,
-                "current_tick": self.world_state.current_tick,
-                "current_date": self.world_state.current_date,
+                "current_tick": ws.current_tick,
+                "current_date": ws.current_date,
             }
         
         if self.event_log:
-            self.event_log.add(Event(
+            self._enqueue_event(_mk_event(
                 event_type=EventType.TIME_ADVANCE,
                 description=f"Time advanced by {days} days",
                 actor="player",
-                game_tick=self.world_state.current_tick,
-                game_date=self.world_state.current_date,
+                game_tick=ws.current_tick,
+                game_date=ws.current_date,
             ))
+        self.flush_events()
         
         return result
     
@@ -447,9 +553,7 @@ class ToolHandlers:
         effects: list[dict[str, Any]] | None = None,
     ) -> dict[str, Any]:
         """Log an event."""
-        from src.models.events import EventEffect
-        
-        event_type_enum = EventType(event_type) if event_type in EventType.__members__.values() else EventType.CUSTOM
+        event_type_enum = _EVENT_TYPES.get(event_type, EventType.CUSTOM)
         
         effect_objs = []
         if effects:
@@ -465,7 +569,8 @@ class ToolHandlers:
             effects=effect_objs,
         )
         
-        self.event_log.add(event)
+        self._enqueue_event(event)
+        self.flush_events()
         
         return {
             "success": True,
@@ -1,8 +1,36 @@
 """Tool registry - defines and registers all advisor tools with strict schemas."""
 
 from __future__ import annotations
+from collections import defaultdict
 from typing import Any, Callable, Optional
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
+
+
+# Roles that may call a tool unless it says otherwise. Role names are
+# identifier-like literals, which CPython already interns, so role lookups in
+# the registry's index hash and compare them cheaply without sys.intern.
+_ADVISOR_ROLES: tuple[str, ...] = ("steward", "marshal", "chancellor")
+
+# Schema fragments shared by the core tool definitions. They end up inside
+# every emitted tool schema, so never mutate them.
+_EVIDENCE_ITEM_SCHEMA: dict[str, Any] = {"type": "object", "properties": {
+    "type": {"type": "string", "description": "Type of evidence: observation, report, survey, historical, logical"},
+    "description": {"type": "string", "description": "Description of the evidence"},
+    "confidence": {"type": "integer", "description": "Confidence level 0-100"},
+}}
+
+_EFFECT_ITEM_SCHEMA: dict[str, Any] = {"type": "object", "properties": {
+    "target_type": {"type": "string"},
+    "target_id": {"type": "string"},
+    "field": {"type": "string"},
+    "change": {"type": "string"},
+    "is_delta": {"type": "boolean"},
+}}
+
+_COSTS_PROPERTIES: dict[str, Any] = {
+    field: {"type": "integer"}
+    for field in ("treasury", "food", "timber", "iron", "labor", "time_days")
+}
 
 
 class ToolParameter(BaseModel):
@@ -22,11 +50,19 @@ class Tool(BaseModel):
     name: str
     description: str
     parameters: list[ToolParameter] = Field(default_factory=list)
-    allowed_roles: list[str] = Field(default_factory=lambda: ["steward", "marshal", "chancellor"])
+    allowed_roles: list[str] = Field(default_factory=lambda: list(_ADVISOR_ROLES))
     requires_approval: bool = False
     
+    # Built on first use; tools are treated as immutable once registered
+    _openai_schema: Optional[dict[str, Any]] = PrivateAttr(default=None)
+    
     def to_openai_schema(self) -> dict[str, Any]:
-        """Convert to OpenAI function calling schema."""
+        """Convert to OpenAI function calling schema (cached; treat as read-only)."""
+        if self._openai_schema is None:
+            self._openai_schema = self._build_openai_schema()
+        return self._openai_schema
+    
+    def _build_openai_schema(self) -> dict[str, Any]:
         properties = {}
         required = []
         
@@ -62,22 +98,38 @@ class Tool(BaseModel):
 
 
 class ToolRegistry:
-    """Registry of all available tools."""
+    """Registry of all available tools.
+    
+    The core tools are registered on first use rather than at construction.
+    """
     
     def __init__(self) -> None:
         self._tools: dict[str, Tool] = {}
         self._handlers: dict[str, Callable[..., Any]] = {}
-        self._register_core_tools()
+        # role -> tools allowed for it, in registration order
+        self._role_index: defaultdict[str, list[Tool]] = defaultdict(list)
+        # role (None for all tools) -> OpenAI schemas, reset on register()
+        self._role_schemas: dict[Optional[str], list[dict[str, Any]]] = {}
+        self._core_registered = False
+    
+    def _ensure_core_tools(self) -> None:
+        if not self._core_registered:
+            self._core_registered = True
+            self._register_core_tools()
     
     def _register_core_tools(self) -> None:
-        """Register the 8 core tools."""
+        """Register the 8 core tools.
+        
+        These definitions are written by hand here, so they are built with
+        model_construct and skip pydantic validation.
+        """
         
         # 1. get_world_state
-        self.register(Tool(
+        self.register(Tool.model_construct(
             name="get_world_state",
             description="Read the current world state. Use this to understand the current situation before making proposals.",
             parameters=[
-                ToolParameter(
+                ToolParameter.model_construct(
                     name="scope",
                     type="string",
                     description="What part of the world state to retrieve",
@@ -90,33 +142,29 @@ class ToolRegistry:
         ))
         
         # 2. propose_claim
-        self.register(Tool(
+        self.register(Tool.model_construct(
             name="propose_claim",
             description="Propose a new fact about the world that is not currently in the world state. Claims must be validated before becoming canon.",
             parameters=[
-                ToolParameter(
+                ToolParameter.model_construct(
                     name="claim_type",
                     type="string",
                     description="Type of claim being made",
                     enum=["entity_exists", "entity_property", "relationship", "ownership", "resource_level", "population_state", "historical_event", "current_condition", "custom"],
                 ),
-                ToolParameter(
+                ToolParameter.model_construct(
                     name="description",
                     type="string",
                     description="Clear description of what is being claimed",
                 ),
-                ToolParameter(
+                ToolParameter.model_construct(
                     name="evidence",
                     type="array",
                     description="Evidence supporting this claim",
-                    items={"type": "object", "properties": {
-                        "type": {"type": "string", "description": "Type of evidence: observation, report, survey, historical, logical"},
-                        "description": {"type": "string", "description": "Description of the evidence"},
-                        "confidence": {"type": "integer", "description": "Confidence level 0-100"},
-                    }},
+                    items=_EVIDENCE_ITEM_SCHEMA,
                     required=False,
                 ),
-                ToolParameter(
+                ToolParameter.model_construct(
                     name="effects_on_confirm",
                     type="object",
                     description="What changes to world state if this claim is confirmed",
@@ -127,11 +175,11 @@ class ToolRegistry:
         ))
         
         # 3. list_open_claims
-        self.register(Tool(
+        self.register(Tool.model_construct(
             name="list_open_claims",
             description="List all pending claims awaiting resolution.",
             parameters=[
-                ToolParameter(
+                ToolParameter.model_construct(
                     name="status_filter",
                     type="string",
                     description="Filter by claim status",
@@ -144,22 +192,22 @@ class ToolRegistry:
         ))
         
         # 4. resolve_claim
-        self.register(Tool(
+        self.register(Tool.model_construct(
             name="resolve_claim",
             description="Resolve a pending claim. Only the Chancellor can use this tool, and only for non-controversial claims.",
             parameters=[
-                ToolParameter(
+                ToolParameter.model_construct(
                     name="claim_id",
                     type="string",
                     description="ID of the claim to resolve",
                 ),
-                ToolParameter(
+                ToolParameter.model_construct(
                     name="verdict",
                     type="string",
                     description="Resolution verdict",
                     enum=["confirmed", "denied", "contested"],
                 ),
-                ToolParameter(
+                ToolParameter.model_construct(
                     name="reasoning",
                     type="string",
                     description="Explanation for the verdict",
@@ -170,11 +218,11 @@ class ToolRegistry:
         ))
         
         # 5. apply_action
-        self.register(Tool(
+        self.register(Tool.model_construct(
             name="apply_action",
             description="Propose a structured action that modifies the world state.",
             parameters=[
-                ToolParameter(
+                ToolParameter.model_construct(
                     name="action_type",
                     type="string",
                     description="Type of action",
@@ -189,51 +237,38 @@ class ToolRegistry:
                         "custom"
                     ],
                 ),
-                ToolParameter(
+                ToolParameter.model_construct(
                     name="description",
                     type="string",
                     description="Description of the action",
                 ),
-                ToolParameter(
+                ToolParameter.model_construct(
                     name="target",
                     type="string",
                     description="Primary target of the action (settlement, faction, etc.)",
                     required=False,
                 ),
-                ToolParameter(
+                ToolParameter.model_construct(
                     name="parameters",
                     type="object",
                     description="Action-specific parameters",
                     required=False,
                 ),
-                ToolParameter(
+                ToolParameter.model_construct(
                     name="costs",
                     type="object",
                     description="Resource costs: {treasury, food, timber, iron, labor, time_days}",
-                    properties={
-                        "treasury": {"type": "integer"},
-                        "food": {"type": "integer"},
-                        "timber": {"type": "integer"},
-                        "iron": {"type": "integer"},
-                        "labor": {"type": "integer"},
-                        "time_days": {"type": "integer"},
-                    },
+                    properties=_COSTS_PROPERTIES,
                     required=False,
                 ),
-                ToolParameter(
+                ToolParameter.model_construct(
                     name="effects",
                     type="array",
                     description="Expected effects of this action",
-                    items={"type": "object", "properties": {
-                        "target_type": {"type": "string"},
-                        "target_id": {"type": "string"},
-                        "field": {"type": "string"},
-                        "change": {"type": "string"},
-                        "is_delta": {"type": "boolean"},
-                    }},
+                    items=_EFFECT_ITEM_SCHEMA,
                     required=False,
                 ),
-                ToolParameter(
+                ToolParameter.model_construct(
                     name="risks",
                     type="array",
                     description="Known risks of this action",
@@ -245,11 +280,11 @@ class ToolRegistry:
         ))
         
         # 6. advance_time
-        self.register(Tool(
+        self.register(Tool.model_construct(
             name="advance_time",
             description="Advance the game time by a number of days. This triggers time-based effects.",
             parameters=[
-                ToolParameter(
+                ToolParameter.model_construct(
                     name="days",
                     type="integer",
                     description="Number of days to advance (1-30)",
@@ -260,23 +295,23 @@ class ToolRegistry:
         ))
         
         # 7. log_event
-        self.register(Tool(
+        self.register(Tool.model_construct(
             name="log_event",
             description="Record an event or observation in the game log.",
             parameters=[
-                ToolParameter(
+                ToolParameter.model_construct(
                     name="description",
                     type="string",
                     description="Description of the event",
                 ),
-                ToolParameter(
+                ToolParameter.model_construct(
                     name="event_type",
                     type="string",
                     description="Type of event",
                     enum=["incident", "discovery", "arrival", "departure", "conflict", "resolution", "custom"],
                     required=False,
                 ),
-                ToolParameter(
+                ToolParameter.model_construct(
                     name="effects",
                     type="array",
                     description="Effects this event had",
@@ -288,16 +323,16 @@ class ToolRegistry:
         ))
         
         # 8. survey_area
-        self.register(Tool(
+        self.register(Tool.model_construct(
             name="survey_area",
             description="Conduct a survey of an area to discover information. This may reveal new facts that can be proposed as claims.",
             parameters=[
-                ToolParameter(
+                ToolParameter.model_construct(
                     name="area_name",
                     type="string",
                     description="Name or description of the area to survey",
                 ),
-                ToolParameter(
+                ToolParameter.model_construct(
                     name="survey_type",
                     type="string",
                     description="Type of survey",
@@ -305,7 +340,7 @@ class ToolRegistry:
                     default="general",
                     required=False,
                 ),
-                ToolParameter(
+                ToolParameter.model_construct(
                     name="depth",
                     type="string",
                     description="Depth of investigation",
@@ -319,16 +354,35 @@ class ToolRegistry:
     
     def register(self, tool: Tool) -> None:
         """Register a tool."""
+        self._ensure_core_tools()
+        replacing = tool.name in self._tools
         self._tools[tool.name] = tool
+        tool.to_openai_schema()
+        if replacing:
+            self._rebuild_role_index()
+        else:
+            self._index_roles(tool)
+        self._role_schemas.clear()
+    
+    def _index_roles(self, tool: Tool) -> None:
+        for role in dict.fromkeys(tool.allowed_roles):
+            self._role_index[role].append(tool)
+    
+    def _rebuild_role_index(self) -> None:
+        self._role_index.clear()
+        for tool in self._tools.values():
+            self._index_roles(tool)
     
     def set_handler(self, tool_name: str, handler: Callable[..., Any]) -> None:
         """Set the handler function for a tool."""
+        self._ensure_core_tools()
         if tool_name not in self._tools:
             raise ValueError(f"Unknown tool: {tool_name}")
         self._handlers[tool_name] = handler
     
     def get(self, name: str) -> Optional[Tool]:
         """Get a tool by name."""
+        self._ensure_core_tools()
         return self._tools.get(name)
     
     def get_handler(self, name: str) -> Optional[Callable[..., Any]]:
@@ -337,16 +391,26 @@ class ToolRegistry:
     
     def list_tools(self) -> list[Tool]:
         """List all registered tools."""
+        self._ensure_core_tools()
         return list(self._tools.values())
     
     def get_tools_for_role(self, role: str) -> list[Tool]:
         """Get tools available to a specific role."""
-        return [t for t in self._tools.values() if role in t.allowed_roles]
+        self._ensure_core_tools()
+        return list(self._role_index.get(role, ()))
     
     def get_openai_tools(self, role: Optional[str] = None) -> list[dict[str, Any]]:
-        """Get tools in OpenAI function calling format."""
-        tools = self.get_tools_for_role(role) if role else self.list_tools()
-        return [t.to_openai_schema() for t in tools]
+        """Get tools in OpenAI function calling format.
+        
+        The schema dicts are shared between calls; treat them as read-only.
+        """
+        key = role or None
+        schemas = self._role_schemas.get(key)
+        if schemas is None:
+            tools = self.get_tools_for_role(role) if role else self.list_tools()
+            schemas = [t.to_openai_schema() for t in tools]
+            self._role_schemas[key] = schemas
+        return list(schemas)
     
     def execute(self, tool_name: str, **kwargs: Any) -> Any:
         """Execute a tool by name."""
@@ -1,8 +1,12 @@
 """State tools - tools for reading and writing dynamic state extensions."""
 
 from __future__ import annotations
-from typing import TYPE_CHECKING, Any, Optional
+from bisect import bisect_right
+from functools import lru_cache
+from itertools import accumulate
+from typing import TYPE_CHECKING, Any, Optional, Sequence
 import fnmatch
+import re
 
 if TYPE_CHECKING:
     from src.models.world_state import WorldState
@@ -11,9 +15,59 @@ if TYPE_CHECKING:
 from src.models.state_change import StateChange, ChangeType
 
 
+@lru_cache(maxsize=256)
+def _compile_glob(pattern: str) -> re.Pattern[str]:
+    """Compile a query_state wildcard pattern (dots already mapped to '/')."""
+    return re.compile(fnmatch.translate(pattern))
+
+
+@lru_cache(maxsize=256)
+def _compile_glob_lines(pattern: str) -> Optional[re.Pattern[str]]:
+    """Compile a wildcard pattern to match whole lines of a newline-joined path list.
+    
+    Returns None for patterns that could match across a line break (character
+    classes can match '\n'); those are matched path by path instead.
+    """
+    translated = fnmatch.translate(pattern)
+    if "[" in pattern or "\n" in pattern or not (translated.startswith("(?s:") and translated.endswith(")\\Z")):
+        return None
+    # Without DOTALL, '.' and '.*' stop at the line break between paths
+    return re.compile(f"(?m)^(?:{translated[4:-3]})$")
+
+
+# Shared "issues" payload for results without validation issues
+_EMPTY_ISSUES: tuple[dict[str, str], ...] = ()
+
+
+def _issue_dicts(change: StateChange) -> Sequence[dict[str, str]]:
+    """Validation issues of a change in their tool-result form."""
+    if not change.validation_issues:
+        return _EMPTY_ISSUES
+    return [{"severity": i.severity, "code": i.code, "message": i.message} for i in change.validation_issues]
+
+
+def _paths_overlap(paths: list[str]) -> bool:
+    """Whether any path repeats or is a dotted prefix of another in the list."""
+    seen: set[str] = set()
+    prefixes: set[str] = set()
+    for path in paths:
+        if path in seen or path in prefixes:
+            return True
+        parts = path.split(".")
+        for end in range(1, len(parts)):
+            prefix = ".".join(parts[:end])
+            if prefix in seen:
+                return True
+            prefixes.add(prefix)
+        seen.add(path)
+    return False
+
+
 class StateToolHandlers:
     """Handlers for state manipulation tools."""
     
+    __slots__ = ("world_state", "validation", "auto_apply", "_pending_changes", "_paths_cache")
+    
     def __init__(
         self, 
         world_state: "WorldState", 
@@ -23,7 +77,10 @@ class StateToolHandlers:
         self.world_state = world_state
         self.validation = validation
         self.auto_apply = auto_apply  # If True, apply changes immediately after validation
-        self._pending_changes: list[StateChange] = []
+        self._pending_changes: dict[str, StateChange] = {}  # change ID -> change, in proposal order
+        # ((state_version, extensions id), paths, paths with "/" for dots,
+        # those joined by newlines (None if empty or a path contains one), line offsets)
+        self._paths_cache: Optional[tuple[tuple[int, int], list[str], list[str], Optional[str], list[int]]] = None
     
     def extend_state(
         self,
@@ -43,17 +100,75 @@ class StateToolHandlers:
                 proposed_by="marshal"
             )
         """
-        change = StateChange(
+        change = self._extension_change(path, value, reason, proposed_by)
+        
+        # Validate
+        is_valid = self.validation.validate(change, skip_semantic=skip_semantic)
+        return self._settle_extension(change, is_valid)
+    
+    def extend_state_many(
+        self,
+        items: list[dict[str, Any]],
+        proposed_by: str,
+        skip_semantic: bool = False,
+    ) -> list[dict[str, Any]]:
+        """Set several extension paths, validating them together.
+        
+        Each item has "path", "value" and "reason" keys, as for
+        extend_state(). When no two paths overlap, every change is validated
+        against the state from before the batch (their LLM checks run
+        concurrently), then the ones that pass are applied in order. If a
+        path repeats or nests inside another, each change is validated and
+        applied before the next, exactly like consecutive extend_state()
+        calls. Results follow input order; an item that cannot be built or
+        applied gets {"error": ...} in its slot without affecting the others.
+        """
+        results: list[dict[str, Any] | None] = [None] * len(items)
+        changes: list[tuple[int, StateChange]] = []
+        for i, item in enumerate(items):
+            try:
+                changes.append((i, self._extension_change(
+                    item.get("path"), item.get("value"), item.get("reason"), proposed_by
+                )))
+            except Exception as e:
+                results[i] = {"error": str(e)}
+        
+        def settle(change: StateChange, is_valid: bool) -> dict[str, Any]:
+            try:
+                return self._settle_extension(change, is_valid)
+            except Exception as e:
+                return {"error": str(e)}
+        
+        if _paths_overlap([change.path for _, change in changes]):
+            validate = self.validation.validate
+            for i, change in changes:
+                try:
+                    is_valid = validate(change, skip_semantic=skip_semantic)
+                except Exception as e:
+                    results[i] = {"error": str(e)}
+                    continue
+                results[i] = settle(change, is_valid)
+            return results
+        verdicts = self.validation.validate_batch(
+            [change for _, change in changes], skip_semantic=skip_semantic
+        )
+        for (i, change), is_valid in zip(changes, verdicts):
+            results[i] = settle(change, is_valid)
+        return results
+    
+    @staticmethod
+    def _extension_change(path: str, value: Any, reason: str, proposed_by: str) -> StateChange:
+        return StateChange(
             change_type=ChangeType.SET_EXTENSION,
             path=path,
             new_value=value,
             reason=reason,
             proposed_by=proposed_by,
         )
-        
-        # Validate
-        is_valid = self.validation.validate(change, skip_semantic=skip_semantic)
-        
+    
+    def _settle_extension(self, change: StateChange, is_valid: bool) -> dict[str, Any]:
+        """Apply or hold a validated extension change and build the tool result."""
+        path = change.path
         if is_valid and self.auto_apply:
             self.validation.apply(change)
             return {
@@ -64,7 +179,7 @@ class StateToolHandlers:
                 "cascaded": len(change.cascaded_changes),
             }
         elif is_valid:
-            self._pending_changes.append(change)
+            self._pending_changes[change.id] = change
             return {
                 "success": True,
                 "message": f"Change validated, pending application",
@@ -73,8 +188,7 @@ class StateToolHandlers:
             }
         else:
             # Return validation errors
-            issues = [{"severity": i.severity, "code": i.code, "message": i.message} 
-                     for i in change.validation_issues]
+            issues = _issue_dicts(change)
             return {
                 "success": False,
                 "message": f"Validation failed for '{path}'",
@@ -96,22 +210,26 @@ class StateToolHandlers:
         """
         results = {}
         
-        # Get all extension paths
-        all_paths = self.world_state.list_extensions()
-        
         # Handle wildcard patterns
         if "*" in path_pattern:
+            _, all_paths, slash_paths, joined, starts = self._extension_paths()
+            
             # Convert to fnmatch pattern (dots to / for matching)
             fnmatch_pattern = path_pattern.replace(".", "/")
+            lines_regex = _compile_glob_lines(fnmatch_pattern) if joined is not None else None
+            if lines_regex is not None:
+                # One C-level scan over all paths; map match offsets back to paths
+                matched = [all_paths[bisect_right(starts, m.start()) - 1] for m in lines_regex.finditer(joined)]
+            else:
+                match = _compile_glob(fnmatch_pattern).match
+                matched = [p for p, slash_path in zip(all_paths, slash_paths) if match(slash_path)]
             
-            for ext_path in all_paths:
-                fnmatch_path = ext_path.replace(".", "/")
-                if fnmatch.fnmatch(fnmatch_path, fnmatch_pattern):
-                    value = self.world_state.get_extension(ext_path)
-                    if not include_metadata and isinstance(value, dict):
-                        # Strip metadata
-                        value = {k: v for k, v in value.items() if not k.startswith("_")}
-                    results[ext_path] = value
+            for ext_path in matched:
+                value = self.world_state.get_extension(ext_path)
+                if not include_metadata and isinstance(value, dict):
+                    # Strip metadata
+                    value = {k: v for k, v in value.items() if not k.startswith("_")}
+                results[ext_path] = value
         else:
             # Direct path lookup
             value = self.world_state.get_extension(path_pattern)
@@ -127,6 +245,20 @@ class StateToolHandlers:
             "count": len(results),
         }
     
+    def _extension_paths(self) -> tuple[tuple[int, int], list[str], list[str], Optional[str], list[int]]:
+        """Extension paths in their query_state match forms, cached per state version."""
+        ws = self.world_state
+        key = (ws.state_version, id(ws.extensions))
+        cached = self._paths_cache
+        if cached is None or cached[0] != key:
+            paths = ws.list_extensions()
+            slash_paths = [p.replace(".", "/") for p in paths]
+            joined = "\n".join(slash_paths) if paths and not any("\n" in p for p in paths) else None
+            starts = list(accumulate((len(p) + 1 for p in slash_paths), initial=0))
+            cached = (key, paths, slash_paths, joined, starts)
+            self._paths_cache = cached
+        return cached
+    
     def delete_extension(
         self,
         path: str,
@@ -163,8 +295,7 @@ class StateToolHandlers:
                 "old_value": change.old_value,
             }
         else:
-            issues = [{"severity": i.severity, "code": i.code, "message": i.message} 
-                     for i in change.validation_issues]
+            issues = _issue_dicts(change)
             return {
                 "success": False,
                 "message": f"Delete failed for '{path}'",
@@ -215,8 +346,7 @@ class StateToolHandlers:
                 "rule_id": rule.id,
             }
         else:
-            issues = [{"severity": i.severity, "code": i.code, "message": i.message} 
-                     for i in change.validation_issues]
+            issues = _issue_dicts(change)
             return {
                 "success": False,
                 "message": "Rule validation failed",
@@ -248,124 +378,131 @@ class StateToolHandlers:
     
     def get_pending_changes(self) -> list[StateChange]:
         """Get changes that passed validation but haven't been applied."""
-        return self._pending_changes
+        return list(self._pending_changes.values())
     
     def apply_pending_change(self, change_id: str) -> bool:
         """Apply a specific pending change."""
-        for i, change in enumerate(self._pending_changes):
-            if change.id == change_id:
-                if self.validation.apply(change):
-                    self._pending_changes.pop(i)
-                    return True
+        change = self._pending_changes.get(change_id)
+        if change is not None and self.validation.apply(change):
+            del self._pending_changes[change_id]
+            return True
         return False
 
 
-def get_state_tool_schemas() -> list[dict]:
-    """Get OpenAI-format tool schemas for state tools."""
-    return [
-        {
-            "type": "function",
-            "function": {
-                "name": "extend_state",
-                "description": "Set or update a value in the dynamic state extensions. Use this to record new information about the world, relationships, conditions, or any other data the game should track. The path should use dot-notation (e.g., 'advisors.marshal.resentment.incident_name').",
-                "parameters": {
-                    "type": "object",
-                    "properties": {
-                        "path": {
-                            "type": "string",
-                            "description": "Dot-notation path for the state (e.g., 'advisors.marshal.resentment.clockmaker_incident'). Valid prefixes: advisors, factions, settlements, terrain, plots, relationships, conditions, history, rules, secrets, rumors",
-                        },
-                        "value": {
-                            "type": "object",
-                            "description": "The value to store. Should be a dict with specific, meaningful data. Include 'severity', 'reason', 'effects', etc. as appropriate.",
-                        },
-                        "reason": {
-                            "type": "string",
-                            "description": "Detailed explanation of why this state is being set. Must be specific, not generic.",
-                        },
+# OpenAI-format schemas for the state tools, built once and shared by every
+# caller; treat them as read-only
+_STATE_TOOL_SCHEMAS: list[dict] = [
+    {
+        "type": "function",
+        "function": {
+            "name": "extend_state",
+            "description": "Set or update a value in the dynamic state extensions. Use this to record new information about the world, relationships, conditions, or any other data the game should track. The path should use dot-notation (e.g., 'advisors.marshal.resentment.incident_name').",
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "path": {
+                        "type": "string",
+                        "description": "Dot-notation path for the state (e.g., 'advisors.marshal.resentment.clockmaker_incident'). Valid prefixes: advisors, factions, settlements, terrain, plots, relationships, conditions, history, rules, secrets, rumors",
+                    },
+                    "value": {
+                        "type": "object",
+                        "description": "The value to store. Should be a dict with specific, meaningful data. Include 'severity', 'reason', 'effects', etc. as appropriate.",
+                    },
+                    "reason": {
+                        "type": "string",
+                        "description": "Detailed explanation of why this state is being set. Must be specific, not generic.",
                     },
-                    "required": ["path", "value", "reason"],
                 },
+                "required": ["path", "value", "reason"],
             },
         },
-        {
-            "type": "function",
-            "function": {
-                "name": "query_state",
-                "description": "Query the dynamic state extensions. Supports wildcards with * (e.g., 'advisors.*.resentment.*' to find all advisor resentments).",
-                "parameters": {
-                    "type": "object",
-                    "properties": {
-                        "path_pattern": {
-                            "type": "string",
-                            "description": "Path or pattern to query (supports * wildcards)",
-                        },
+    },
+    {
+        "type": "function",
+        "function": {
+            "name": "query_state",
+            "description": "Query the dynamic state extensions. Supports wildcards with * (e.g., 'advisors.*.resentment.*' to find all advisor resentments).",
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "path_pattern": {
+                        "type": "string",
+                        "description": "Path or pattern to query (supports * wildcards)",
                     },
-                    "required": ["path_pattern"],
                 },
+                "required": ["path_pattern"],
             },
         },
-        {
-            "type": "function",
-            "function": {
-                "name": "delete_extension",
-                "description": "Delete a value from the dynamic state extensions.",
-                "parameters": {
-                    "type": "object",
-                    "properties": {
-                        "path": {
-                            "type": "string",
-                            "description": "Dot-notation path to delete",
-                        },
-                        "reason": {
-                            "type": "string",
-                            "description": "Why this state is being deleted",
-                        },
+    },
+    {
+        "type": "function",
+        "function": {
+            "name": "delete_extension",
+            "description": "Delete a value from the dynamic state extensions.",
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "path": {
+                        "type": "string",
+                        "description": "Dot-notation path to delete",
+                    },
+                    "reason": {
+                        "type": "string",
+                        "description": "Why this state is being deleted",
                     },
-                    "required": ["path", "reason"],
                 },
+                "required": ["path", "reason"],
             },
         },
-        {
-            "type": "function",
-            "function": {
-                "name": "add_rule",
-                "description": "Create a new dynamic game rule. Rules define when->then relationships that affect gameplay.",
-                "parameters": {
-                    "type": "object",
-                    "properties": {
-                        "trigger": {
-                            "type": "string",
-                            "description": "When this rule activates (natural language condition, e.g., 'When advisor resentment severity reaches high')",
-                        },
-                        "effect": {
-                            "type": "string",
-                            "description": "What happens when triggered (natural language effect, e.g., 'Advisor may refuse direct orders')",
-                        },
-                        "reason": {
-                            "type": "string",
-                            "description": "Why this rule should exist in the game",
-                        },
+    },
+    {
+        "type": "function",
+        "function": {
+            "name": "add_rule",
+            "description": "Create a new dynamic game rule. Rules define when->then relationships that affect gameplay.",
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "trigger": {
+                        "type": "string",
+                        "description": "When this rule activates (natural language condition, e.g., 'When advisor resentment severity reaches high')",
+                    },
+                    "effect": {
+                        "type": "string",
+                        "description": "What happens when triggered (natural language effect, e.g., 'Advisor may refuse direct orders')",
+                    },
+                    "reason": {
+                        "type": "string",
+                        "description": "Why this rule should exist in the game",
                     },
-                    "required": ["trigger", "effect", "reason"],
                 },
+                "required": ["trigger", "effect", "reason"],
             },
         },
-        {
-            "type": "function",
-            "function": {
-                "name": "list_rules",
-                "description": "List all dynamic game rules that have been created.",
-                "parameters": {
-                    "type": "object",
-                    "properties": {
-                        "active_only": {
-                            "type": "boolean",
-                            "description": "Only show active rules (default: true)",
-                        },
+    },
+    {
+        "type": "function",
+        "function": {
+            "name": "list_rules",
+            "description": "List all dynamic game rules that have been created.",
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "active_only": {
+                        "type": "boolean",
+                        "description": "Only show active rules (default: true)",
                     },
-                    "required": [],
                 },
+                "required": [],
             },
         },
-    ]
+    },
+]
+
+
+def get_state_tool_schemas() -> list[dict]:
+    """Get OpenAI-format tool schemas for state tools.
+    
+    Returns a new list, but the schema dicts in it are shared.
+    """
+    return list(_STATE_TOOL_SCHEMAS)
@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 import asyncio
+import queue
+import traceback
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, TYPE_CHECKING
 
 from textual.app import App, ComposeResult
@@ -9,6 +12,8 @@ from textual.containers import Horizontal, Container
 from textual.widgets import Input, Header, Footer, Static
 from textual.binding import Binding
 
+from rich.text import Text
+
 from src.tui.panels import OrderPanel, NarrativeLog, StatusBar
 from src.models.orders import Order, OrderTracker
 
@@ -19,6 +24,40 @@ if TYPE_CHECKING:
     from src.narrator import AutonomousNarrator
 
 
+# Threads for blocking narrator calls; enough for process_async to run a
+# multi-order fan-out (narrator._MAX_CONCURRENT_ORDERS) without queueing
+_NARRATOR_WORKERS = 4
+
+# Commands that may wait behind the one being processed
+_COMMAND_QUEUE_SIZE = 8
+
+_HELP_TEXT = """[bold]How to play:[/bold]
+Just type naturally. The narrator understands intent.
+
+[bold cyan]Giving Orders:[/bold cyan]
+  "Tell Elena to recruit 100 men"
+  "I want the iron situation handled"
+  "Deploy troops to the pass"
+
+[bold cyan]Asking Questions:[/bold cyan]
+  "Ask Viktor about the food situation"
+  "What does Elena think of the major?"
+  
+[bold cyan]Summoning Advisors:[/bold cyan]
+  "Bring Elena here"
+  "I want to speak with the marshal"
+  (then just chat, say 'leave' when done)
+
+[bold cyan]System Commands:[/bold cyan]
+  advance <days> - Advance time (orders progress/complete)
+  status - Show world state
+  help - This help
+  quit - Exit game"""
+
+# _HELP_TEXT as NarrativeLog.add_system would render it
+_HELP_MESSAGE = f"[dim]{_HELP_TEXT}[/dim]\n"
+
+
 class DelegativeApp(App):
     """The main TUI application - unified flow through narrator."""
     
@@ -54,9 +93,18 @@ class DelegativeApp(App):
     }
     
     NarrativeLog {
+        height: 1fr;
         scrollbar-size: 1 1;
     }
     
+    #narrative-preview {
+        height: auto;
+        max-height: 50%;
+        padding: 0 1;
+        color: $text-muted;
+        display: none;
+    }
+    
     OrderPanel {
         padding: 1;
     }
@@ -74,6 +122,18 @@ class DelegativeApp(App):
     
     TITLE = "Delegative Strategy"
     
+    # Seconds a narrator call may take before the thinking indicator is shown
+    THINKING_DELAY = 0.15
+    
+    # Seconds between moving streamed narrator text into the preview
+    STREAM_FLUSH_INTERVAL = 0.05
+    
+    # Widget references, resolved once in on_mount
+    _narrative: Optional[NarrativeLog] = None
+    _orders: Optional[OrderPanel] = None
+    _input: Optional[Input] = None
+    _preview: Optional[Static] = None
+    
     def __init__(
         self,
         world_state: "WorldState" = None,
@@ -93,6 +153,21 @@ class DelegativeApp(App):
         
         # Processing state
         self._processing = False
+        
+        # Submitted commands, drained by _command_worker (created on mount)
+        self._command_queue: Optional[asyncio.Queue[str]] = None
+        self._command_task: Optional[asyncio.Task] = None
+        
+        # Streamed narrator text: chunks put by worker threads, drained on the
+        # UI thread into the preview (see _flush_stream)
+        self._stream_chunks: queue.Queue[str] = queue.Queue()
+        self._stream_text: list[str] = []
+        
+        # Intro markup shown on mount, see _intro_messages
+        self._intro_markup: Optional[list[str]] = None
+        
+        # Dedicated pool for narrator calls instead of the loop's default executor
+        self._executor = ThreadPoolExecutor(max_workers=_NARRATOR_WORKERS, thread_name_prefix="narrator")
     
     def compose(self) -> ComposeResult:
         """Create the UI layout."""
@@ -102,6 +177,7 @@ class DelegativeApp(App):
         with Horizontal(id="main-container"):
             with Container(id="narrative-container"):
                 yield NarrativeLog(id="narrative")
+                yield Static(id="narrative-preview")
             
             with Container(id="orders-container"):
                 yield Static("[bold]ORDERS[/bold]", id="orders-title")
@@ -115,79 +191,112 @@ class DelegativeApp(App):
     
     def on_mount(self) -> None:
         """Called when app starts."""
+        self._narrative = self.query_one("#narrative", NarrativeLog)
+        self._orders = self.query_one("#orders", OrderPanel)
+        self._input = self.query_one("#command-input", Input)
+        self._preview = self.query_one("#narrative-preview", Static)
+        
+        # Stream narrative text from the narrator's worker threads, unless
+        # the caller already gave it a callback
+        if self.narrator and self.narrator.stream_callback is None:
+            self.narrator.stream_callback = self._stream_chunks.put
+        
         # Set border titles
         self.query_one("#narrative-container").border_title = self.world_state.scenario_title if self.world_state else "Narrative"
         self.query_one("#orders-container").border_title = "Orders"
         
+        # Commands typed while another is running wait here instead of being dropped
+        self._command_queue = asyncio.Queue(maxsize=_COMMAND_QUEUE_SIZE)
+        self._command_task = asyncio.create_task(self._command_worker())
+        
         # Focus input
-        self.query_one("#command-input").focus()
+        self._input.focus()
         
         # Show initial narrative
-        narrative = self.query_one("#narrative", NarrativeLog)
+        narrative = self._narrative
         
         if self.world_state:
             # Show scenario description
             if self.world_state.scenario_description:
                 narrative.add_narrator(self.world_state.scenario_description)
             
-            # Show starting tensions
-            if self.world_state.starting_tensions:
-                tensions = "\n".join(f"• {t}" for t in self.world_state.starting_tensions)
-                narrative.add_system(f"\n[bold yellow]Starting Tensions:[/bold yellow]\n{tensions}\n")
-            
-            # Show advisors
-            if self.advisors:
-                advisor_list = []
-                for key, adv in self.advisors.items():
-                    advisor_list.append(f"• [bold]{adv.name}[/bold], {adv.title}")
-                narrative.add_system(f"\n[bold cyan]Your Council:[/bold cyan]\n" + "\n".join(advisor_list) + "\n")
-                narrative.add_system("[dim]Just type naturally. Summon advisors by name, give orders, ask questions.[/dim]")
+            # Show starting tensions and advisors
+            for message in self._intro_messages():
+                narrative.add_system(message)
         else:
             narrative.add_system("No world loaded. Use 'new' to create a scenario.")
     
-    async def on_input_submitted(self, event: Input.Submitted) -> None:
-        """Handle command input."""
-        if self._processing:
-            return
-        
+    def _intro_messages(self) -> list[str]:
+        """System messages introducing the scenario, built once per app."""
+        if self._intro_markup is None:
+            messages = []
+            if self.world_state.starting_tensions:
+                tensions = "\n".join("• " + t for t in self.world_state.starting_tensions)
+                messages.append(f"\n[bold yellow]Starting Tensions:[/bold yellow]\n{tensions}\n")
+            if self.advisors:
+                council = "\n".join(f"• [bold]{adv.name}[/bold], {adv.title}" for adv in self.advisors.values())
+                messages.append(f"\n[bold cyan]Your Council:[/bold cyan]\n{council}\n")
+                messages.append("[dim]Just type naturally. Summon advisors by name, give orders, ask questions.[/dim]")
+            self._intro_markup = messages
+        return self._intro_markup
+    
+    def on_unmount(self) -> None:
+        """Stop the command worker and release the narrator thread pool."""
+        if self._command_task is not None:
+            self._command_task.cancel()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+    
+    def on_input_submitted(self, event: Input.Submitted) -> None:
+        """Handle command input by queueing it for the command worker."""
         command = event.value.strip()
         if not command:
             return
         
+        busy = self._processing or not self._command_queue.empty()
+        try:
+            self._command_queue.put_nowait(command)
+        except asyncio.QueueFull:
+            self._narrative.add_system("[yellow]Too many commands waiting; try again shortly.[/yellow]")
+            return
+        
         # Clear input
         event.input.value = ""
         
-        # Show player input
-        narrative = self.query_one("#narrative", NarrativeLog)
-        narrative.add_player(command)
-        
-        # Process command
-        await self._process_command(command)
+        if busy:
+            self._narrative.add_system(f"[dim]Queued: {command}[/dim]")
+    
+    async def _command_worker(self) -> None:
+        """Process queued commands one at a time, in submission order."""
+        while True:
+            command = await self._command_queue.get()
+            
+            # Show player input
+            self._narrative.add_player(command)
+            
+            try:
+                await self._process_command(command)
+            finally:
+                self._command_queue.task_done()
     
     async def _process_command(self, command: str) -> None:
-        """Process a command through the unified flow."""
+        """Process a command through the unified flow.
+        
+        The command arrives already stripped by on_input_submitted.
+        """
         self._processing = True
-        narrative = self.query_one("#narrative", NarrativeLog)
-        orders_panel = self.query_one("#orders", OrderPanel)
+        narrative = self._narrative
+        orders_panel = self._orders
         
-        cmd = command.lower().strip()
+        cmd = command.lower()
         
         try:
             # System commands
-            if cmd in ("quit", "exit"):
-                self.exit()
-                return
-            
-            if cmd == "help":
-                self._show_help()
+            handler = self._COMMAND_HANDLERS.get(cmd)
+            if handler is not None:
+                handler(self)
                 return
             
-            if cmd == "status":
-                if self.world_state:
-                    narrative.add_system(self.world_state.summary())
-                return
-            
-            if cmd.startswith("advance"):
+            if cmd == "advance" or cmd.startswith("advance "):
                 parts = cmd.split()
                 days = int(parts[1]) if len(parts) > 1 else 1
                 await self._advance_time(days)
@@ -198,28 +307,53 @@ class DelegativeApp(App):
         
         except Exception as e:
             narrative.add_system(f"[red]Error: {e}[/red]")
-            import traceback
-            traceback.print_exc()
+            # Route the traceback through Textual's log (visible with
+            # `textual console`) instead of writing to the terminal mid-render
+            self.log.error(traceback.format_exc())
         
         finally:
             self._processing = False
             orders_panel.refresh_display()
     
+    def _cmd_quit(self) -> None:
+        self.exit()
+    
+    def _cmd_help(self) -> None:
+        self._show_help()
+    
+    def _cmd_status(self) -> None:
+        if self.world_state:
+            self._narrative.add_system(self.world_state.summary())
+    
+    # Exact-match commands; "advance <days>" takes an argument and is parsed separately
+    _COMMAND_HANDLERS = {
+        "quit": _cmd_quit,
+        "exit": _cmd_quit,
+        "help": _cmd_help,
+        "status": _cmd_status,
+    }
+    
     async def _process_through_narrator(self, command: str) -> None:
         """Process any command through the narrator's unified flow."""
-        narrative = self.query_one("#narrative", NarrativeLog)
-        orders_panel = self.query_one("#orders", OrderPanel)
+        narrative = self._narrative
+        orders_panel = self._orders
         
         if not self.narrator:
             narrative.add_narrator("I cannot respond without being properly initialized.")
             return
         
-        # Show thinking indicator
-        narrative.add_system("[dim]...[/dim]")
+        # Show thinking indicator, unless the narrator answers before it is due
+        thinking = self.set_timer(self.THINKING_DELAY, lambda: narrative.add_system("[dim]...[/dim]"))
         
-        # Run narrator in thread to avoid blocking
-        loop = asyncio.get_event_loop()
-        result = await loop.run_in_executor(None, self.narrator.process, command)
+        # Narrator runs its blocking LLM calls in worker threads; any text it
+        # streams meanwhile is shown in the preview until the final panel
+        streaming = self.set_interval(self.STREAM_FLUSH_INTERVAL, self._flush_stream)
+        try:
+            result = await self.narrator.process_async(command, self._executor)
+        finally:
+            thinking.stop()
+            streaming.stop()
+            self._clear_stream()
         
         response = result.get("response", "")
         orders_created = result.get("orders_created", [])
@@ -249,10 +383,36 @@ class DelegativeApp(App):
         if needs_confirmation:
             narrative.add_system("[dim]Awaiting your response...[/dim]")
     
+    def _flush_stream(self) -> None:
+        """Move streamed chunks into the preview, one update per interval."""
+        chunks = self._stream_text
+        received = False
+        while True:
+            try:
+                chunks.append(self._stream_chunks.get_nowait())
+            except queue.Empty:
+                break
+            received = True
+        if received:
+            # Plain Text: a partial response may contain unbalanced markup
+            self._preview.update(Text("".join(chunks)))
+            self._preview.display = True
+    
+    def _clear_stream(self) -> None:
+        """Hide the preview and discard streamed text once the response is written."""
+        while True:
+            try:
+                self._stream_chunks.get_nowait()
+            except queue.Empty:
+                break
+        self._stream_text.clear()
+        self._preview.display = False
+        self._preview.update("")
+    
     async def _advance_time(self, days: int) -> None:
         """Advance time and process order progress."""
-        narrative = self.query_one("#narrative", NarrativeLog)
-        orders_panel = self.query_one("#orders", OrderPanel)
+        narrative = self._narrative
+        orders_panel = self._orders
         
         if not self.world_state:
             return
@@ -260,24 +420,26 @@ class DelegativeApp(App):
         # Advance world time
         self.world_state.current_tick += days
         self.world_state.current_date = f"Day {self.world_state.current_tick + 1}"
+        self.world_state.touch()
         
         narrative.add_system(f"\n[bold]Time advances... {days} day(s) pass.[/bold]\n")
         
         # Advance orders and get completions
         completed_orders = self.order_tracker.advance_all(days)
         
-        # Report completions - use narrator to generate outcomes (which applies effects first!)
-        for order in completed_orders:
-            if not order.outcome and self.narrator:
-                # Generate outcome via narrator (applies effects + generates narrative)
-                loop = asyncio.get_event_loop()
+        # Generate outcomes via narrator (applies effects + generates narrative),
+        # with the narrative calls for all completions in flight together
+        if self.narrator:
+            pending = [order for order in completed_orders if not order.outcome]
+            for order in pending:
                 narrative.add_system(f"[dim]Completing: {order.description}...[/dim]")
-                outcome = await loop.run_in_executor(
-                    None, self.narrator.complete_order, order
-                )
-            elif not order.outcome:
+            if pending:
+                await self.narrator.complete_orders_async(pending, self._executor)
+        
+        # Report completions
+        for order in completed_orders:
+            if not order.outcome:
                 order.complete(f"The task '{order.description}' has been completed.")
-            
             narrative.add_order_complete(order.description, order.outcome)
         
         # Show updated status
@@ -288,32 +450,8 @@ class DelegativeApp(App):
     
     def _show_help(self) -> None:
         """Show help information."""
-        narrative = self.query_one("#narrative", NarrativeLog)
-        
-        help_text = """[bold]How to play:[/bold]
-Just type naturally. The narrator understands intent.
-
-[bold cyan]Giving Orders:[/bold cyan]
-  "Tell Elena to recruit 100 men"
-  "I want the iron situation handled"
-  "Deploy troops to the pass"
-
-[bold cyan]Asking Questions:[/bold cyan]
-  "Ask Viktor about the food situation"
-  "What does Elena think of the major?"
-  
-[bold cyan]Summoning Advisors:[/bold cyan]
-  "Bring Elena here"
-  "I want to speak with the marshal"
-  (then just chat, say 'leave' when done)
-
-[bold cyan]System Commands:[/bold cyan]
-  advance <days> - Advance time (orders progress/complete)
-  status - Show world state
-  help - This help
-  quit - Exit game"""
-        
-        narrative.add_system(help_text)
+        # Same output as add_system, with the markup wrapped at import time
+        self._narrative.write(_HELP_MESSAGE)
     
     def action_quit(self) -> None:
         """Quit the application."""
@@ -321,9 +459,8 @@ Just type naturally. The narrator understands intent.
     
     def action_save(self) -> None:
         """Save the game."""
-        narrative = self.query_one("#narrative", NarrativeLog)
-        narrative.add_system("[yellow]Save not implemented in TUI yet[/yellow]")
+        self._narrative.add_system("[yellow]Save not implemented in TUI yet[/yellow]")
     
     def action_focus_input(self) -> None:
         """Focus the input field."""
-        self.query_one("#command-input").focus()
+        self._input.focus()
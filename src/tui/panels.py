@@ -1,7 +1,7 @@
 """TUI panel components - Order tracker and Narrative display."""
 
 from __future__ import annotations
-from typing import TYPE_CHECKING
+from typing import Optional, TYPE_CHECKING
 
 from textual.app import ComposeResult
 from textual.widget import Widget
@@ -15,6 +15,10 @@ if TYPE_CHECKING:
     from src.models.orders import Order, OrderTracker
 
 
+# (minimum progress percent, color) pairs for active orders, highest first
+_STATUS_COLORS = ((80, "green"), (40, "yellow"), (0, "blue"))
+
+
 class OrderPanel(Static):
     """Right panel showing active orders with progress bars."""
     
@@ -26,9 +30,15 @@ class OrderPanel(Static):
     }
     """
     
+    # Refresh requests within this window are coalesced into one render
+    REFRESH_DELAY = 0.05
+    
     def __init__(self, tracker: "OrderTracker" = None, **kwargs):
         super().__init__(**kwargs)
         self.tracker = tracker
+        self._refresh_pending = False
+        self._row_cache: dict[tuple, list[str]] = {}
+        self._last_text: Optional[str] = None
     
     def set_tracker(self, tracker: "OrderTracker") -> None:
         """Set or update the order tracker."""
@@ -36,46 +46,60 @@ class OrderPanel(Static):
         self.refresh_display()
     
     def refresh_display(self) -> None:
-        """Refresh the orders display."""
+        """Schedule a refresh of the orders display.
+        
+        Calls made in quick succession (e.g. several orders completing in one
+        time advance) result in a single render shortly afterwards.
+        """
+        if not self.is_mounted:
+            self._do_refresh_display()
+            return
+        if not self._refresh_pending:
+            self._refresh_pending = True
+            self.set_timer(self.REFRESH_DELAY, self._flush_refresh)
+    
+    def _flush_refresh(self) -> None:
+        self._refresh_pending = False
+        self._do_refresh_display()
+    
+    def _do_refresh_display(self) -> None:
+        """Render the orders display now."""
         if not self.tracker:
-            self.update("[dim]No orders[/dim]")
+            self._show("[dim]No orders[/dim]")
             return
         
         lines = []
+        # Rendered rows are reused while their inputs are unchanged; rows for
+        # orders no longer shown are dropped by rebuilding the cache each time
+        old_cache = self._row_cache
+        cache: dict[tuple, list[str]] = {}
         
         # Show active orders
-        if self.tracker.active:
-            for order in self.tracker.active:
-                # Progress bar
-                bar = order.progress_bar(10)
-                pct = order.progress_percent
-                days = order.days_remaining
-                
-                # Status indicator
-                if pct >= 80:
-                    status_color = "green"
-                elif pct >= 40:
-                    status_color = "yellow"
-                else:
-                    status_color = "blue"
-                
-                lines.append(f"[{status_color}]{bar}[/{status_color}] {pct}%")
-                lines.append(f"[bold]{order.description[:25]}...[/bold]" if len(order.description) > 25 else f"[bold]{order.description}[/bold]")
-                
-                advisor_name = order.advisor_name or order.assigned_to
-                lines.append(f"[dim]{advisor_name} • {days}d left[/dim]")
-                lines.append("")
+        for order in self.tracker.active:
+            key = (order.id, order.progress_days, order.duration_days, order.description,
+                   order.advisor_name, order.assigned_to)
+            rows = old_cache.get(key)
+            if rows is None:
+                rows = self._render_active(order)
+            cache[key] = rows
+            lines.extend(rows)
         
-        # Show recently completed (last 3)
-        completed = [o for o in self.tracker.completed if o.outcome][-3:]
+        # Show recently completed (last 3), scanning back from the newest
+        completed = []
+        for order in reversed(self.tracker.completed):
+            if order.outcome:
+                completed.append(order)
+                if len(completed) == 3:
+                    break
         if completed:
-            lines.append("[bold green]─ COMPLETED ─[/bold green]")
-            for order in reversed(completed):
-                lines.append(f"[green]✓[/green] {order.description[:25]}...")
-                if order.outcome:
-                    outcome_short = order.outcome[:30] + "..." if len(order.outcome) > 30 else order.outcome
-                    lines.append(f"  [dim]{outcome_short}[/dim]")
-                lines.append("")
+            key = tuple((o.id, o.description, o.outcome) for o in completed)
+            rows = old_cache.get(key)
+            if rows is None:
+                rows = self._render_completed(completed)
+            cache[key] = rows
+            lines.extend(rows)
+        
+        self._row_cache = cache
         
         if not lines:
             lines.append("[dim]No active orders[/dim]")
@@ -83,7 +107,43 @@ class OrderPanel(Static):
             lines.append("[dim]Orders appear here[/dim]")
             lines.append("[dim]when advisors act[/dim]")
         
-        self.update("\n".join(lines))
+        self._show("\n".join(lines))
+    
+    def _show(self, text: str) -> None:
+        """Update the widget, skipping the repaint if the markup is unchanged."""
+        if text != self._last_text:
+            self._last_text = text
+            self.update(text)
+    
+    @staticmethod
+    def _render_active(order: "Order") -> list[str]:
+        """Markup lines for one active order."""
+        # Progress bar
+        bar = order.progress_bar(10)
+        pct = order.progress_percent
+        days = order.days_remaining
+        
+        # Status indicator
+        status_color = next(color for threshold, color in _STATUS_COLORS if pct >= threshold)
+        
+        advisor_name = order.advisor_name or order.assigned_to
+        return [
+            f"[{status_color}]{bar}[/{status_color}] {pct}%",
+            f"[bold]{order.short_description}[/bold]",
+            f"[dim]{advisor_name} • {days}d left[/dim]",
+            "",
+        ]
+    
+    @staticmethod
+    def _render_completed(completed: list["Order"]) -> list[str]:
+        """Markup lines for the recently completed orders, given newest first."""
+        lines = ["[bold green]─ COMPLETED ─[/bold green]"]
+        for order in completed:
+            lines.append(f"[green]✓[/green] {order.short_description}")
+            if order.outcome:
+                lines.append(f"  [dim]{order.short_outcome}[/dim]")
+            lines.append("")
+        return lines
 
 
 class NarrativeLog(RichLog):
@@ -98,21 +158,27 @@ class NarrativeLog(RichLog):
     }
     """
     
+    # Panel framing per message kind, shared by every write
+    _NARRATOR_PANEL = {"title": "Narrator", "border_style": "dim", "padding": (0, 1)}
+    _ADVISOR_PANEL = {"border_style": "cyan", "padding": (0, 1)}
+    _ORDER_COMPLETE_PANEL = {"title": "Order Complete", "border_style": "green", "padding": (0, 1)}
+    
+    # Lines of history kept; older lines are dropped so long sessions stay responsive
+    MAX_LINES = 2000
+    
     def __init__(self, **kwargs):
+        kwargs.setdefault("max_lines", self.MAX_LINES)
         super().__init__(highlight=True, markup=True, wrap=True, **kwargs)
     
     def add_narrator(self, text: str) -> None:
         """Add narrator text."""
-        self.write(Panel(text, title="Narrator", border_style="dim", padding=(0, 1)))
+        self.write(Panel(text, **self._NARRATOR_PANEL))
     
     def add_advisor(self, name: str, text: str, actions: list[str] = None) -> None:
         """Add advisor response."""
-        content = text
         if actions:
-            content += "\n\n[dim]Actions:[/dim]"
-            for action in actions:
-                content += f"\n  • {action}"
-        self.write(Panel(content, title=name, border_style="cyan", padding=(0, 1)))
+            text = "".join([text, "\n\n[dim]Actions:[/dim]", *(f"\n  • {action}" for action in actions)])
+        self.write(Panel(text, title=name, **self._ADVISOR_PANEL))
     
     def add_player(self, text: str) -> None:
         """Add player input for display."""
@@ -128,12 +194,22 @@ class NarrativeLog(RichLog):
     
     def add_order_complete(self, description: str, outcome: str) -> None:
         """Add order completion notification."""
-        self.write(Panel(
-            f"[bold]{description}[/bold]\n\n{outcome}",
-            title="Order Complete",
-            border_style="green",
-            padding=(0, 1),
-        ))
+        self.write(Panel(f"[bold]{description}[/bold]\n\n{outcome}", **self._ORDER_COMPLETE_PANEL))
+
+
+# Status bar resources, in display order
+_RESOURCE_ICONS = {"treasury": "💰", "food": "🍞", "labor": "⚒️"}
+
+# (exclusive lower bound, color) pairs, highest first; anything lower is red
+_COLOR_THRESHOLDS = ((50, "green"), (20, "yellow"))
+
+
+def _resource_color(value: int) -> str:
+    """Status bar color for a resource level."""
+    for threshold, color in _COLOR_THRESHOLDS:
+        if value > threshold:
+            return color
+    return "red"
 
 
 class StatusBar(Static):
@@ -152,6 +228,7 @@ class StatusBar(Static):
         super().__init__("Day 1", **kwargs)
         self._date = "Day 1"
         self._resources = {}
+        self._last_text = "Day 1"
     
     def update_state(self, date: str, resources: dict) -> None:
         """Update the status bar with current state."""
@@ -164,15 +241,15 @@ class StatusBar(Static):
         parts = [f"[bold]{self._date}[/bold]"]
         
         # Show key resources
-        if self._resources:
-            res_parts = []
-            for key in ["treasury", "food", "labor"]:
-                if key in self._resources:
-                    val = self._resources[key]
-                    color = "green" if val > 50 else "yellow" if val > 20 else "red"
-                    icon = {"treasury": "💰", "food": "🍞", "labor": "⚒️"}.get(key, "")
-                    res_parts.append(f"{icon}[{color}]{val}[/{color}]")
-            if res_parts:
-                parts.append(" │ ".join(res_parts))
+        resources = self._resources
+        if resources:
+            for key, icon in _RESOURCE_ICONS.items():
+                if key in resources:
+                    val = resources[key]
+                    color = _resource_color(val)
+                    parts.append(f"{icon}[{color}]{val}[/{color}]")
         
-        self.update(" │ ".join(parts))
+        text = " │ ".join(parts)
+        if text != self._last_text:
+            self._last_text = text
+            self.update(text)